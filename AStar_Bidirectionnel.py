@@ -0,0 +1,124 @@
+import heapq
+import time
+import random
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+# Importer la génération de labyrinthe et les heuristiques existantes
+from PrimLabytinthe import PrimLabyrinthe
+from AStar_Manhattan import manhattan, astar_manhattan
+
+Coord = Tuple[int, int]
+
+
+def astar_bidirectionnel(laby: PrimLabyrinthe, start: Coord, goal: Coord,
+                         heuristique: Callable[[Coord, Coord], float] = manhattan
+                         ) -> Tuple[Optional[List[Coord]], int]:
+    """
+    A* bidirectionnel: une recherche avant (h = heuristique(n, goal)) et une
+    recherche arrière (h = heuristique(n, start)), en développant à chaque
+    tour le côté dont la file de priorité est la plus petite.
+
+    mu = coût du meilleur chemin déjà connu (jonction des deux recherches).
+    Condition d'arrêt: min f(avant) >= mu ou min f(arrière) >= mu. Avec une
+    heuristique admissible, tout chemin plus court que mu aurait un nœud
+    ouvert de f < mu dans chacune des deux files: le chemin est optimal.
+
+    Retourne (chemin | None, explores) comme astar_manhattan, explores
+    comptant les nœuds dépilés des deux côtés.
+    """
+    # Sécurité: si départ/arrivée sont des murs, on les ouvre
+    # (via modifier_cellule, pour que laby.version reflète la modification)
+    laby.modifier_cellule(start[0], start[1], 0)
+    laby.modifier_cellule(goal[0], goal[1], 0)
+
+    cellules = laby.grille_lecture()
+    decalages = laby.decalages
+    coord = laby.coord
+    source = laby.indice(*start)
+    cible = laby.indice(*goal)
+    if source == cible:
+        return [start], 1
+
+    n = len(cellules)
+    g_av, g_ar = array('i', [-1]) * n, array('i', [-1]) * n
+    par_av, par_ar = array('i', [-1]) * n, array('i', [-1]) * n
+    g_av[source] = 0
+    g_ar[cible] = 0
+    tas_av = [(heuristique(start, goal), 0, source)]
+    tas_ar = [(heuristique(goal, start), 0, cible)]
+
+    explores = 0
+    mu = float('inf')
+    jonction = -1
+
+    while tas_av and tas_ar:
+        if tas_av[0][0] >= mu or tas_ar[0][0] >= mu:
+            break
+        if len(tas_av) <= len(tas_ar):
+            tas, g, par, g_autre, vers = tas_av, g_av, par_av, g_ar, goal
+        else:
+            tas, g, par, g_autre, vers = tas_ar, g_ar, par_ar, g_av, start
+
+        _, gcur, cur = heapq.heappop(tas)
+        explores += 1
+        if gcur != g[cur]:
+            continue  # entrée obsolète
+
+        for d in decalages:
+            neigh = cur + d
+            if cellules[neigh] != 0:
+                continue
+            tentative_g = gcur + 1
+            if g[neigh] < 0 or tentative_g < g[neigh]:
+                g[neigh] = tentative_g
+                par[neigh] = cur
+                heapq.heappush(tas, (tentative_g + heuristique(coord(neigh), vers), tentative_g, neigh))
+            if g_autre[neigh] >= 0 and g[neigh] + g_autre[neigh] < mu:
+                mu = g[neigh] + g_autre[neigh]
+                jonction = neigh
+
+    if jonction < 0:
+        return None, explores
+
+    chemin = []
+    i = jonction
+    while i != source:
+        chemin.append(coord(i))
+        i = par_av[i]
+    chemin.append(start)
+    chemin.reverse()
+    i = jonction
+    while i != cible:
+        i = par_ar[i]
+        chemin.append(coord(i))
+    return chemin, explores
+
+
+if __name__ == "__main__":
+    # Paramètres du test
+    taille = 101  # idéalement impair
+    start: Coord = (1, 1)
+    goal: Coord = (taille - 2, taille - 2)
+
+    # Option de reproductibilité
+    random.seed(0)
+
+    laby = PrimLabyrinthe(taille)
+    _ = laby._generer()
+
+    print("\nComparaison: recherches unidirectionnelles vs bidirectionnelles")
+    print(f"Taille: {taille} | Départ: {start} | Arrivée: {goal}")
+    print()
+    header = f"{'Méthode':<20} {'Explorés':>10} {'Temps (ms)':>12} {'Longueur':>10}"
+    print(header)
+    print("-" * len(header))
+    for nom, recherche in [('BFS', lambda: laby.bfs(start, goal)),
+                           ('BFS bidirectionnel', lambda: laby.bfs_bidirectionnel(start, goal)),
+                           ('A* (Manhattan)', lambda: astar_manhattan(laby, start, goal)),
+                           ('A* bidirectionnel', lambda: astar_bidirectionnel(laby, start, goal))]:
+        t0 = time.perf_counter()
+        chemin, explores = recherche()
+        duree_ms = (time.perf_counter() - t0) * 1000.0
+        longueur = (len(chemin) - 1) if chemin else None
+        print(f"{nom:<20} {explores:>10} {duree_ms:>12.2f} {str(longueur):>10}")
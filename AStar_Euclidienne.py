@@ -1,11 +1,11 @@
-import heapq
 import math
 import time
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 # Importer la génération de labyrinthe et BFS existants
 from PrimLabytinthe import PrimLabyrinthe
+from AStar_Moteur import astar
 # Réutiliser l'implémentation A* Manhattan pour la comparaison
 from AStar_Manhattan import astar_manhattan
 
@@ -21,74 +21,24 @@ def euclidienne(a: Coord, b: Coord) -> float:
     return math.hypot(dx, dy)
 
 
-def reconstruire_chemin(parent: Dict[Coord, Coord], start: Coord, goal: Coord) -> List[Coord]:
-    cur = goal
-    chemin = [cur]
-    while cur != start:
-        cur = parent[cur]
-        chemin.append(cur)
-    chemin.reverse()
-    return chemin
-
-
-def astar_euclidienne(laby: PrimLabyrinthe, start: Coord, goal: Coord) -> Tuple[Optional[List[Coord]], int]:
+def astar_euclidienne(laby: PrimLabyrinthe, start: Coord, goal: Coord,
+                      stats=None) -> Tuple[Optional[List[Coord]], int]:
     """
     A* avec f(n) = g(n) + h(n) et heuristique Euclidienne.
 
     Paramètres:
-      - laby: instance de PrimLabyrinthe (utilise laby.grille et laby._voisin)
+      - laby: instance de PrimLabyrinthe
       - start, goal: coordonnées (x, y)
+      - stats: instrumentation.StatistiquesRecherche optionnel (compteurs)
 
     Retourne:
       - (chemin: List[(x,y)] | None, explores: int)
         chemin est None s'il n'existe pas.
         explores = nombre de nœuds dépilés (expandus) depuis la file de priorité.
+
+    Délègue au moteur commun AStar_Moteur.astar (tableaux plats, clés entières).
     """
-    # Sécurité: si départ/arrivée sont des murs, on les ouvre
-    if laby.grille[start[0]][start[1]] == 1:
-        laby.grille[start[0]][start[1]] = 0
-    if laby.grille[goal[0]][goal[1]] == 1:
-        laby.grille[goal[0]][goal[1]] = 0
-
-    open_heap: List[Tuple[float, int, int, Coord]] = []  # (f, g, tie, node)
-    gscore: Dict[Coord, int] = {start: 0}
-    parent: Dict[Coord, Coord] = {}
-
-    # Initialisation
-    tie = 0  # pour stabilité en cas d'égalité
-    f0 = euclidienne(start, goal)
-    heapq.heappush(open_heap, (f0, 0, tie, start))
-
-    explores = 0
-
-    while open_heap:
-        fcur, gcur, _, cur = heapq.heappop(open_heap)
-        explores += 1
-
-        # Si on a un meilleur g découvert après cet entry (obsolète), on ignore
-        if gcur != gscore.get(cur, float('inf')):
-            continue
-
-        if cur == goal:
-            chemin = reconstruire_chemin(parent, start, goal)
-            return chemin, explores
-
-        # Expansion
-        for nx, ny in laby._voisin(cur[0], cur[1]):
-            if laby.grille[nx][ny] != 0:
-                continue  # mur
-            tentative_g = gcur + 1
-            neigh = (nx, ny)
-
-            if tentative_g < gscore.get(neigh, float('inf')):
-                parent[neigh] = cur
-                gscore[neigh] = tentative_g
-                tie += 1
-                fval = tentative_g + euclidienne(neigh, goal)
-                heapq.heappush(open_heap, (fval, tentative_g, tie, neigh))
-
-    # Aucun chemin
-    return None, explores
+    return astar(laby, start, goal, 'euclidienne', stats)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
-import heapq
 import time
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 # Importer la génération de labyrinthe et BFS existants
 from PrimLabytinthe import PrimLabyrinthe
+from AStar_Moteur import astar
 
 Coord = Tuple[int, int]
 
@@ -16,74 +16,24 @@ def manhattan(a: Coord, b: Coord) -> int:
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
-def reconstruire_chemin(parent: Dict[Coord, Coord], start: Coord, goal: Coord) -> List[Coord]:
-    cur = goal
-    chemin = [cur]
-    while cur != start:
-        cur = parent[cur]
-        chemin.append(cur)
-    chemin.reverse()
-    return chemin
-
-
-def astar_manhattan(laby: PrimLabyrinthe, start: Coord, goal: Coord) -> Tuple[Optional[List[Coord]], int]:
+def astar_manhattan(laby: PrimLabyrinthe, start: Coord, goal: Coord,
+                    stats=None) -> Tuple[Optional[List[Coord]], int]:
     """
     A* avec f(n) = g(n) + h(n) et heuristique Manhattan.
 
     Paramètres:
-      - laby: instance de PrimLabyrinthe (utilise laby.grille et laby._voisin)
+      - laby: instance de PrimLabyrinthe
       - start, goal: coordonnées (x, y)
+      - stats: instrumentation.StatistiquesRecherche optionnel (compteurs)
 
     Retourne:
       - (chemin: List[(x,y)] | None, explores: int)
         chemin est None s'il n'existe pas.
         explores = nombre de nœuds dépilés (expandus) depuis la file de priorité.
-    """
-    # Sécurité: si départ/arrivée sont des murs, on les ouvre
-    if laby.grille[start[0]][start[1]] == 1:
-        laby.grille[start[0]][start[1]] = 0
-    if laby.grille[goal[0]][goal[1]] == 1:
-        laby.grille[goal[0]][goal[1]] = 0
-
-    open_heap: List[Tuple[int, int, int, Coord]] = []  # (f, g, tie, node)
-    gscore: Dict[Coord, int] = {start: 0}
-    parent: Dict[Coord, Coord] = {}
-
-    # Initialisation
-    tie = 0  # pour stabilité en cas d'égalité
-    f0 = manhattan(start, goal)
-    heapq.heappush(open_heap, (f0, 0, tie, start))
-
-    explores = 0
-
-    while open_heap:
-        fcur, gcur, _, cur = heapq.heappop(open_heap)
-        explores += 1
 
-        # Si on a un meilleur g découvert après cet entry (obsolète), on ignore
-        if gcur != gscore.get(cur, float('inf')):
-            continue
-
-        if cur == goal:
-            chemin = reconstruire_chemin(parent, start, goal)
-            return chemin, explores
-
-        # Expansion
-        for nx, ny in laby._voisin(cur[0], cur[1]):
-            if laby.grille[nx][ny] != 0:
-                continue  # mur
-            tentative_g = gcur + 1
-            neigh = (nx, ny)
-
-            if tentative_g < gscore.get(neigh, float('inf')):
-                parent[neigh] = cur
-                gscore[neigh] = tentative_g
-                tie += 1
-                fval = tentative_g + manhattan(neigh, goal)
-                heapq.heappush(open_heap, (fval, tentative_g, tie, neigh))
-
-    # Aucun chemin
-    return None, explores
+    Délègue au moteur commun AStar_Moteur.astar (tableaux plats, clés entières).
+    """
+    return astar(laby, start, goal, 'manhattan', stats)
 
 
 if __name__ == "__main__":
@@ -125,6 +75,16 @@ if __name__ == "__main__":
     print(f"{'BFS':<16} {explores_bfs:>10} {duree_bfs_ms:>12.2f} {str(len_bfs):>10}")
     print(f"{'A* (Manhattan)':<16} {explores_astar:>10} {duree_astar_ms:>12.2f} {str(len_astar):>10}")
 
+    # Écriture directe dans grille (hors modifier_cellule): un mur posé au
+    # milieu du chemin doit être vu par la recherche suivante
+    if chemin_astar and len(chemin_astar) > 2:
+        x, y = chemin_astar[len(chemin_astar) // 2]
+        laby.grille[x][y] = 1
+        chemin_mur, _ = astar_manhattan(laby, start, goal)
+        assert chemin_mur is None or (x, y) not in chemin_mur
+        assert (chemin_mur is None) == (laby.bfs(start, goal)[0] is None)
+        laby.grille[x][y] = 0
+
     # Visualisation optionnelle avec le chemin A*
     if chemin_astar:
         laby._afficher(title=f"Labyrinthe + Chemin A* Manhattan (L={len_astar})", chemin=chemin_astar)
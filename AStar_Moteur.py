@@ -0,0 +1,179 @@
+import heapq
+import math
+import time
+import random
+from array import array
+from typing import Callable, List, Optional, Tuple, Union
+
+from PrimLabytinthe import PrimLabyrinthe
+
+Coord = Tuple[int, int]
+
+# Les heuristiques sont manipulées en virgule fixe: h_entier = floor(h * ECHELLE).
+# L'arrondi par défaut garde l'heuristique admissible et permet de ranger
+# f, g et l'indice de la case dans une seule clé entière pour le tas.
+ECHELLE = 1 << 10
+
+
+def _preparer_manhattan(laby: PrimLabyrinthe, goal: Coord) -> Callable[[int], int]:
+    """h(i) = |x - gx| + |y - gy|, via deux tables précalculées (lignes/colonnes)."""
+    W = laby.largeur
+    gx, gy = goal[0] + 1, goal[1] + 1   # coordonnées dans le tampon avec bordure
+    hx = [abs(x - gx) * ECHELLE for x in range(W)]
+    hy = [abs(y - gy) * ECHELLE for y in range(W)]
+
+    def h(i: int) -> int:
+        x, y = divmod(i, W)
+        return hx[x] + hy[y]
+    return h
+
+
+def _preparer_euclidienne(laby: PrimLabyrinthe, goal: Coord) -> Callable[[int], int]:
+    """h(i) = floor(sqrt(dx² + dy²) * ECHELLE), carrés précalculés par ligne/colonne."""
+    W = laby.largeur
+    gx, gy = goal[0] + 1, goal[1] + 1
+    carre = ECHELLE * ECHELLE
+    hx = [(x - gx) * (x - gx) * carre for x in range(W)]
+    hy = [(y - gy) * (y - gy) * carre for y in range(W)]
+    isqrt = math.isqrt
+
+    def h(i: int) -> int:
+        x, y = divmod(i, W)
+        return isqrt(hx[x] + hy[y])
+    return h
+
+
+def _preparer_nulle(laby: PrimLabyrinthe, goal: Coord) -> Callable[[int], int]:
+    """h = 0: A* se comporte alors comme Dijkstra."""
+    return lambda i: 0
+
+
+# Heuristiques connues par leur nom: nom -> préparation (laby, goal) -> h(indice plat)
+HEURISTIQUES = {
+    'manhattan': _preparer_manhattan,
+    'euclidienne': _preparer_euclidienne,
+    'nulle': _preparer_nulle,
+}
+
+
+def preparer_heuristique(laby: PrimLabyrinthe, goal: Coord,
+                         heuristique: Union[str, Callable]) -> Callable[[int], int]:
+    """
+    Construit la fonction h(indice plat) -> entier (virgule fixe) pour un but.
+
+    heuristique peut être:
+      - un nom de HEURISTIQUES ('manhattan', 'euclidienne', 'nulle')
+      - un objet ayant une méthode preparer(laby, goal) renvoyant déjà h(i)
+      - une fonction h(case, goal) -> float sur les coordonnées, comme
+        AStar_Manhattan.manhattan (convertie en virgule fixe)
+    """
+    if isinstance(heuristique, str):
+        if heuristique not in HEURISTIQUES:
+            raise ValueError(f"Heuristique inconnue: {heuristique!r} "
+                             f"(attendu: {', '.join(HEURISTIQUES)})")
+        return HEURISTIQUES[heuristique](laby, goal)
+    if hasattr(heuristique, 'preparer'):
+        return heuristique.preparer(laby, goal)
+    coord = laby.coord
+    return lambda i: int(heuristique(coord(i), goal) * ECHELLE)
+
+
+def astar(laby: PrimLabyrinthe, start: Coord, goal: Coord,
+          heuristique: Union[str, Callable] = 'manhattan',
+          stats=None) -> Tuple[Optional[List[Coord]], int]:
+    """
+    Moteur A* unique (f = g + h) sur le tampon plat du labyrinthe.
+
+    - g et parents dans des tableaux d'entiers indexés par l'indice plat
+      de la case (-1 = jamais atteinte), sans dictionnaire;
+    - le tas ne contient que des entiers: cle = ((f << bits_g) | g) << bits_i | i,
+      donc tri par f, puis par g croissant, puis par indice;
+    - heuristique précalculée par but (voir preparer_heuristique).
+
+    Retourne (chemin | None, explores), explores = nombre de nœuds dépilés,
+    comme astar_manhattan / astar_euclidienne.
+
+    stats: instrumentation.StatistiquesRecherche optionnel; la recherche
+    passe alors par une copie instrumentée de cette boucle, qui reste
+    sans aucun test supplémentaire quand stats est None.
+    """
+    if stats is not None:
+        from instrumentation import astar_instrumente
+        return astar_instrumente(laby, start, goal, heuristique, stats)
+
+    # Sécurité: si départ/arrivée sont des murs, on les ouvre
+    # (via modifier_cellule, pour que laby.version reflète la modification)
+    laby.modifier_cellule(start[0], start[1], 0)
+    laby.modifier_cellule(goal[0], goal[1], 0)
+
+    cellules = laby.grille_lecture()
+    d0, d1, d2, d3 = laby.decalages
+    h = preparer_heuristique(laby, goal, heuristique)
+    source = laby.indice(*start)
+    cible = laby.indice(*goal)
+
+    n = len(cellules)
+    bits_i = n.bit_length()
+    bits_g = n.bit_length()
+    masque_i = (1 << bits_i) - 1
+    masque_g = (1 << bits_g) - 1
+    gscore = array('i', [-1]) * n
+    parent = array('i', [-1]) * n
+
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    gscore[source] = 0
+    tas = [(h(source) << (bits_g + bits_i)) | source]
+    explores = 0
+
+    while tas:
+        cle = heappop(tas)
+        explores += 1
+        i = cle & masque_i
+        gcur = (cle >> bits_i) & masque_g
+
+        # entrée obsolète: un meilleur g a été trouvé depuis
+        if gcur != gscore[i]:
+            continue
+
+        if i == cible:
+            coord = laby.coord
+            chemin = [goal]
+            while i != source:
+                i = parent[i]
+                chemin.append(coord(i))
+            chemin.reverse()
+            return chemin, explores
+
+        ng = gcur + 1
+        fg = ng * ECHELLE
+        for j in (i + d0, i + d1, i + d2, i + d3):
+            if cellules[j] == 0:
+                gj = gscore[j]
+                if gj < 0 or ng < gj:
+                    gscore[j] = ng
+                    parent[j] = i
+                    heappush(tas, ((((fg + h(j)) << bits_g) | ng) << bits_i) | j)
+
+    # Aucun chemin
+    return None, explores
+
+
+if __name__ == "__main__":
+    taille = 501
+    start: Coord = (1, 1)
+    goal: Coord = (taille - 2, taille - 2)
+    random.seed(0)
+
+    laby = PrimLabyrinthe(taille, stockage="bytearray")
+    laby._generer("rapide")
+
+    header = f"{'Heuristique':<14} {'Explorés':>10} {'Temps (ms)':>12} {'Longueur':>10}"
+    print(header)
+    print("-" * len(header))
+    for nom in HEURISTIQUES:
+        t0 = time.perf_counter()
+        chemin, explores = astar(laby, start, goal, nom)
+        duree_ms = (time.perf_counter() - t0) * 1000.0
+        longueur = (len(chemin) - 1) if chemin else None
+        print(f"{nom:<14} {explores:>10} {duree_ms:>12.2f} {str(longueur):>10}")
@@ -0,0 +1,158 @@
+import heapq
+import random
+import time
+from array import array
+from typing import Callable, List, Optional, Tuple, Union
+
+from PrimLabytinthe import PrimLabyrinthe
+from AStar_Moteur import ECHELLE, preparer_heuristique
+from AStar_Manhattan import astar_manhattan
+
+Coord = Tuple[int, int]
+
+
+def astar_saut(laby: PrimLabyrinthe, start: Coord, goal: Coord,
+               heuristique: Union[str, Callable] = 'manhattan') -> Tuple[Optional[List[Coord]], int]:
+    """
+    A* "par sauts", adaptation de Jump Point Search à la grille 4-connexe.
+
+    Dans un labyrinthe, la plupart des cases n'ont qu'une seule suite
+    possible: depuis un point de décision, chaque direction est suivie case
+    par case sans passer par le tas tant que le couloir est forcé (une seule
+    case ouverte autre que celle d'où l'on vient). Le saut s'arrête:
+      - sur une jonction (au moins deux suites possibles): point de saut,
+        poussé dans le tas avec g = g(origine) + longueur du couloir;
+      - sur le but (ou le départ): poussé de même;
+      - sur une impasse: la direction est abandonnée sans rien empiler.
+    Le coût d'un couloir forcé est sa longueur exacte et l'heuristique est
+    cohérente: le chemin rendu est optimal, y compris sur une grille avec
+    cycles. Le chemin complet (toutes les cases) est reconstitué à la fin
+    en rejouant chaque saut depuis sa direction initiale.
+
+    Retourne (chemin | None, explores), explores = nombre de points de saut
+    dépilés, comme astar_manhattan.
+    """
+    laby.modifier_cellule(start[0], start[1], 0)
+    laby.modifier_cellule(goal[0], goal[1], 0)
+
+    cellules = laby.grille_lecture()
+    decalages = laby.decalages
+    d0, d1, d2, d3 = decalages
+    direction_de = {d: k for k, d in enumerate(decalages)}
+    h = preparer_heuristique(laby, goal, heuristique)
+    source = laby.indice(*start)
+    cible = laby.indice(*goal)
+
+    n = len(cellules)
+    bits_i = n.bit_length()
+    bits_g = n.bit_length()
+    masque_i = (1 << bits_i) - 1
+    masque_g = (1 << bits_g) - 1
+    gscore = array('i', [-1]) * n
+    parent = array('i', [-1]) * n    # point de saut précédent
+    premier = bytearray(n)           # direction du premier pas depuis parent
+    retour = bytearray(b"\x04") * n  # direction par laquelle on est revenu (4 = aucune)
+
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    gscore[source] = 0
+    tas = [(h(source) << (bits_g + bits_i)) | source]
+    explores = 0
+
+    while tas:
+        cle = heappop(tas)
+        explores += 1
+        i = cle & masque_i
+        gcur = (cle >> bits_i) & masque_g
+        if gcur != gscore[i]:
+            continue
+
+        if i == cible:
+            return _reconstruire(laby, cellules, parent, premier, source, cible), explores
+
+        for k in range(4):
+            if k == retour[i]:
+                continue          # rebrousser chemin ne peut pas améliorer g
+            j = i + decalages[k]
+            if cellules[j]:
+                continue
+            prec = i
+            pas = 1
+            impasse = False
+            # couloir forcé: exactement une case ouverte autre que prec
+            while j != cible and j != source:
+                suivant = -1
+                nb = 0
+                v = j + d0
+                if v != prec and cellules[v] == 0:
+                    nb += 1; suivant = v
+                v = j + d1
+                if v != prec and cellules[v] == 0:
+                    nb += 1; suivant = v
+                v = j + d2
+                if v != prec and cellules[v] == 0:
+                    nb += 1; suivant = v
+                v = j + d3
+                if v != prec and cellules[v] == 0:
+                    nb += 1; suivant = v
+                if nb != 1:
+                    impasse = nb == 0
+                    break
+                prec, j = j, suivant
+                pas += 1
+            if impasse:
+                continue
+
+            ng = gcur + pas
+            gj = gscore[j]
+            if gj < 0 or ng < gj:
+                gscore[j] = ng
+                parent[j] = i
+                premier[j] = k
+                retour[j] = direction_de[prec - j]
+                heappush(tas, ((((ng * ECHELLE + h(j)) << bits_g) | ng) << bits_i) | j)
+
+    return None, explores
+
+
+def _reconstruire(laby: PrimLabyrinthe, cellules, parent, premier, source: int, cible: int) -> List[Coord]:
+    """Rejoue chaque saut (parent -> point de saut) pour retrouver toutes les cases du chemin."""
+    decalages = laby.decalages
+    points = [cible]
+    while points[-1] != source:
+        points.append(parent[points[-1]])
+    points.reverse()
+
+    coord = laby.coord
+    chemin = [coord(source)]
+    for a, b in zip(points, points[1:]):
+        prec, j = a, a + decalages[premier[b]]
+        chemin.append(coord(j))
+        while j != b:
+            for d in decalages:
+                v = j + d
+                if v != prec and cellules[v] == 0:
+                    break
+            prec, j = j, v
+            chemin.append(coord(j))
+    return chemin
+
+
+if __name__ == "__main__":
+    taille = 501
+    start: Coord = (1, 1)
+    goal: Coord = (taille - 2, taille - 2)
+    random.seed(0)
+
+    laby = PrimLabyrinthe(taille, stockage="bytearray")
+    laby._generer("rapide")
+
+    header = f"{'Méthode':<16} {'Explorés':>10} {'Temps (ms)':>12} {'Longueur':>10}"
+    print(header)
+    print("-" * len(header))
+    for nom, recherche in (('A* Manhattan', astar_manhattan), ('A* saut', astar_saut)):
+        t0 = time.perf_counter()
+        chemin, explores = recherche(laby, start, goal)
+        duree_ms = (time.perf_counter() - t0) * 1000.0
+        longueur = (len(chemin) - 1) if chemin else None
+        print(f"{nom:<16} {explores:>10} {duree_ms:>12.2f} {str(longueur):>10}")
@@ -1,19 +1,171 @@
+from array import array
 from collections import deque
+import hashlib
 import random
-try:
-   import matplotlib.pyplot as plt
-except Exception:
-   plt = None
+import sys
 import time
 
+STOCKAGES = ("liste", "bytearray", "numpy")
+
+def tirages(rng, bloc=4096):
+   """
+   Flux infini d'entiers 32 bits tirés par blocs depuis rng (numpy: un seul
+   appel vectorisé par bloc; random.Random: randbytes, lus en petit-boutiste
+   quel que soit l'hôte, pour qu'une graine donne le même labyrinthe partout).
+   Partagé par PrimLabyrinthe et hors_memoire.prim_tuile.
+   """
+   if hasattr(rng, "integers"):   # numpy.random.Generator
+      while True:
+         yield from rng.integers(0, 1 << 32, size=bloc, dtype="uint32").tolist()
+   else:
+      while True:
+         t = array('I', rng.randbytes(4 * bloc))
+         if sys.byteorder == "big":
+            t.byteswap()
+         yield from t
+
 class PrimLabyrinthe:
-  def __init__(self, taille): #le cstr qui s'execute automatiquement quand on crée un objet de cette classe
+  def __init__(self, taille, stockage="liste", seed=None, rng=None): #le cstr qui s'execute automatiquement quand on crée un objet de cette classe
     self.taille=taille
     """
     1 pour mur
     0 pour cellule
+
+    stockage:
+      - "liste"     : liste de listes Python (comportement historique)
+      - "bytearray" : tampon plat d'octets, indices ligne par ligne
+      - "numpy"     : tampon plat numpy uint8 (si numpy est installé)
+    Avec un stockage plat, le tampon fait (N+2)×(N+2) octets: une bordure
+    sentinelle de murs entoure la grille, ce qui permet de parcourir les
+    voisins par simples décalages d'indice sans tester les bornes.
+    self.grille reste utilisable (lecture/écriture grille[x][y]) comme vue
+    sur ce tampon.
+
+    seed / rng: source aléatoire propre à l'instance (random.Random ou
+    numpy.random.Generator; tout autre type lève TypeError). Sans l'un ni
+    l'autre, le mode "classique" de _generer utilise le module random
+    global (comportement historique).
     """
-    self.grille=[[1 for _ in range(taille)] for _ in range(taille)]   # grille initiale tous des murs
+    if stockage not in STOCKAGES:
+       raise ValueError(f"Stockage inconnu: {stockage!r} (attendu: {', '.join(STOCKAGES)})")
+    if stockage == "numpy":
+       try:
+          import numpy as np   # importé seulement pour ce stockage
+       except ImportError:
+          raise ValueError("Stockage 'numpy' demandé mais numpy n'est pas installé.")
+    self.stockage=stockage
+    self.largeur=taille+2   # largeur d'une ligne du tampon plat (avec bordure)
+    # décalages plats des 4 voisins, dans le même ordre que _voisin()
+    self.decalages=(1, -1, self.largeur, -self.largeur)
+    self.cellules=None      # tampon plat (None en stockage "liste")
+    self.couts=None         # coûts de terrain, indexés comme le tampon plat (None: tous à 1)
+    self.seed=seed
+    if rng is None and seed is not None:
+       rng=random.Random(seed)
+    if rng is not None and not isinstance(rng, random.Random) and not hasattr(rng, "integers"):
+       raise TypeError(f"Source aléatoire non prise en charge: {type(rng).__name__} "
+                       "(attendu: random.Random ou numpy.random.Generator)")
+    self.rng=rng
+    # compteur incrémenté à chaque modification passant par l'API
+    # (_generer, modifier_cellule): sert de clé d'invalidation aux caches
+    self.version=0
+    self._lecture=None      # (instantané des lignes, copie plate) pour grille_lecture() en stockage "liste"
+
+    W=self.largeur
+    if stockage == "liste":
+       self.grille=[[1 for _ in range(taille)] for _ in range(taille)]   # grille initiale tous des murs
+    elif stockage == "bytearray":
+       self.cellules=bytearray(b"\x01")*(W*W)
+       vue=memoryview(self.cellules)
+       self.grille=[vue[(x+1)*W+1:(x+1)*W+1+taille] for x in range(taille)]
+    else:
+       tableau=np.ones((W, W), dtype=np.uint8)
+       self._tableau=tableau
+       self.cellules=memoryview(tableau).cast("B")
+       self.grille=tableau[1:-1, 1:-1]
+
+  def est_plat(self):
+      """Vrai si la grille est stockée dans un tampon plat (self.cellules)."""
+      return self.cellules is not None
+
+  def indice(self, x, y):
+      """Indice plat (bordure comprise) de la case (x, y)."""
+      return (x+1)*self.largeur+(y+1)
+
+  def coord(self, i):
+      """Inverse de indice(): case (x, y) correspondant à l'indice plat i."""
+      x, y=divmod(i, self.largeur)
+      return (x-1, y-1)
+
+  def modifier_cellule(self, x, y, valeur):
+      """
+      Écrit grille[x][y] = valeur (0 cellule, 1 mur) et incrémente
+      self.version si la case change. À préférer aux écritures directes
+      dans grille, que les caches ne peuvent détecter que par empreinte().
+      """
+      if self.grille[x][y] != valeur:
+         self.grille[x][y]=valeur
+         self.version+=1
+
+  def definir_cout(self, x, y, cout):
+      """
+      Coût (entier de 1 à 255) d'un pas qui entre dans la case (x, y), pour
+      les moteurs pondérés (voir terrain). Tant qu'aucun coût n'est défini,
+      self.couts reste None: tous les pas coûtent 1 et ces moteurs prennent
+      le chemin rapide sans poids. Incrémente self.version si le coût change.
+      """
+      if not 1 <= cout <= 255:
+         raise ValueError(f"Coût {cout} hors de [1, 255]")
+      if self.couts is None:
+         if cout == 1:
+            return
+         self.couts=bytearray(b"\x01")*(self.largeur*self.largeur)
+      i=self.indice(x, y)
+      if self.couts[i] != cout:
+         self.couts[i]=cout
+         self.version+=1
+
+  def cout(self, x, y):
+      """Coût d'entrée dans la case (x, y) (1 sans terrain)."""
+      return 1 if self.couts is None else self.couts[self.indice(x, y)]
+
+  def empreinte(self):
+      """Empreinte (blake2b, 16 octets) du contenu de la grille (et des coûts), quelle que soit la façon dont elle a été modifiée."""
+      h=hashlib.blake2b(self.grille_plate(), digest_size=16)
+      if self.couts is not None:
+         h.update(self.couts)
+      return h.digest()
+
+  def grille_plate(self):
+      """
+      Retourne le tampon plat (N+2)×(N+2) avec bordure de murs.
+      En stockage plat c'est self.cellules lui-même (aucune copie); en
+      stockage "liste" une copie bytearray est construite.
+      """
+      if self.cellules is not None:
+         return self.cellules
+      N, W=self.taille, self.largeur
+      tampon=bytearray(b"\x01")*(W*W)
+      for x, ligne in enumerate(self.grille):
+         d=(x+1)*W+1
+         tampon[d:d+N]=bytes(ligne)
+      return tampon
+
+  def grille_lecture(self):
+      """
+      Comme grille_plate(), mais pour les recherches qui ne font que lire:
+      en stockage "liste" la copie est gardée avec un instantané des lignes
+      et reconstruite seulement si la grille a changé, écritures directes
+      dans grille comprises. La comparaison (en C, sans conversion des
+      lignes) coûte environ 7 fois moins qu'une nouvelle copie. Ne pas
+      écrire dans le tampon retourné.
+      """
+      if self.cellules is not None:
+         return self.cellules
+      lecture=self._lecture
+      if lecture is None or lecture[0] != self.grille:
+         lecture=self._lecture=([list(ligne) for ligne in self.grille], self.grille_plate())
+      return lecture[1]
 
   def _voisin(self, x, y):
       voisins=[]
@@ -24,24 +176,44 @@ class PrimLabyrinthe:
             voisins.append((nx,ny))
       return voisins
 
-  def _generer(self):
+  def _generer(self, mode="classique"):
      """
      Génère un labyrinthe parfait (chemin unique) via l'algorithme de Prim.
      Représentation: grille de taille N×N avec N>=3. Les murs restent à 1.
      Les cellules (chemins) sont sur des coordonnées impaires; les murs entre
      deux cellules sont aux coordonnées paires/impaires (entre elles). On casse
      UNIQUEMENT les murs sélectionnés pour relier deux cellules, ce qui évite les cycles.
+
+     mode:
+       - "classique": liste de murs frontière, retrait par pop(idx) (historique)
+       - "rapide"   : voir _generer_rapide() (frontière O(1), sans doublons)
+       - "eller"    : algorithme d'Eller ligne par ligne (voir eller.lignes_eller)
+       - "tuiles"   : tuiles indépendantes construites sur tous les cœurs puis
+                      raccordées (voir generation_tuilee.generer_tuile)
      """
+     if mode == "rapide":
+        return self._generer_rapide()
+     if mode == "eller":
+        return self._generer_eller()
+     if mode == "tuiles":
+        from generation_tuilee import generer_tuile
+        generer_tuile(self)
+        return self.grille
+     if mode != "classique":
+        raise ValueError(f"Mode de génération inconnu: {mode!r}")
+     alea = self._alea()
+
      N = self.taille
      if N < 3:
         # Cas trivial: trop petit pour un vrai labyrinthe
         if N >= 1:
-           self.grille[0][0] = 0
+           self.modifier_cellule(0, 0, 0)
         return self.grille
 
-     # Point de départ sur des coordonnées impaires (à l'intérieur des bords)
-     x0 = random.randrange(1, N, 2)
-     y0 = random.randrange(1, N, 2)
+     # Point de départ sur des coordonnées impaires (à l'intérieur des bords;
+     # pour N pair, N-1 est impair mais c'est le bord)
+     x0 = alea.randrange(1, N - 1, 2)
+     y0 = alea.randrange(1, N - 1, 2)
      self.grille[x0][y0] = 0
 
      visites = {(x0, y0)}
@@ -58,7 +230,7 @@ class PrimLabyrinthe:
 
      # Boucle principale de Prim: tant qu'il reste des murs en frontière
      while murs:
-        idx = random.randrange(len(murs))
+        idx = alea.randrange(len(murs))
         wx, wy, cx, cy, nx, ny = murs.pop(idx)
 
         if (nx, ny) not in visites:
@@ -68,45 +240,244 @@ class PrimLabyrinthe:
            visites.add((nx, ny))
            ajouter_murs_autour(nx, ny)
 
+     self.version += 1
      return self.grille
 
-  #visualisation du labyrinthe avec matplotlib
-  def _afficher(self, grille=None, title=None, chemin=None):
-     if plt is None:
-          print("Matplotlib non disponible - affichage désactivé.")
-          if chemin:
-               longueur_aretes = len(chemin) - 1
-               print(f"[Sans affichage] Chemin trouvé (L={longueur_aretes})")
-          return
-     plt.figure(figsize=(6,6))
-     data = self.grille if grille is None else grille
-     plt.imshow(data, cmap='binary', interpolation='nearest')
-
-     # Overlay du chemin en rouge (si fourni)
-     if chemin:
-         xs = [y + 0.5 for (x, y) in chemin]
-         ys = [x + 0.5 for (x, y) in chemin]
-         plt.plot(xs, ys, color='red', linewidth=2, zorder=3)
-         # marquer début/fin
-         sx, sy = chemin[0]
-         ex, ey = chemin[-1]
-         plt.scatter([sy + 0.5], [sx + 0.5], c='green', s=40, zorder=4)
-         plt.scatter([ey + 0.5], [ex + 0.5], c='blue', s=40, zorder=4)
-
-     plt.xticks([]); plt.yticks([])
-     if title is None:
-         plt.title(f"Labyrinthe Prim {self.taille}×{self.taille}")
+  def copier(self):
+     """
+     Copie indépendante du labyrinthe (même taille, même stockage, même
+     grille): les modifications de la copie n'affectent pas l'original.
+     """
+     copie=PrimLabyrinthe(self.taille, stockage=self.stockage, seed=self.seed)
+     if self.cellules is not None:
+        copie.cellules[:]=self.cellules
      else:
-         plt.title(title)
-     plt.show()
+        copie.grille=[list(ligne) for ligne in self.grille]
+     if self.couts is not None:
+        copie.couts=bytearray(self.couts)
+     copie.version=self.version
+     return copie
+
+  def compiler_graphe(self):
+     """
+     Compile la grille en graphe de jonctions pondéré (voir graphe_jonctions):
+     les couloirs de degré 2 deviennent des arêtes, ce qui réduit fortement
+     le nombre de nœuds expandus par BFS/Dijkstra/A*.
+     """
+     from graphe_jonctions import GrapheJonctions
+     return GrapheJonctions(self)
+
+  def distances_depuis(self, source):
+     """
+     Un seul BFS depuis 'source' sur toute la grille. Retourne un
+     ChampDistances (tableaux plats distances/directions) qui donne la
+     distance et, à la demande, le chemin vers n'importe quelle case.
+     """
+     from champ_distances import parcours_largeur
+     return parcours_largeur(self, source)
+
+  def distances_vectorielles(self, sources):
+     """
+     Champs de distances complets de plusieurs sources en une seule passe
+     numpy (voir wavefront_numpy): tableaux distances/directions (B, W, W).
+     """
+     from wavefront_numpy import propagation_numpy
+     return propagation_numpy(self, sources)
+
+  def bfs_multi_cibles(self, source, cibles, k=1):
+     """
+     BFS depuis 'source' arrêté dès que k cibles ont été atteintes (la plus
+     proche si k=1, toutes si k=None). Les cibles atteintes, par distance
+     croissante, sont dans champ.atteintes; chemins via champ.chemin(cible).
+     """
+     from champ_distances import parcours_largeur
+     return parcours_largeur(self, source, cibles, k)
+
+  def construire_oracle(self):
+     """
+     Index de plus proche ancêtre commun sur l'arbre couvrant formé par un
+     labyrinthe parfait (voir oracle_distances): distances en O(1) et
+     chemins en O(longueur) entre deux cases quelconques, sans recherche.
+     """
+     from oracle_distances import OracleDistances
+     return OracleDistances(self)
+
+  def construire_reperes(self, k=16):
+     """
+     Heuristique ALT précalculée (voir reperes): distances BFS depuis k
+     repères choisis par point le plus éloigné, utilisable comme
+     heuristique d'AStar_Moteur.astar et sauvegardable avec le labyrinthe.
+     """
+     from reperes import Reperes
+     return Reperes(self, k)
+
+  def construire_hierarchie(self, taille_cluster=16):
+     """
+     Graphe abstrait HPA* (voir hpa): clusters de taille_cluster cases,
+     transitions entre clusters voisins et distances intra-cluster; les
+     éditions faites par son API ne reconstruisent que les clusters touchés.
+     """
+     from hpa import HierarchieClusters
+     return HierarchieClusters(self, taille_cluster)
+
+  def elaguer(self, points=None):
+     """
+     Remplit les culs-de-sac en temps linéaire (voir elagage), en gardant
+     les points d'intérêt donnés: elagage.reduit est une copie où seules
+     restent les cases utiles aux chemins entre ces points.
+     """
+     from elagage import Elagage
+     return Elagage(self, points)
+
+  def sauvegarder(self, fichier, sections=None):
+     """
+     Enregistre le labyrinthe au format compact .plab (voir
+     format_labyrinthe): 2 bits de murs par cellule, taille et graine.
+     """
+     from format_labyrinthe import sauvegarder
+     return sauvegarder(self, fichier, sections)
+
+  @staticmethod
+  def charger(fichier, stockage="bytearray"):
+     """Relit un fichier .plab écrit par sauvegarder()."""
+     from format_labyrinthe import charger
+     return charger(fichier, stockage)
+
+  def _tirages(self, bloc=4096):
+     """
+     tirages() depuis la source de l'instance. Sans source, une graine est
+     prise au module random global pour que random.seed() reste respecté;
+     ce générateur reste local, self.rng n'est pas modifié.
+     """
+     rng = self.rng
+     if rng is None:
+        rng = random.Random(random.getrandbits(64))
+     return tirages(rng, bloc)
+
+  def _alea(self):
+     """
+     Source au format du module random (randrange, getrandbits) pour les
+     générateurs classique, Eller et tuilé: self.rng si c'est un
+     random.Random, un random.Random semé depuis self.rng si c'est un
+     numpy.random.Generator (même graine numpy, même labyrinthe), le module
+     random global sans source.
+     """
+     rng = self.rng
+     if rng is None:
+        return random
+     if isinstance(rng, random.Random):
+        return rng
+     return random.Random(int(rng.integers(0, 1 << 63)))
+
+  def _generer_eller(self):
+     """
+     Remplit la grille avec les lignes produites par eller.lignes_eller, qui
+     n'a besoin que de la ligne courante: le même générateur peut écrire un
+     labyrinthe de hauteur quelconque directement dans un fichier.
+     """
+     from eller import lignes_eller
+     N = self.taille
+     if N < 3:
+        if N >= 1:
+           self.modifier_cellule(0, 0, 0)
+        return self.grille
+     alea = self._alea()
+     for x, ligne in enumerate(lignes_eller(N, N, rng=alea)):
+        if self.cellules is not None:
+           d = self.indice(x, 0)
+           self.cellules[d:d + N] = ligne
+        else:
+           self.grille[x] = list(ligne)
+     self.version += 1
+     return self.grille
+
+  def _generer_rapide(self):
+     """
+     Prim "par cellules": la frontière contient des cellules (et non des murs),
+     chacune au plus une fois (état 0 = inconnue, 1 = frontière, 2 = visitée).
+     Le retrait d'un élément aléatoire se fait par échange avec le dernier
+     puis pop(): O(1) au lieu de O(len(frontière)). La cellule tirée est
+     reliée à un voisin déjà visité choisi au hasard: chaque cellule est
+     rattachée une seule fois, le résultat reste un labyrinthe parfait.
+     Les indices sont tirés par blocs via _tirages(); une même graine donne
+     toujours le même labyrinthe.
+     """
+     N = self.taille
+     if N < 3:
+        if N >= 1:
+           self.modifier_cellule(0, 0, 0)
+        return self.grille
+
+     grille = self.grille
+     m = (N - 1) // 2           # cellules par dimension, en (2k+1, 2l+1)
+     etat = bytearray(m * m)
+     frontiere = []
+     tirage = self._tirages().__next__
+
+     def ajouter_frontiere(c):
+        kx, ky = divmod(c, m)
+        if ky + 1 < m and etat[c + 1] == 0:
+           etat[c + 1] = 1; frontiere.append(c + 1)
+        if ky > 0 and etat[c - 1] == 0:
+           etat[c - 1] = 1; frontiere.append(c - 1)
+        if kx + 1 < m and etat[c + m] == 0:
+           etat[c + m] = 1; frontiere.append(c + m)
+        if kx > 0 and etat[c - m] == 0:
+           etat[c - m] = 1; frontiere.append(c - m)
+
+     c0 = (tirage() * (m * m)) >> 32
+     etat[c0] = 2
+     kx, ky = divmod(c0, m)
+     grille[2 * kx + 1][2 * ky + 1] = 0
+     ajouter_frontiere(c0)
+
+     while frontiere:
+        idx = (tirage() * len(frontiere)) >> 32
+        c = frontiere[idx]
+        frontiere[idx] = frontiere[-1]
+        frontiere.pop()
+
+        kx, ky = divmod(c, m)
+        visites = []
+        if ky + 1 < m and etat[c + 1] == 2: visites.append((0, 1))
+        if ky > 0 and etat[c - 1] == 2: visites.append((0, -1))
+        if kx + 1 < m and etat[c + m] == 2: visites.append((1, 0))
+        if kx > 0 and etat[c - m] == 2: visites.append((-1, 0))
+        dx, dy = visites[(tirage() * len(visites)) >> 32]
+
+        x, y = 2 * kx + 1, 2 * ky + 1
+        grille[x][y] = 0
+        grille[x + dx][y + dy] = 0   # mur entre c et son voisin visité
+        etat[c] = 2
+        ajouter_frontiere(c)
+
+     self.version += 1
+     return self.grille
+
+  #visualisation du labyrinthe avec matplotlib (importé à la demande, voir rapports.py)
+  def _afficher(self, grille=None, title=None, chemin=None, fichier=None):
+     from rapports import afficher_labyrinthe
+     data = self.grille if grille is None else grille
+     if grille is None and self.stockage == "bytearray":
+         data = [list(ligne) for ligne in data]
+     afficher_labyrinthe(data, self.taille, title=title, chemin=chemin, fichier=fichier)
   
-  def bfs(self, depart, arrivee):
+  def bfs(self, depart, arrivee, stats=None):
         """
         BFS (largeur) depuis 'depart' vers 'arrivee'.
         Retourne (chemin, nb_explores) où:
           - chemin est la liste [(x,y), ...] ou None si pas de chemin
           - nb_explores est le nombre de nœuds dépilés (explorés)
+        stats: instrumentation.StatistiquesRecherche optionnel (compteurs,
+        temps par phase, rappel par expansion); même chemin et même
+        nb_explores.
         """
+        if stats is not None:
+            from instrumentation import bfs_instrumente
+            return bfs_instrumente(self, depart, arrivee, stats)
+        if self.cellules is not None:
+            return self._bfs_plat(depart, arrivee)
+
         queue   = deque([depart])
         visited = {depart}
         parent  = {}
@@ -133,6 +504,112 @@ class PrimLabyrinthe:
 
         return None, explores  # aucun chemin trouvé
 
+  def _bfs_plat(self, depart, arrivee):
+        """
+        Variante de bfs() sur le tampon plat: indices entiers, tableau de
+        parents au lieu de dictionnaires, voisins par décalages précalculés.
+        Même ordre d'exploration (donc même chemin et même nb_explores).
+        """
+        cellules = self.cellules
+        decalages = self.decalages
+        source = self.indice(*depart)
+        cible = self.indice(*arrivee)
+        parent = array('i', [-1]) * len(cellules)   # -1 = non visité
+        parent[source] = source
+        queue = deque([source])
+        explores = 0
+
+        while queue:
+            i = queue.popleft()
+            explores += 1
+            if i == cible:
+                chemin = []
+                while i != source:
+                    chemin.append(self.coord(i))
+                    i = parent[i]
+                chemin.append(depart)
+                return list(reversed(chemin)), explores
+
+            for d in decalages:
+                j = i + d
+                if cellules[j] == 0 and parent[j] < 0:
+                    parent[j] = i
+                    queue.append(j)
+
+        return None, explores
+
+  def bfs_bidirectionnel(self, depart, arrivee):
+        """
+        BFS bidirectionnel: deux parcours en largeur, depuis 'depart' et depuis
+        'arrivee', en développant à chaque tour un niveau complet du côté dont
+        la frontière est la plus petite. Dès qu'un niveau touche une case déjà
+        atteinte par l'autre côté, on termine ce niveau (pour garder la
+        meilleure jonction) puis on s'arrête: le chemin est le plus court.
+        Même contrat que bfs(): (chemin, nb_explores), nb_explores comptant
+        les cases dépilées des deux côtés.
+        """
+        cellules = self.grille_lecture()
+        decalages = self.decalages
+        source = self.indice(*depart)
+        cible = self.indice(*arrivee)
+        if source == cible:
+            return [depart], 1
+
+        n = len(cellules)
+        # distances depuis chaque extrémité (-1 = non atteinte) et parents
+        dist_av, dist_ar = array('i', [-1]) * n, array('i', [-1]) * n
+        par_av, par_ar = array('i', [-1]) * n, array('i', [-1]) * n
+        dist_av[source] = 0
+        dist_ar[cible] = 0
+        front_av, front_ar = [source], [cible]
+        explores = 0
+        meilleur, jonction = -1, -1
+
+        while front_av and front_ar:
+            if len(front_av) <= len(front_ar):
+                front, dist, par, autre = front_av, dist_av, par_av, dist_ar
+            else:
+                front, dist, par, autre = front_ar, dist_ar, par_ar, dist_av
+            suivant = []
+            for i in front:
+                explores += 1
+                di = dist[i] + 1
+                for d in decalages:
+                    j = i + d
+                    if cellules[j] != 0:
+                        continue
+                    if dist[j] < 0:
+                        dist[j] = di
+                        par[j] = i
+                        suivant.append(j)
+                    if autre[j] >= 0:
+                        total = dist[j] + autre[j]
+                        if meilleur < 0 or total < meilleur:
+                            meilleur, jonction = total, j
+            if front is front_av:
+                front_av = suivant
+            else:
+                front_ar = suivant
+            if meilleur >= 0:
+                break
+
+        if meilleur < 0:
+            return None, explores
+
+        # reconstruction: depart -> jonction (par_av), puis jonction -> arrivee (par_ar)
+        chemin = []
+        i = jonction
+        while i != source:
+            chemin.append(self.coord(i))
+            i = par_av[i]
+        chemin.append(depart)
+        chemin.reverse()
+        i = jonction
+        while i != cible:
+            i = par_ar[i]
+            chemin.append(self.coord(i))
+        return chemin, explores
+
 
 if __name__ == "__main__":
    taille=31  # idéalement impair pour une meilleure symétrie
@@ -1,102 +1,213 @@
-import matplotlib.pyplot as plt
-import numpy as np
+import random
+import statistics
 import time
 from PrimLabytinthe import PrimLabyrinthe
 from AStar_Manhattan import astar_manhattan
 from AStar_Euclidienne import astar_euclidienne
+from AStar_Bidirectionnel import astar_bidirectionnel
+from AStar_Saut import astar_saut
+from reperes import astar_alt, reperes_pour
+from hpa import astar_hpa, hierarchie_pour
+from terrain import astar_seaux, astar_tas, cout_chemin, terrain_aleatoire
+from execution_parallele import executer_taches, generer_labyrinthe_test
+from instrumentation import StatistiquesRecherche, afficher_compteurs, exporter_compteurs
+
+# Algorithmes comparés: nom -> fonction (laby, start, goal) -> (chemin, noeuds explorés)
+ALGORITHMES = {
+    'BFS': lambda laby, start, goal: laby.bfs(start, goal),
+    'A* Manhattan': astar_manhattan,
+    'A* Euclidienne': astar_euclidienne,
+    'BFS bidirectionnel': lambda laby, start, goal: laby.bfs_bidirectionnel(start, goal),
+    'A* bidirectionnel': astar_bidirectionnel,
+    'A* saut': astar_saut,
+    'A* ALT': astar_alt,
+    'HPA*': astar_hpa,
+}
+
+# Prétraitements par labyrinthe, faits avant le chronométrage de la requête
+PRETRAITEMENTS = {
+    'A* ALT': reperes_pour,
+    'HPA*': hierarchie_pour,
+}
+
+
+def pretraiter(algo, laby):
+    """Exécute le prétraitement de 'algo' sur laby (s'il en a un), hors mesure."""
+    if algo in PRETRAITEMENTS:
+        PRETRAITEMENTS[algo](laby)
+
+# Moteurs pondérés par les coûts de terrain (voir terrain), comparés à la
+# place de ALGORITHMES quand les labyrinthes de test reçoivent un terrain (cout_max)
+ALGORITHMES_PONDERES = {
+    'A* seaux': astar_seaux,
+    'A* heapq': astar_tas,
+    'Dijkstra seaux': lambda laby, start, goal: astar_seaux(laby, start, goal, 'nulle'),
+    'Dijkstra heapq': lambda laby, start, goal: astar_tas(laby, start, goal, 'nulle'),
+}
+
+# Algorithmes qui acceptent un objet instrumentation.StatistiquesRecherche
+ALGORITHMES_INSTRUMENTES = {
+    'BFS': lambda laby, start, goal, stats: laby.bfs(start, goal, stats=stats),
+    'A* Manhattan': lambda laby, start, goal, stats: astar_manhattan(laby, start, goal, stats),
+    'A* Euclidienne': lambda laby, start, goal, stats: astar_euclidienne(laby, start, goal, stats),
+}
+
+
+def mesurer_compteurs(algo, laby, start, goal):
+    """
+    Relance 'algo' instrumenté (après la mesure de temps, pour ne pas la
+    fausser) et retourne ses compteurs (StatistiquesRecherche.vers_dict).
+    """
+    stats = StatistiquesRecherche()
+    ALGORITHMES_INSTRUMENTES[algo](laby, start, goal, stats)
+    return stats.vers_dict()
 
 class AnalyseurPerformance:
     def __init__(self):
         self.resultats = {}
     
-    def executer_comparaison_complete(self, taille=31, nb_tests=5):
+    def executer_comparaison_complete(self, taille=31, nb_tests=5, nb_processus=1, graine=None,
+                                      instrumenter=False, fichier_compteurs=None, cout_max=None):
         """
         Exécute une comparaison complète sur plusieurs labyrinthes
+
+        nb_processus: 1 = exécution en série dans ce processus; sinon les tâches
+        (test, algorithme) sont réparties sur un pool de processus (None = un
+        par cœur), chaque mesure étant isolée dans son processus.
+        graine: graine globale; chaque test reçoit une graine dérivée
+        déterministe (execution_parallele.graine_tache). Tirée au hasard et
+        affichée si absente en mode parallèle.
+        instrumenter: relève aussi les compteurs de recherche (empilements,
+        entrées périmées, taille de file, évaluations de h, mémoire, temps
+        par phase) des algorithmes de ALGORITHMES_INSTRUMENTES, par une
+        seconde exécution instrumentée; moyennes affichées en fin d'analyse.
+        fichier_compteurs: export des compteurs de chaque mesure (CSV, ou
+        JSON si le nom finit par .json).
+        cout_max: donne à chaque labyrinthe un terrain aléatoire (coûts 1 à
+        cout_max, terrain.terrain_aleatoire) et compare les moteurs pondérés
+        de ALGORITHMES_PONDERES (file à seaux contre heapq); la colonne
+        Longueur donne alors le coût du chemin.
         """
         print("=" * 80)
         print("ANALYSE COMPARATIVE COMPLÈTE - PARTIE 4")
         print("=" * 80)
         
-        stats = {
-            'BFS': {'temps': [], 'noeuds': [], 'longueurs': []},
-            'A* Manhattan': {'temps': [], 'noeuds': [], 'longueurs': []},
-            'A* Euclidienne': {'temps': [], 'noeuds': [], 'longueurs': []}
-        }
+        instrumenter = instrumenter or fichier_compteurs is not None
+        algorithmes = ALGORITHMES_PONDERES if cout_max else ALGORITHMES
+        stats = {algo: {'temps': [], 'noeuds': [], 'longueurs': [], 'compteurs': []} for algo in algorithmes}
+        
+        if nb_processus != 1:
+            self._executer_en_parallele(taille, nb_tests, nb_processus, graine, stats, instrumenter, cout_max)
+            self._calculer_moyennes(stats)
+            self._rapporter_compteurs(stats, taille, fichier_compteurs)
+            return stats
         
         for i in range(nb_tests):
             print(f"\n--- Test {i+1}/{nb_tests} ---")
             
             # Générer un nouveau labyrinthe
-            laby = PrimLabyrinthe(taille)
-            laby._generer()
+            if graine is not None:
+                laby = generer_labyrinthe_test(graine, taille, i, cout_max)
+            else:
+                laby = PrimLabyrinthe(taille)
+                laby._generer()
+                if cout_max:
+                    terrain_aleatoire(laby, cout_max)
             start = (1, 1)
             goal = (taille-2, taille-2)
             
-            # BFS
-            t0 = time.perf_counter()
-            chemin_bfs, noeuds_bfs = laby.bfs(start, goal)
-            t1 = time.perf_counter()
-            temps_bfs = (t1 - t0) * 1000.0
-            
-            # A* Manhattan
-            t2 = time.perf_counter()
-            chemin_man, noeuds_man = astar_manhattan(laby, start, goal)
-            t3 = time.perf_counter()
-            temps_man = (t3 - t2) * 1000.0
-            
-            # A* Euclidienne
-            t4 = time.perf_counter()
-            chemin_euc, noeuds_euc = astar_euclidienne(laby, start, goal)
-            t5 = time.perf_counter()
-            temps_euc = (t5 - t4) * 1000.0
-            
-            # Stocker les résultats
-            for algo, chemin, noeuds, temps in [
-                ('BFS', chemin_bfs, noeuds_bfs, temps_bfs),
-                ('A* Manhattan', chemin_man, noeuds_man, temps_man),
-                ('A* Euclidienne', chemin_euc, noeuds_euc, temps_euc)
-            ]:
+            # Mesurer chaque algorithme et stocker les résultats
+            for algo, recherche in algorithmes.items():
+                pretraiter(algo, laby)
+                t0 = time.perf_counter()
+                chemin, noeuds = recherche(laby, start, goal)
+                t1 = time.perf_counter()
                 if chemin:
-                    stats[algo]['temps'].append(temps)
+                    stats[algo]['temps'].append((t1 - t0) * 1000.0)
                     stats[algo]['noeuds'].append(noeuds)
-                    stats[algo]['longueurs'].append(len(chemin) - 1)
+                    stats[algo]['longueurs'].append(cout_chemin(laby, chemin) if cout_max else len(chemin) - 1)
+                    if instrumenter and algo in ALGORITHMES_INSTRUMENTES:
+                        stats[algo]['compteurs'].append(mesurer_compteurs(algo, laby, start, goal))
             
             # Afficher résultats du test
             self._afficher_resultats_test(i+1, stats, taille)
         
         # Calcul des moyennes
         self._calculer_moyennes(stats)
+        self._rapporter_compteurs(stats, taille, fichier_compteurs)
         return stats
     
+    def _executer_en_parallele(self, taille, nb_tests, nb_processus, graine, stats, instrumenter=False,
+                               cout_max=None):
+        """Exécute les tâches (test, algorithme) sur un pool et fusionne dans stats"""
+        if graine is None:
+            graine = random.getrandbits(32)
+        print(f"Exécution parallèle (processus: {nb_processus or 'tous les cœurs'}, graine: {graine})")
+        
+        taches = [(taille, i, algo, graine, instrumenter, cout_max) for i in range(nb_tests) for algo in stats]
+        resultats = executer_taches(taches, nb_processus)
+        
+        # Fusion dans l'ordre (test, algorithme), comme en exécution série
+        for i in range(nb_tests):
+            print(f"\n--- Test {i+1}/{nb_tests} ---")
+            for res in resultats:
+                if res['test'] == i and res['longueur'] is not None:
+                    stats[res['algo']]['temps'].append(res['temps'])
+                    stats[res['algo']]['noeuds'].append(res['noeuds'])
+                    stats[res['algo']]['longueurs'].append(res['longueur'])
+                    if res.get('compteurs') is not None:
+                        stats[res['algo']]['compteurs'].append(res['compteurs'])
+            self._afficher_resultats_test(i+1, stats, taille)
+    
     def _afficher_resultats_test(self, test_num, stats, taille):
         """Affiche les résultats d'un test individuel"""
         print(f"Grille {taille}x{taille} - Test {test_num}:")
-        print(f"{'Algorithme':<18} {'Noeuds':<10} {'Temps (ms)':<12} {'Longueur':<10}")
+        print(f"{'Algorithme':<20} {'Noeuds':<10} {'Temps (ms)':<12} {'Longueur':<10}")
         print("-" * 60)
         
-        for algo in ['BFS', 'A* Manhattan', 'A* Euclidienne']:
+        for algo in stats:
             if stats[algo]['noeuds']:
                 idx = test_num - 1
                 noeuds = stats[algo]['noeuds'][idx]
                 temps = stats[algo]['temps'][idx]
                 longueur = stats[algo]['longueurs'][idx]
-                print(f"{algo:<18} {noeuds:<10} {temps:<12.2f} {longueur:<10}")
+                print(f"{algo:<20} {noeuds:<10} {temps:<12.2f} {longueur:<10}")
     
     def _calculer_moyennes(self, stats):
         """Calcule et affiche les moyennes"""
         print("\n" + "=" * 80)
         print("MOYENNES SUR TOUS LES TESTS")
         print("=" * 80)
-        print(f"{'Algorithme':<18} {'Noeuds moy':<12} {'Temps moy (ms)':<15} {'Longueur moy':<12}")
+        print(f"{'Algorithme':<20} {'Noeuds moy':<12} {'Temps moy (ms)':<15} {'Longueur moy':<12}")
         print("-" * 80)
         
-        for algo in ['BFS', 'A* Manhattan', 'A* Euclidienne']:
+        for algo in stats:
             if stats[algo]['noeuds']:
-                noeuds_moy = np.mean(stats[algo]['noeuds'])
-                temps_moy = np.mean(stats[algo]['temps'])
-                longueur_moy = np.mean(stats[algo]['longueurs'])
+                noeuds_moy = statistics.fmean(stats[algo]['noeuds'])
+                temps_moy = statistics.fmean(stats[algo]['temps'])
+                longueur_moy = statistics.fmean(stats[algo]['longueurs'])
                 
-                print(f"{algo:<18} {noeuds_moy:<12.0f} {temps_moy:<15.2f} {longueur_moy:<12.2f}")
+                print(f"{algo:<20} {noeuds_moy:<12.0f} {temps_moy:<15.2f} {longueur_moy:<12.2f}")
+    
+    def _rapporter_compteurs(self, stats, taille, fichier_compteurs):
+        """Affiche les moyennes des compteurs instrumentés et les exporte si demandé"""
+        mesures = {algo: stats[algo]['compteurs'] for algo in stats if stats[algo]['compteurs']}
+        if not mesures:
+            return
+        print("\n" + "=" * 80)
+        print("COMPTEURS DE RECHERCHE (moyennes)")
+        print("=" * 80)
+        moyennes = {}
+        for algo, lignes in mesures.items():
+            moyennes[algo] = {cle: (statistics.fmean(l[cle] for l in lignes)
+                                    if lignes[0][cle] is not None else None)
+                              for cle in lignes[0]}
+        afficher_compteurs(moyennes)
+        if fichier_compteurs:
+            exporter_compteurs(fichier_compteurs, [
+                {'taille': taille, 'test': i, 'algo': algo, **ligne}
+                for algo, lignes in mesures.items() for i, ligne in enumerate(lignes)])
+            print(f"Compteurs enregistrés dans {fichier_compteurs}")
     
     def repondre_questions_theoriques(self):
         """Répond aux questions théoriques de la partie 4"""
@@ -0,0 +1,262 @@
+import argparse
+import csv
+import gc
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PrimLabytinthe import PrimLabyrinthe
+from analyzer import ALGORITHMES, ALGORITHMES_PONDERES, pretraiter
+from execution_parallele import generer_labyrinthe_test
+
+# Algorithmes mesurés par défaut (noms de analyzer.ALGORITHMES)
+ALGORITHMES_PAR_DEFAUT = ('BFS', 'A* Manhattan', 'A* Euclidienne')
+FORMAT_VERSION = 1
+
+
+def percentile(valeurs: Sequence[float], p: float) -> float:
+    """Percentile p (0..100) par interpolation linéaire entre rangs."""
+    tri = sorted(valeurs)
+    if len(tri) == 1:
+        return tri[0]
+    rang = (len(tri) - 1) * p / 100.0
+    bas = math.floor(rang)
+    haut = min(bas + 1, len(tri) - 1)
+    return tri[bas] + (tri[haut] - tri[bas]) * (rang - bas)
+
+
+def intervalle_bootstrap(valeurs: Sequence[float], statistique: Callable[[Sequence[float]], float],
+                         niveau: float = 0.95, nb_tirages: int = 2000,
+                         graine: int = 0) -> Tuple[float, float]:
+    """Intervalle de confiance bootstrap (percentiles) d'une statistique."""
+    rng = random.Random(graine)
+    n = len(valeurs)
+    estimations = sorted(statistique([valeurs[rng.randrange(n)] for _ in range(n)])
+                         for _ in range(nb_tirages))
+    alpha = (1.0 - niveau) / 2.0
+    return (percentile(estimations, 100.0 * alpha), percentile(estimations, 100.0 * (1.0 - alpha)))
+
+
+def mann_whitney_plus_lent(actuel: Sequence[float], reference: Sequence[float]) -> float:
+    """
+    p-valeur unilatérale du test de Mann-Whitney (approximation normale avec
+    correction des ex-aequo) pour H1: 'actuel' est plus lent que 'reference'.
+    """
+    n1, n2 = len(actuel), len(reference)
+    tout = sorted([(v, 0) for v in actuel] + [(v, 1) for v in reference])
+    rangs = [0.0] * len(tout)
+    correction = 0.0
+    i = 0
+    while i < len(tout):
+        j = i
+        while j + 1 < len(tout) and tout[j + 1][0] == tout[i][0]:
+            j += 1
+        rang_moyen = (i + j) / 2.0 + 1.0
+        for k in range(i, j + 1):
+            rangs[k] = rang_moyen
+        t = j - i + 1
+        correction += t ** 3 - t
+        i = j + 1
+    r1 = sum(r for r, (_, groupe) in zip(rangs, tout) if groupe == 0)
+    u1 = r1 - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - correction / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u1 - n1 * n2 / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2.0))
+
+
+def mesurer(laby: PrimLabyrinthe, recherche: Callable, start, goal,
+            nb_echauffements: int = 3, nb_repetitions: int = 20,
+            preparation: Optional[Callable] = None) -> Tuple[List[float], int, Optional[int]]:
+    """
+    Chronomètre recherche(copie, start, goal) nb_repetitions fois après
+    nb_echauffements exécutions non mesurées. Chaque exécution travaille sur
+    une copie fraîche du labyrinthe (laby.copier()), faite hors mesure: une
+    exécution ne peut pas modifier la grille vue par la suivante.
+    preparation(copie): prétraitement éventuel, lui aussi hors mesure.
+    Retourne (temps en ms, nœuds explorés, longueur du chemin).
+    """
+    temps = []
+    noeuds, longueur = 0, None
+    gc_actif = gc.isenabled()
+    for k in range(nb_echauffements + nb_repetitions):
+        copie = laby.copier()
+        if preparation is not None:
+            preparation(copie)
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            chemin, noeuds = recherche(copie, start, goal)
+            t1 = time.perf_counter()
+        finally:
+            if gc_actif:
+                gc.enable()
+        if k >= nb_echauffements:
+            temps.append((t1 - t0) * 1000.0)
+        longueur = (len(chemin) - 1) if chemin else None
+    return temps, noeuds, longueur
+
+
+def resumer(temps: Sequence[float]) -> Dict[str, float]:
+    """Statistiques robustes d'une série de temps (ms)."""
+    ic_bas, ic_haut = intervalle_bootstrap(temps, statistics.median)
+    return {
+        'mediane': statistics.median(temps),
+        'moyenne': statistics.fmean(temps),
+        'ecart_type': statistics.stdev(temps) if len(temps) > 1 else 0.0,
+        'min': min(temps),
+        'p5': percentile(temps, 5),
+        'p25': percentile(temps, 25),
+        'p75': percentile(temps, 75),
+        'p95': percentile(temps, 95),
+        'ic95_mediane_bas': ic_bas,
+        'ic95_mediane_haut': ic_haut,
+    }
+
+
+def executer_benchmark(tailles: Sequence[int], algorithmes: Sequence[str] = ALGORITHMES_PAR_DEFAUT,
+                       nb_labyrinthes: int = 3, nb_echauffements: int = 3, nb_repetitions: int = 20,
+                       graine: int = 0, cout_max: Optional[int] = None) -> Dict[str, object]:
+    """
+    Mesure chaque algorithme sur nb_labyrinthes labyrinthes par taille
+    (graines déterministes, cf. execution_parallele.graine_tache) et
+    regroupe les temps par (algorithme, taille).
+    cout_max: labyrinthes avec terrain aléatoire (coûts 1..cout_max), pour
+    les moteurs pondérés de analyzer.ALGORITHMES_PONDERES.
+    """
+    mesures = []
+    for taille in tailles:
+        start, goal = (1, 1), (taille - 2, taille - 2)
+        labys = [generer_labyrinthe_test(graine, taille, i, cout_max) for i in range(nb_labyrinthes)]
+        for algo in algorithmes:
+            recherche = ALGORITHMES[algo] if algo in ALGORITHMES else ALGORITHMES_PONDERES[algo]
+            temps, noeuds_par_laby, longueurs = [], [], []
+            for laby in labys:
+                t, noeuds, longueur = mesurer(laby, recherche, start, goal,
+                                              nb_echauffements, nb_repetitions,
+                                              lambda copie: pretraiter(algo, copie))
+                temps.extend(t)
+                noeuds_par_laby.append(noeuds)
+                longueurs.append(longueur)
+            resume = resumer(temps)
+            mesures.append({
+                'algo': algo,
+                'taille': taille,
+                'echantillons': temps,
+                'noeuds': noeuds_par_laby,
+                'longueurs': longueurs,
+                **resume,
+            })
+            print(f"{algo:<20} {taille:>6} | médiane {resume['mediane']:9.3f} ms "
+                  f"[IC95 {resume['ic95_mediane_bas']:.3f}-{resume['ic95_mediane_haut']:.3f}] "
+                  f"p95 {resume['p95']:9.3f} ms")
+    return {
+        'format': FORMAT_VERSION,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'plateforme': platform.platform(),
+        'parametres': {
+            'tailles': list(tailles), 'algorithmes': list(algorithmes),
+            'nb_labyrinthes': nb_labyrinthes, 'nb_echauffements': nb_echauffements,
+            'nb_repetitions': nb_repetitions, 'graine': graine, 'cout_max': cout_max,
+        },
+        'mesures': mesures,
+    }
+
+
+def ecrire_json(resultats: Dict[str, object], chemin: str) -> None:
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump(resultats, f, indent=2, ensure_ascii=False)
+
+
+def ecrire_csv(resultats: Dict[str, object], chemin: str) -> None:
+    """Une ligne par (algorithme, taille), sans les échantillons bruts."""
+    colonnes = ['algo', 'taille', 'mediane', 'moyenne', 'ecart_type', 'min', 'p5', 'p25',
+                'p75', 'p95', 'ic95_mediane_bas', 'ic95_mediane_haut']
+    with open(chemin, 'w', encoding='utf-8', newline='') as f:
+        ecrivain = csv.DictWriter(f, fieldnames=colonnes, extrasaction='ignore')
+        ecrivain.writeheader()
+        for mesure in resultats['mesures']:
+            ecrivain.writerow(mesure)
+
+
+def comparer_reference(resultats: Dict[str, object], reference: Dict[str, object],
+                       alpha: float = 0.01, seuil: float = 0.05) -> List[Dict[str, object]]:
+    """
+    Compare chaque (algorithme, taille) à la référence. Une régression est
+    signalée si le test de Mann-Whitney conclut à un ralentissement
+    (p < alpha) ET si le rapport des médianes dépasse 1 + seuil (pour ne pas
+    signaler des écarts statistiquement réels mais négligeables).
+    """
+    index = {(m['algo'], m['taille']): m for m in reference['mesures']}
+    comparaisons = []
+    for mesure in resultats['mesures']:
+        ref = index.get((mesure['algo'], mesure['taille']))
+        if ref is None:
+            continue
+        rapport = mesure['mediane'] / ref['mediane'] if ref['mediane'] > 0 else float('inf')
+        p = mann_whitney_plus_lent(mesure['echantillons'], ref['echantillons'])
+        comparaisons.append({
+            'algo': mesure['algo'],
+            'taille': mesure['taille'],
+            'mediane_reference': ref['mediane'],
+            'mediane': mesure['mediane'],
+            'rapport': rapport,
+            'p_valeur': p,
+            'regression': p < alpha and rapport > 1.0 + seuil,
+        })
+    return comparaisons
+
+
+def afficher_comparaisons(comparaisons: List[Dict[str, object]]) -> None:
+    print()
+    header = f"{'Algorithme':<20} {'Taille':>6} {'Réf (ms)':>10} {'Actuel (ms)':>12} {'Rapport':>8} {'p':>8}"
+    print(header)
+    print("-" * (len(header) + 12))
+    for c in comparaisons:
+        drapeau = "  RÉGRESSION" if c['regression'] else ""
+        print(f"{c['algo']:<20} {c['taille']:>6} {c['mediane_reference']:>10.3f} "
+              f"{c['mediane']:>12.3f} {c['rapport']:>8.3f} {c['p_valeur']:>8.4f}{drapeau}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de BFS / A* sur labyrinthes de Prim")
+    parser.add_argument('--tailles', type=int, nargs='+', default=[51, 101, 201])
+    parser.add_argument('--algorithmes', nargs='+', default=list(ALGORITHMES_PAR_DEFAUT),
+                        choices=list(ALGORITHMES) + list(ALGORITHMES_PONDERES))
+    parser.add_argument('--labyrinthes', type=int, default=3, help="labyrinthes par taille")
+    parser.add_argument('--echauffements', type=int, default=3)
+    parser.add_argument('--repetitions', type=int, default=20)
+    parser.add_argument('--graine', type=int, default=0)
+    parser.add_argument('--cout-max', type=int,
+                        help="terrain aléatoire de coûts 1..COUT_MAX (moteurs pondérés)")
+    parser.add_argument('--json', help="fichier JSON de résultats")
+    parser.add_argument('--csv', help="fichier CSV de résumé")
+    parser.add_argument('--reference', help="fichier JSON de référence à comparer")
+    parser.add_argument('--alpha', type=float, default=0.01)
+    parser.add_argument('--seuil', type=float, default=0.05,
+                        help="ralentissement relatif minimal signalé (0.05 = 5%%)")
+    args = parser.parse_args()
+
+    resultats = executer_benchmark(args.tailles, args.algorithmes, args.labyrinthes,
+                                   args.echauffements, args.repetitions, args.graine, args.cout_max)
+    if args.json:
+        ecrire_json(resultats, args.json)
+    if args.csv:
+        ecrire_csv(resultats, args.csv)
+
+    if args.reference:
+        with open(args.reference, encoding='utf-8') as f:
+            reference = json.load(f)
+        comparaisons = comparer_reference(resultats, reference, args.alpha, args.seuil)
+        afficher_comparaisons(comparaisons)
+        if any(c['regression'] for c in comparaisons):
+            sys.exit(1)
@@ -0,0 +1,251 @@
+import itertools
+import random
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+Coord = Tuple[int, int]
+Resultat = Tuple[Optional[List[Coord]], int]
+
+# Modes de détection des modifications de la grille
+VERIFICATIONS = ("empreinte", "version")
+
+
+class CacheChemins:
+    """
+    Cache LRU borné de résultats de recherche de chemin, pour un solveur
+    donné (laby.bfs, astar_manhattan, ...).
+
+    Clé: (état du labyrinthe, départ, arrivée), où l'état vaut
+      - verification="empreinte": laby.empreinte(), hachage du contenu de la
+        grille (coût O(N²) en C par requête, détecte toute modification,
+        y compris les écritures directes dans laby.grille);
+      - verification="version": (jeton du labyrinthe, laby.version), gratuit
+        mais ne voit que les modifications faites via laby.modifier_cellule /
+        _generer. Le jeton est propre à chaque instance (pas id(laby), qu'un
+        labyrinthe créé après la destruction d'un autre peut reprendre).
+    Quand l'état d'un labyrinthe change, les entrées de l'ancien état sont
+    invalidées; celles d'un labyrinthe détruit le sont à l'appel suivant.
+
+    Réutilisation au-delà de la clé exacte:
+      - sens inverse: (arrivée, départ) renvoie le chemin retourné;
+      - sous-chemin: si départ et arrivée sont sur un chemin déjà en cache,
+        la portion entre eux est elle-même un plus court chemin.
+    La taille est bornée en nombre total de cases mémorisées (capacite).
+    Une réponse servie par le cache a explores = 0.
+    """
+
+    def __init__(self, solveur: Callable[..., Resultat], capacite: int = 1_000_000,
+                 verification: str = "empreinte"):
+        if verification not in VERIFICATIONS:
+            raise ValueError(f"Vérification inconnue: {verification!r} "
+                             f"(attendu: {', '.join(VERIFICATIONS)})")
+        self.solveur = solveur
+        self.capacite = capacite
+        self.verification = verification
+        self._entrees: "OrderedDict[tuple, Optional[Tuple[Coord, ...]]]" = OrderedDict()
+        # état -> clés de ses entrées: invalider un état ne parcourt que les siennes
+        self._cles_par_etat: Dict[object, Set[tuple]] = {}
+        # état -> case -> {clé d'entrée: position de la case dans le chemin}
+        self._index: Dict[object, Dict[Coord, Dict[tuple, int]]] = {}
+        # jeton unique par labyrinthe (clé faible) -> état courant
+        self._jetons: "weakref.WeakKeyDictionary[object, int]" = weakref.WeakKeyDictionary()
+        self._compteur_jetons = itertools.count()
+        self._etat_par_laby: Dict[int, object] = {}
+        # jetons des labyrinthes détruits, remplis par leur finaliseur: le
+        # ménage est fait hors du ramasse-miettes, au prochain appel
+        self._jetons_morts: List[int] = []
+        self.taille_courante = 0
+        self.succes = 0
+        self.succes_inverse = 0
+        self.succes_sous_chemin = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _signaler_mort(ref_cache: "weakref.ref[CacheChemins]", jeton: int) -> None:
+        cache = ref_cache()
+        if cache is not None:
+            cache._jetons_morts.append(jeton)
+
+    def _jeton(self, laby) -> int:
+        jeton = self._jetons.get(laby)
+        if jeton is None:
+            jeton = self._jetons[laby] = next(self._compteur_jetons)
+            weakref.finalize(laby, CacheChemins._signaler_mort, weakref.ref(self), jeton)
+        return jeton
+
+    def _oublier_morts(self) -> None:
+        """Oublie les labyrinthes détruits (et, en mode version, leurs entrées, devenues inaccessibles)."""
+        while self._jetons_morts:
+            etat = self._etat_par_laby.pop(self._jetons_morts.pop(), None)
+            if etat is not None and self.verification == "version":
+                self._invalider(etat)
+
+    def _etat(self, laby) -> object:
+        """État courant du labyrinthe; invalide l'ancien état s'il a changé."""
+        self._oublier_morts()
+        jeton = self._jeton(laby)
+        precedent = self._etat_par_laby.get(jeton)
+        if self.verification == "version":
+            etat = (jeton, laby.version)
+        else:
+            etat = laby.empreinte()
+        if precedent is not None and precedent != etat:
+            self._invalider(precedent)
+        self._etat_par_laby[jeton] = etat
+        return etat
+
+    def _invalider(self, etat: object) -> None:
+        cles = self._cles_par_etat.pop(etat, ())
+        for cle in list(cles):
+            self._retirer(cle)
+        self._index.pop(etat, None)
+        if cles:
+            self.invalidations += 1
+
+    def _retirer(self, cle: tuple) -> None:
+        chemin = self._entrees.pop(cle)
+        cles = self._cles_par_etat.get(cle[0])
+        if cles is not None:
+            cles.discard(cle)
+            if not cles:
+                del self._cles_par_etat[cle[0]]
+        if chemin is None:
+            self.taille_courante -= 1
+            return
+        self.taille_courante -= len(chemin)
+        index = self._index.get(cle[0])
+        if index is None:
+            return
+        for case in chemin:
+            positions = index.get(case)
+            if positions is not None:
+                positions.pop(cle, None)
+                if not positions:
+                    del index[case]
+
+    def _ajouter(self, cle: tuple, chemin: Optional[List[Coord]]) -> None:
+        if cle in self._entrees:
+            self._retirer(cle)
+        fige = tuple(chemin) if chemin is not None else None
+        self._entrees[cle] = fige
+        self._cles_par_etat.setdefault(cle[0], set()).add(cle)
+        self.taille_courante += len(fige) if fige is not None else 1
+        if fige is not None:
+            index = self._index.setdefault(cle[0], {})
+            for pos, case in enumerate(fige):
+                index.setdefault(case, {})[cle] = pos
+        while self.taille_courante > self.capacite and len(self._entrees) > 1:
+            self._retirer(next(iter(self._entrees)))
+            self.evictions += 1
+
+    def _chercher(self, etat: object, depart: Coord, arrivee: Coord) -> Optional[Tuple[Optional[List[Coord]]]]:
+        """Cherche une réponse en cache; None si absente, sinon (chemin,)."""
+        cle = (etat, depart, arrivee)
+        if cle in self._entrees:
+            self._entrees.move_to_end(cle)
+            self.succes += 1
+            chemin = self._entrees[cle]
+            return (list(chemin) if chemin is not None else None,)
+        inverse = (etat, arrivee, depart)
+        if inverse in self._entrees:
+            self._entrees.move_to_end(inverse)
+            self.succes_inverse += 1
+            chemin = self._entrees[inverse]
+            return (list(reversed(chemin)) if chemin is not None else None,)
+        index = self._index.get(etat)
+        if index is not None and depart in index and arrivee in index:
+            positions_arrivee = index[arrivee]
+            for cle_chemin, i in index[depart].items():
+                j = positions_arrivee.get(cle_chemin)
+                if j is not None:
+                    self._entrees.move_to_end(cle_chemin)
+                    self.succes_sous_chemin += 1
+                    chemin = self._entrees[cle_chemin]
+                    if i <= j:
+                        return (list(chemin[i:j + 1]),)
+                    return (list(reversed(chemin[j:i + 1])),)
+        return None
+
+    def chemin(self, laby, depart: Coord, arrivee: Coord) -> Resultat:
+        """Même contrat que le solveur: (chemin | None, explores)."""
+        etat = self._etat(laby)
+        trouve = self._chercher(etat, depart, arrivee)
+        if trouve is not None:
+            return trouve[0], 0
+
+        self.echecs += 1
+        version = laby.version
+        chemin, explores = self.solveur(laby, depart, arrivee)
+        if laby.version != version:
+            # le solveur a modifié la grille (A* ouvre départ/arrivée)
+            etat = self._etat(laby)
+        self._ajouter((etat, depart, arrivee), chemin)
+        return chemin, explores
+
+    def vider(self) -> None:
+        """Supprime toutes les entrées (les compteurs sont conservés)."""
+        self._entrees.clear()
+        self._cles_par_etat.clear()
+        self._index.clear()
+        self._etat_par_laby.clear()
+        self.taille_courante = 0
+
+    def statistiques(self) -> Dict[str, float]:
+        """Compteurs de succès/échecs et occupation du cache."""
+        total_succes = self.succes + self.succes_inverse + self.succes_sous_chemin
+        total = total_succes + self.echecs
+        return {
+            'succes': self.succes,
+            'succes_inverse': self.succes_inverse,
+            'succes_sous_chemin': self.succes_sous_chemin,
+            'echecs': self.echecs,
+            'taux_succes': (total_succes / total) if total else 0.0,
+            'entrees': len(self._entrees),
+            'cases': self.taille_courante,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+
+if __name__ == "__main__":
+    from PrimLabytinthe import PrimLabyrinthe
+
+    taille = 101
+    random.seed(0)
+    laby = PrimLabyrinthe(taille)
+    laby._generer()
+
+    cache = CacheChemins(lambda l, a, b: l.bfs(a, b), capacite=200_000)
+    rng = random.Random(1)
+    cellules = [(x, y) for x in range(1, taille, 2) for y in range(1, taille, 2)]
+    requetes = [(rng.choice(cellules), rng.choice(cellules)) for _ in range(50)]
+    requetes = requetes * 4 + [(b, a) for a, b in requetes]
+
+    t0 = time.perf_counter()
+    for a, b in requetes:
+        laby.bfs(a, b)
+    t1 = time.perf_counter()
+    for a, b in requetes:
+        cache.chemin(laby, a, b)
+    t2 = time.perf_counter()
+
+    print(f"{len(requetes)} requêtes: sans cache {(t1 - t0) * 1000.0:.1f} ms | "
+          f"avec cache {(t2 - t1) * 1000.0:.1f} ms")
+    for nom, valeur in cache.statistiques().items():
+        print(f"  {nom:<20} {valeur}")
+
+    # Écriture directe dans grille: le mode empreinte doit la voir, et la
+    # nouvelle recherche ne doit pas traverser le mur posé
+    from AStar_Manhattan import astar_manhattan
+    cache_astar = CacheChemins(astar_manhattan)
+    a, b = (1, 1), (taille - 2, taille - 2)
+    chemin, _ = cache_astar.chemin(laby, a, b)
+    x, y = chemin[len(chemin) // 2]
+    laby.grille[x][y] = 1
+    chemin_mur, explores = cache_astar.chemin(laby, a, b)
+    assert explores > 0 and (chemin_mur is None or (x, y) not in chemin_mur)
+    laby.grille[x][y] = 0
@@ -0,0 +1,140 @@
+import random
+import time
+from array import array
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
+
+Coord = Tuple[int, int]
+
+# Code de direction "pas de parent" (case non atteinte ou source)
+SANS_PARENT = 255
+
+
+class ChampDistances:
+    """
+    Résultat d'un BFS depuis une source: distance et direction du parent de
+    chaque case, dans deux tableaux plats indexés comme le tampon du
+    labyrinthe (laby.indice(x, y)):
+      - distances: array('i'), -1 si la case n'a pas été atteinte
+      - directions: bytearray, indice dans laby.decalages du pas qui mène à
+        la case depuis son parent (SANS_PARENT pour la source / non atteinte)
+    Les chemins ne sont reconstruits qu'à la demande (chemin()).
+    """
+
+    def __init__(self, laby, source: Coord, distances: array, directions: bytearray,
+                 explores: int, atteintes: Optional[List[Coord]] = None):
+        self.taille = laby.taille
+        self.largeur = laby.largeur
+        self.decalages = laby.decalages
+        self.source = source
+        self.distances = distances
+        self.directions = directions
+        self.explores = explores
+        # cibles atteintes, par distance croissante (bfs_multi_cibles)
+        self.atteintes = atteintes if atteintes is not None else []
+
+    def _indice(self, case: Coord) -> int:
+        return (case[0] + 1) * self.largeur + (case[1] + 1)
+
+    def distance(self, case: Coord) -> Optional[int]:
+        """Distance (en pas) depuis la source, None si la case n'est pas atteinte."""
+        d = self.distances[self._indice(case)]
+        return d if d >= 0 else None
+
+    def chemin(self, case: Coord) -> Optional[List[Coord]]:
+        """Chemin source -> case reconstruit en remontant les directions, ou None."""
+        i = self._indice(case)
+        if self.distances[i] < 0:
+            return None
+        W = self.largeur
+        decalages = self.decalages
+        directions = self.directions
+        chemin = [case]
+        while directions[i] != SANS_PARENT:
+            i -= decalages[directions[i]]
+            x, y = divmod(i, W)
+            chemin.append((x - 1, y - 1))
+        chemin.reverse()
+        return chemin
+
+    def resultat(self, case: Coord) -> Tuple[Optional[List[Coord]], int]:
+        """Même contrat que laby.bfs(source, case): (chemin, explores du parcours)."""
+        return self.chemin(case), self.explores
+
+
+def parcours_largeur(laby, source: Coord, cibles: Optional[Iterable[Coord]] = None,
+                     k: Optional[int] = None) -> ChampDistances:
+    """
+    BFS unique depuis 'source' sur le tampon plat du labyrinthe.
+    Sans cibles: parcours complet (champ de distances dense).
+    Avec cibles: arrêt dès que k d'entre elles ont été dépilées (toutes si k
+    est None); la liste des cibles atteintes est dans champ.atteintes.
+    """
+    cellules = laby.grille_lecture()
+    decalages = laby.decalages
+    n = len(cellules)
+    s = laby.indice(*source)
+
+    distances = array('i', [-1]) * n
+    directions = bytearray([SANS_PARENT]) * n
+    distances[s] = 0
+
+    reste = None
+    marques = None
+    atteintes: List[Coord] = []
+    if cibles is not None:
+        marques = set(laby.indice(*c) for c in cibles)
+        reste = len(marques) if k is None else min(k, len(marques))
+        if reste == 0:
+            return ChampDistances(laby, source, distances, directions, 0, atteintes)
+
+    queue = deque([s])
+    explores = 0
+    codes = tuple(enumerate(decalages))
+    while queue:
+        i = queue.popleft()
+        explores += 1
+        if marques is not None and i in marques:
+            atteintes.append(laby.coord(i))
+            reste -= 1
+            if reste == 0:
+                break
+        di = distances[i] + 1
+        for c, d in codes:
+            j = i + d
+            if cellules[j] == 0 and distances[j] < 0:
+                distances[j] = di
+                directions[j] = c
+                queue.append(j)
+
+    return ChampDistances(laby, source, distances, directions, explores, atteintes)
+
+
+if __name__ == "__main__":
+    from PrimLabytinthe import PrimLabyrinthe
+
+    taille = 201
+    random.seed(0)
+    laby = PrimLabyrinthe(taille, stockage="bytearray")
+    laby._generer()
+
+    start = (1, 1)
+    rng = random.Random(1)
+    cellules_ouvertes = [(x, y) for x in range(1, taille, 2) for y in range(1, taille, 2)]
+    buts = rng.sample(cellules_ouvertes, 200)
+
+    t0 = time.perf_counter()
+    for but in buts:
+        laby.bfs(start, but)
+    t1 = time.perf_counter()
+    champ = laby.distances_depuis(start)
+    longueurs = [len(champ.chemin(but)) - 1 for but in buts]
+    t2 = time.perf_counter()
+    proche = laby.bfs_multi_cibles(start, buts, k=1)
+    t3 = time.perf_counter()
+
+    print(f"{len(buts)} buts depuis {start} sur {taille}x{taille}")
+    print(f"  BFS répétés       : {(t1 - t0) * 1000.0:10.2f} ms")
+    print(f"  champ + chemins   : {(t2 - t1) * 1000.0:10.2f} ms (longueur moyenne {sum(longueurs) / len(longueurs):.1f})")
+    print(f"  but le plus proche: {proche.atteintes[0]} à {proche.distance(proche.atteintes[0])} pas "
+          f"({proche.explores} nœuds explorés, {(t3 - t2) * 1000.0:.2f} ms)")
@@ -0,0 +1,148 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, Optional
+
+from serveur_chemins import ServeurChemins, _centile, _lire_spec
+
+
+class Connexion:
+    """Connexion au serveur de chemins: une requête à la fois (client en boucle fermée)."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._id = 0
+
+    @classmethod
+    async def ouvrir(cls, hote: str, port: int, unix: Optional[str] = None) -> "Connexion":
+        if unix is not None:
+            reader, writer = await asyncio.open_unix_connection(unix)
+        else:
+            reader, writer = await asyncio.open_connection(hote, port)
+        return cls(reader, writer)
+
+    async def requete(self, **message) -> Dict:
+        self._id += 1
+        message['id'] = self._id
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        reponse = json.loads(await self.reader.readline())
+        if 'erreur' in reponse:
+            raise RuntimeError(reponse['erreur'])
+        return reponse
+
+    async def fermer(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def generer_charge(hote: str, port: int, unix: Optional[str], nom: str, nb_connexions: int,
+                         nb_requetes: int, nb_sources: int, graine: int) -> Dict[str, object]:
+    """
+    Envoie nb_requetes requêtes de chemin réparties sur nb_connexions
+    clients concurrents. Les départs sont tirés parmi nb_sources cellules
+    (petit nombre: beaucoup de requêtes partagent une source, ce que les
+    micro-lots exploitent), les arrivées parmi toutes les cellules.
+    Retourne latences client (ms), débit et métriques du serveur.
+    """
+    rng = random.Random(graine)
+    controle = await Connexion.ouvrir(hote, port, unix)
+    taille = (await controle.requete(op='labyrinthes'))[nom]['taille']
+    cellules = [(x, y) for x in range(1, taille - 1, 2) for y in range(1, taille - 1, 2)]
+    sources = rng.sample(cellules, min(nb_sources, len(cellules)))
+    requetes = [(rng.choice(sources), rng.choice(cellules)) for _ in range(nb_requetes)]
+    avant = await controle.requete(op='metriques')
+
+    latences: List[float] = []
+    suivante = 0
+
+    async def client():
+        nonlocal suivante
+        connexion = await Connexion.ouvrir(hote, port, unix)
+        try:
+            while suivante < len(requetes):
+                depart, arrivee = requetes[suivante]
+                suivante += 1
+                t0 = time.perf_counter()
+                await connexion.requete(op='chemin', labyrinthe=nom, depart=depart, arrivee=arrivee)
+                latences.append((time.perf_counter() - t0) * 1000.0)
+        finally:
+            await connexion.fermer()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(nb_connexions)))
+    duree = time.perf_counter() - t0
+    apres = await controle.requete(op='metriques')
+    await controle.fermer()
+
+    lots = apres['lots'] - avant['lots']
+    recherches = apres['recherches'] - avant['recherches']
+    return {
+        'requetes': len(latences),
+        'duree_s': duree,
+        'debit_req_s': len(latences) / duree if duree > 0 else 0.0,
+        'latence_p50_ms': _centile(latences, 0.50),
+        'latence_p95_ms': _centile(latences, 0.95),
+        'latence_p99_ms': _centile(latences, 0.99),
+        'requetes_par_lot': len(latences) / lots if lots else None,
+        'requetes_par_recherche': len(latences) / recherches if recherches else None,
+        'explores': apres['explores'] - avant['explores'],
+    }
+
+
+def afficher(titre: str, resultat: Dict[str, object]) -> None:
+    print(f"{titre:<22} {resultat['debit_req_s']:>10.0f} {resultat['latence_p50_ms']:>10.2f} "
+          f"{resultat['latence_p95_ms']:>10.2f} {resultat['latence_p99_ms']:>10.2f} "
+          f"{resultat['requetes_par_recherche']:>12.2f} {resultat['explores']:>12}")
+
+
+async def comparer_local(spec, args) -> None:
+    """Lance le serveur dans ce processus, sans puis avec micro-lots, et mesure les deux."""
+    header = (f"{'Serveur':<22} {'Req/s':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10} "
+              f"{'Req/BFS':>12} {'Explorés':>12}")
+    print(header)
+    print("-" * len(header))
+    for titre, fenetre_ms, lot_max in (("sans micro-lots", 0.0, 1),
+                                       (f"micro-lots {args.fenetre_ms} ms", args.fenetre_ms, args.lot_max)):
+        serveur = ServeurChemins({args.nom: spec}, args.processus, fenetre_ms, lot_max)
+        ecoute = await asyncio.start_server(serveur._connexion, "127.0.0.1", 0)
+        port = ecoute.sockets[0].getsockname()[1]
+        try:
+            # échauffement: démarrage du pool et chargement du labyrinthe dans les processus
+            await generer_charge("127.0.0.1", port, None, args.nom, args.connexions,
+                                 min(200, args.requetes), args.sources, args.graine + 1)
+            resultat = await generer_charge("127.0.0.1", port, None, args.nom, args.connexions,
+                                            args.requetes, args.sources, args.graine)
+        finally:
+            ecoute.close()
+            await ecoute.wait_closed()
+            serveur.fermer()
+        afficher(titre, resultat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Générateur de charge pour serveur_chemins")
+    parser.add_argument('--hote', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="socket Unix du serveur")
+    parser.add_argument('--nom', default="principal", help="labyrinthe interrogé")
+    parser.add_argument('--connexions', type=int, default=32)
+    parser.add_argument('--requetes', type=int, default=2000)
+    parser.add_argument('--sources', type=int, default=8, help="nombre de départs distincts")
+    parser.add_argument('--graine', type=int, default=0)
+    parser.add_argument('--local', metavar="TAILLE:GRAINE",
+                        help="lancer le serveur dans ce processus et comparer avec/sans micro-lots")
+    parser.add_argument('--processus', type=int, default=None, help="(--local) taille du pool")
+    parser.add_argument('--fenetre-ms', type=float, default=2.0, help="(--local)")
+    parser.add_argument('--lot-max', type=int, default=256, help="(--local)")
+    args = parser.parse_args()
+
+    if args.local:
+        _, spec = _lire_spec(f"{args.nom}={args.local}")
+        asyncio.run(comparer_local(spec, args))
+    else:
+        resultat = asyncio.run(generer_charge(args.hote, args.port, args.unix, args.nom, args.connexions,
+                                              args.requetes, args.sources, args.graine))
+        print(json.dumps(resultat, indent=2))
@@ -0,0 +1,172 @@
+import itertools
+import random
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PrimLabytinthe import PrimLabyrinthe
+from AStar_Manhattan import astar_manhattan
+
+Coord = Tuple[int, int]
+
+
+class Elagage:
+    """
+    Remplissage des culs-de-sac, en temps linéaire sur le tampon plat: une
+    case ouverte de degré <= 1 qui n'est pas un point d'intérêt est
+    retirée (devient un mur), ce qui peut faire tomber le degré de sa
+    voisine, retirée à son tour, et ainsi de suite. Chaque case est
+    retirée au plus une fois et chaque retrait ne touche que ses 4
+    voisines: O(nombre de cases).
+
+    Une case retirée n'était sur aucun chemin simple entre deux points
+    d'intérêt: tous les plus courts chemins entre eux sont conservés, et
+    les recherches (laby.bfs, astar_manhattan...) sur le labyrinthe réduit
+    donnent les mêmes longueurs en explorant beaucoup moins.
+
+    - points: cases d'intérêt (départs/arrivées des requêtes). Dans un
+      labyrinthe parfait, il ne reste que l'arbre qui les relie; les
+      composantes sans aucun point d'intérêt sont aussi retirées.
+    - points None: seuls les culs-de-sac sont comblés, il reste les
+      cycles et ce qui les relie (rien dans un labyrinthe parfait, où tout
+      est cul-de-sac).
+
+    Résultats: self.masque (tampon plat, 1 = case retirée), self.reduit
+    (copie du labyrinthe où ces cases sont des murs, cherchable
+    directement) et statistiques(). Instantané: si la grille change, il
+    faut élaguer de nouveau.
+    """
+
+    def __init__(self, laby: PrimLabyrinthe, points: Optional[Iterable[Coord]] = None):
+        t0 = time.perf_counter()
+        self.laby = laby
+        cel = laby.grille_plate()
+        n = len(cel)
+        W = laby.largeur
+        d0, d1, d2, d3 = laby.decalages
+
+        self.points: List[Coord] = list(points) if points is not None else []
+        protege = bytearray(n)
+        for x, y in self.points:
+            i = laby.indice(x, y)
+            if cel[i] != 0:
+                raise ValueError(f"Point d'intérêt {(x, y)} sur un mur")
+            protege[i] = 1
+
+        # 1) degrés des cases ouvertes; culs-de-sac de départ
+        degre = bytearray(n)
+        pile = []
+        nb_ouvertes = 0
+        for i in range(W, n - W):
+            if cel[i] != 0:
+                continue
+            nb_ouvertes += 1
+            d = (cel[i + d0] == 0) + (cel[i + d1] == 0) + (cel[i + d2] == 0) + (cel[i + d3] == 0)
+            degre[i] = d
+            if d <= 1 and not protege[i]:
+                pile.append(i)
+
+        # 2) remplissage: une case retirée fait baisser le degré de ses voisines
+        masque = bytearray(n)
+        retirees = []
+        while pile:
+            i = pile.pop()
+            if masque[i]:
+                continue
+            masque[i] = 1
+            retirees.append(i)
+            for j in (i + d0, i + d1, i + d2, i + d3):
+                if cel[j] == 0 and not masque[j]:
+                    degre[j] -= 1
+                    if degre[j] <= 1 and not protege[j]:
+                        pile.append(j)
+
+        # 3) avec des points d'intérêt: composantes qui n'en contiennent aucun
+        # (cycles isolés, que le remplissage ne peut pas retirer)
+        if self.points:
+            atteint = bytearray(protege)
+            file = deque(i for i in range(n) if protege[i])
+            while file:
+                i = file.popleft()
+                for j in (i + d0, i + d1, i + d2, i + d3):
+                    if cel[j] == 0 and not masque[j] and not atteint[j]:
+                        atteint[j] = 1
+                        file.append(j)
+            for i in range(W, n - W):
+                if cel[i] == 0 and not masque[i] and not atteint[i]:
+                    masque[i] = 1
+                    retirees.append(i)
+        self.masque = masque
+        self.nb_ouvertes = nb_ouvertes
+        self.nb_retirees = len(retirees)
+        self.duree_elagage_ms = (time.perf_counter() - t0) * 1000.0
+
+        # 4) labyrinthe réduit: copie où les cases retirées sont des murs
+        t1 = time.perf_counter()
+        reduit = laby.copier()
+        if reduit.cellules is not None:
+            cellules = reduit.cellules
+            for i in retirees:
+                cellules[i] = 1
+            if retirees:
+                reduit.version += 1
+        else:
+            coord = laby.coord
+            for i in retirees:
+                reduit.modifier_cellule(*coord(i), 1)
+        self.reduit = reduit
+        self.duree_copie_ms = (time.perf_counter() - t1) * 1000.0
+
+    def conserve(self, case: Coord) -> bool:
+        """Vrai si la case est ouverte et n'a pas été retirée (cherchable dans self.reduit)."""
+        i = self.laby.indice(*case)
+        return self.laby.grille_lecture()[i] == 0 and not self.masque[i]
+
+    def statistiques(self) -> Dict[str, float]:
+        """Taille de l'espace de recherche avant/après élagage."""
+        conservees = self.nb_ouvertes - self.nb_retirees
+        return {
+            'cases_ouvertes': self.nb_ouvertes,
+            'cases_conservees': conservees,
+            'cases_retirees': self.nb_retirees,
+            'fraction_retiree': self.nb_retirees / self.nb_ouvertes if self.nb_ouvertes else 0.0,
+            'reduction': self.nb_ouvertes / conservees if conservees else 0.0,
+            'duree_elagage_ms': self.duree_elagage_ms,
+            'duree_copie_ms': self.duree_copie_ms,
+        }
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    header = (f"{'Grille':<18} {'Points':>7} {'Conservées':>11} {'Réduction':>10} {'Élagage (ms)':>13} "
+              f"{'BFS':>20} {'A* Manhattan':>20}")
+    print(header)
+    print("-" * len(header))
+    for taille, tresse in ((501, False), (1001, False), (1001, True)):
+        laby = PrimLabyrinthe(taille, stockage="bytearray", seed=taille)
+        laby._generer("rapide")
+        if tresse:
+            # ouvrir 10% des murs internes: des cycles que l'élagage doit garder
+            for x in range(1, taille - 1):
+                for y in range(1, taille - 1):
+                    if (x + y) % 2 == 1 and rng.random() < 0.1:
+                        laby.modifier_cellule(x, y, 0)
+        cellules = [(x, y) for x in range(1, taille - 1, 2) for y in range(1, taille - 1, 2)]
+        for nb_points in (2, 8):
+            points = rng.sample(cellules, nb_points)
+            elagage = Elagage(laby, points)
+            st = elagage.statistiques()
+            # toutes les paires de points: explorés (complet -> réduit), longueurs identiques
+            totaux = {'BFS': [0, 0], 'A* Manhattan': [0, 0]}
+            for a, b in itertools.combinations(points, 2):
+                for nom, recherche in (('BFS', lambda l, s, g: l.bfs(s, g)), ('A* Manhattan', astar_manhattan)):
+                    chemin, explores = recherche(laby, a, b)
+                    chemin_r, explores_r = recherche(elagage.reduit, a, b)
+                    assert len(chemin) == len(chemin_r)
+                    totaux[nom][0] += explores
+                    totaux[nom][1] += explores_r
+            titre = f"{taille}x{taille}{' tressé' if tresse else ''}"
+            colonnes = ' '.join(f"{f'{complet} → {reduit}':>20}" for complet, reduit in totaux.values())
+            print(f"{titre:<18} {nb_points:>7} {st['cases_conservees']:>11} {st['reduction']:>9.1f}x "
+                  f"{st['duree_elagage_ms']:>13.1f} {colonnes}")
+    print("\nBFS / A*: nœuds explorés sur toutes les paires de points, labyrinthe complet → réduit")
@@ -0,0 +1,317 @@
+import random
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import format_labyrinthe
+
+Coord = Tuple[int, int]
+
+
+def lignes_eller(largeur: int, hauteur: int, seed: Optional[int] = None,
+                 rng: Optional[random.Random] = None) -> Iterator[bytes]:
+    """
+    Génère un labyrinthe parfait ligne par ligne (algorithme d'Eller), en
+    mémoire O(largeur) quelle que soit la hauteur.
+
+    Même représentation que PrimLabyrinthe._generer: chaque ligne est un
+    bytes de 'largeur' octets (1 mur, 0 passage), les cellules sont aux
+    coordonnées impaires à l'intérieur des bords, les passages entre deux
+    cellules aux coordonnées paire/impaire entre elles. Les lignes sont
+    produites dans l'ordre x = 0 .. hauteur-1.
+
+    Pour chaque ligne de cellules, les cellules voisines d'ensembles
+    différents sont fusionnées au hasard, puis chaque ensemble descend par
+    au moins une cellule vers la ligne suivante; la dernière ligne fusionne
+    tous les ensembles restants. Aucun passage ne relie deux cellules d'un
+    même ensemble: le résultat est un arbre couvrant.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+    N, H = largeur, hauteur
+    m = max((N - 1) // 2, 0)          # cellules par ligne
+    mh = max((H - 1) // 2, 0)         # lignes de cellules
+    mur = bytes(b"\x01") * N
+    if H >= 1:
+        yield mur
+    if m == 0 or mh == 0:
+        for _ in range(H - 1):
+            yield mur
+        return
+
+    etiquettes = list(range(m))       # ensemble de chaque cellule de la ligne courante
+    prochaine = m
+    for r in range(mh):
+        derniere = r == mh - 1
+        ligne = bytearray(mur)
+        for k in range(m):
+            ligne[2 * k + 1] = 0
+
+        # fusions horizontales (union-find sur les étiquettes de la ligne)
+        parent: Dict[int, int] = {}
+
+        def racine(e):
+            while e in parent:
+                e = parent[e]
+            return e
+
+        tirages = rng.getrandbits(m)
+        for k in range(m - 1):
+            a, b = racine(etiquettes[k]), racine(etiquettes[k + 1])
+            if a != b and (derniere or (tirages >> k) & 1):
+                parent[b] = a
+                ligne[2 * k + 2] = 0
+        etiquettes = [racine(e) for e in etiquettes]
+        yield bytes(ligne)
+
+        if derniere:
+            break
+        # descentes: au moins une cellule par ensemble
+        ligne = bytearray(mur)
+        tirages = rng.getrandbits(m)
+        par_ensemble: Dict[int, List[int]] = {}
+        for k, e in enumerate(etiquettes):
+            par_ensemble.setdefault(e, []).append(k)
+        suivantes = [-1] * m
+        for e, membres in par_ensemble.items():
+            descend = [k for k in membres if (tirages >> k) & 1]
+            if not descend:
+                descend = [membres[rng.randrange(len(membres))]]
+            for k in descend:
+                suivantes[k] = e
+                ligne[2 * k + 1] = 0
+        # nouvelles étiquettes pour les cellules qui ne descendent pas
+        for k in range(m):
+            if suivantes[k] < 0:
+                suivantes[k] = prochaine
+                prochaine += 1
+        etiquettes = suivantes
+        yield bytes(ligne)
+
+    for _ in range(H - 2 * mh):
+        yield mur
+
+
+def ecrire_lignes(lignes: Iterable[bytes], fichier: str) -> int:
+    """Écrit un flux de lignes tel quel (un octet par case); retourne le nombre de lignes."""
+    n = 0
+    with open(fichier, "wb") as f:
+        for ligne in lignes:
+            f.write(ligne)
+            n += 1
+    return n
+
+
+def ecrire_plab(lignes: Iterable[bytes], fichier: str, taille: int, seed: Optional[int] = None) -> int:
+    """
+    Écrit un flux de lignes carré (taille×taille) au format .plab
+    (format_labyrinthe) sans jamais tenir la grille en mémoire: chaque ligne
+    de cellules est encodée dès que la ligne de murs qui la suit arrive.
+    Retourne la taille du fichier.
+    """
+    m = max((taille - 1) // 2, 0)
+    drapeaux = 0
+    if isinstance(seed, int):
+        drapeaux |= format_labyrinthe.DRAPEAU_GRAINE
+    with open(fichier, "wb") as f:
+        f.write(format_labyrinthe.EN_TETE.pack(format_labyrinthe.MAGIE, format_labyrinthe.VERSION,
+                                               drapeaux, taille, seed if isinstance(seed, int) else 0, 0))
+        reste = 0       # bits en attente (moins d'un octet)
+        nb_reste = 0
+        precedente = None
+        for x, ligne in enumerate(lignes):
+            if len(ligne) != taille:
+                raise ValueError(f"Ligne {x}: {len(ligne)} cases au lieu de {taille}")
+            if x % 2 == 0 and precedente is not None and (x - 1) // 2 < m:
+                sortie = bytearray()
+                for k in range(m):
+                    y = 2 * k + 1
+                    if k + 1 < m and precedente[y + 1] == 0:
+                        reste |= 1 << nb_reste
+                    if (x - 1) // 2 + 1 < m and ligne[y] == 0:
+                        reste |= 1 << (nb_reste + 1)
+                    nb_reste += 2
+                    if nb_reste == 8:
+                        sortie.append(reste)
+                        reste, nb_reste = 0, 0
+                f.write(sortie)
+            precedente = ligne
+        if nb_reste:
+            f.write(bytes([reste]))
+        return f.tell()
+
+
+class BFSFlux:
+    """
+    Consommateur en flux d'un labyrinthe parfait: reçoit les lignes une à
+    une (ajouter_ligne, puis terminer) et connaît la distance source -> cible
+    dès que les deux sont reliées, sans jamais stocker la grille.
+
+    Comme le labyrinthe est un arbre, le chemin entre deux cases déjà
+    reliées par les lignes reçues est LE chemin final: une distance connue
+    ne change plus. L'état est une forêt compressée:
+      - une ligne n'est traitée qu'à l'arrivée de la suivante; elle ne crée
+        de nœuds qu'aux cases utiles (passage vers la ligne du dessus ou du
+        dessous, source, cible), reliées le long de chaque segment ouvert
+        par une arête pondérée par leur écart;
+      - les nœuds qui ne sont ni des passages vers la ligne suivante ni la
+        source/cible sont ensuite supprimés (degré 1: impasse) ou remplacés
+        par une arête (degré 2).
+    Il reste moins de deux nœuds par passage ouvert vers la ligne suivante:
+    mémoire O(largeur).
+    """
+
+    def __init__(self, source: Coord, cible: Optional[Coord] = None):
+        self.source = source
+        self.cible = cible
+        self.voisins: Dict[int, Dict[int, int]] = {}
+        # colonne -> (nœud, distance du nœud à la case): passages vers la ligne en attente
+        self._portes: Dict[int, Tuple[int, int]] = {}
+        self._attente: Optional[bytes] = None
+        self._gardes = set()                 # nœuds source/cible, jamais supprimés
+        self._noeud_source = None
+        self._noeud_cible = None
+        self._prochain = 0
+        self.x = -1                          # indice de la dernière ligne traitée
+        self.distance_cible: Optional[int] = None
+        self.ligne_resolution: Optional[int] = None
+        self.pic_noeuds = 0
+
+    def _nouveau(self) -> int:
+        v = self._prochain
+        self._prochain += 1
+        self.voisins[v] = {}
+        return v
+
+    def _relier(self, a: int, b: int, poids: int) -> None:
+        if b in self.voisins[a]:
+            raise ValueError("Cycle détecté: BFSFlux demande un labyrinthe parfait")
+        self.voisins[a][b] = poids
+        self.voisins[b][a] = poids
+
+    def ajouter_ligne(self, ligne: bytes) -> None:
+        """Reçoit la ligne suivante; la ligne précédente est traitée maintenant."""
+        if self._attente is not None:
+            self._traiter(self._attente, ligne)
+        self._attente = ligne
+
+    def terminer(self) -> None:
+        """Traite la dernière ligne reçue (aucune ligne ne suit)."""
+        if self._attente is not None:
+            self._traiter(self._attente, None)
+            self._attente = None
+
+    def _traiter(self, ligne: bytes, suivante: Optional[bytes]) -> None:
+        self.x += 1
+        x = self.x
+        dessus = self._portes
+        portes: Dict[int, Tuple[int, int]] = {}
+        crees = []
+        speciaux = [y for (sx, y) in (self.source, self.cible or (-1, -1)) if sx == x]
+
+        y, N = 0, len(ligne)
+        while y < N:
+            if ligne[y] != 0:
+                y += 1
+                continue
+            debut = y
+            while y < N and ligne[y] == 0:
+                y += 1
+            if y - debut == 1 and debut in dessus and debut not in speciaux:
+                # passage vertical isolé: pas de nœud, le poids s'accumule
+                if suivante is not None and suivante[debut] == 0:
+                    v, p = dessus[debut]
+                    portes[debut] = (v, p + 1)
+                continue
+            # segment ouvert [debut, y): cases utiles dans l'ordre
+            precedent, y_precedent = None, 0
+            for c in range(debut, y):
+                haut = c in dessus
+                bas = suivante is not None and suivante[c] == 0
+                if not (haut or bas or c in speciaux):
+                    continue
+                v = self._nouveau()
+                crees.append(v)
+                if precedent is not None:
+                    self._relier(precedent, v, c - y_precedent)
+                precedent, y_precedent = v, c
+                if haut:
+                    u, p = dessus[c]
+                    self._relier(u, v, p + 1)
+                if bas:
+                    portes[c] = (v, 0)
+                if (x, c) == self.source:
+                    self._noeud_source = v
+                    self._gardes.add(v)
+                if (x, c) == self.cible:
+                    self._noeud_cible = v
+                    self._gardes.add(v)
+
+        self._portes = portes
+        self._compresser([v for v, _ in dessus.values()] + crees)
+        self.pic_noeuds = max(self.pic_noeuds, len(self.voisins))
+        if self.distance_cible is None and self._noeud_cible is not None and self._noeud_source is not None:
+            d = self._distances_source().get(self._noeud_cible)
+            if d is not None:
+                self.distance_cible = d
+                self.ligne_resolution = x
+
+    def _compresser(self, candidats: Iterable[int]) -> None:
+        terminaux = {v for v, _ in self._portes.values()} | self._gardes
+        pile = [v for v in candidats if v not in terminaux]
+        voisins = self.voisins
+        while pile:
+            v = pile.pop()
+            adj = voisins.get(v)
+            if adj is None or v in terminaux:
+                continue
+            if len(adj) <= 1:
+                for u in adj:
+                    del voisins[u][v]
+                    pile.append(u)
+                del voisins[v]
+            elif len(adj) == 2:
+                (a, pa), (b, pb) = adj.items()
+                del voisins[a][v]
+                del voisins[b][v]
+                del voisins[v]
+                self._relier(a, b, pa + pb)
+
+    def _distances_source(self) -> Dict[int, int]:
+        """Distances depuis la source dans la forêt compressée (parcours de sa composante)."""
+        if self._noeud_source is None or self._noeud_source not in self.voisins:
+            return {}
+        distances = {self._noeud_source: 0}
+        pile = [self._noeud_source]
+        while pile:
+            v = pile.pop()
+            dv = distances[v]
+            for u, p in self.voisins[v].items():
+                if u not in distances:
+                    distances[u] = dv + p
+                    pile.append(u)
+        return distances
+
+
+def vers_labyrinthe(taille: int, seed: Optional[int] = None, stockage: str = "bytearray"):
+    """PrimLabyrinthe carré rempli par lignes_eller (vérification, affichage)."""
+    from PrimLabytinthe import PrimLabyrinthe
+    laby = PrimLabyrinthe(taille, stockage=stockage, seed=seed)
+    laby._generer("eller")
+    return laby
+
+
+if __name__ == "__main__":
+    largeur, hauteur = 1001, 20001
+    source = (1, 1)
+    cible = (hauteur - 2, largeur - 2)
+
+    t0 = time.perf_counter()
+    flux = BFSFlux(source, cible)
+    for ligne in lignes_eller(largeur, hauteur, seed=0):
+        flux.ajouter_ligne(ligne)
+    flux.terminer()
+    t1 = time.perf_counter()
+    print(f"Labyrinthe d'Eller {hauteur}x{largeur} généré et parcouru en flux: {(t1 - t0):.2f} s")
+    print(f"  distance {source} -> {cible}: {flux.distance_cible} "
+          f"(connue à la ligne {flux.ligne_resolution})")
+    print(f"  pic de nœuds de l'état: {flux.pic_noeuds} (largeur {largeur})")
@@ -0,0 +1,94 @@
+import gc
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from PrimLabytinthe import PrimLabyrinthe
+
+# Une tâche = (taille, index du test, nom de l'algorithme, graine globale
+# [, instrumenter: relever aussi les compteurs de recherche
+#  [, cout_max: terrain aléatoire et moteurs pondérés]])
+Tache = Union[Tuple[int, int, str, int], Tuple[int, int, str, int, bool],
+              Tuple[int, int, str, int, bool, Optional[int]]]
+
+
+def graine_tache(graine: int, taille: int, index_test: int) -> int:
+    """
+    Graine du labyrinthe d'un test, déterministe et indépendante de l'ordre
+    d'exécution: tous les algorithmes d'un même (taille, test) voient le
+    même labyrinthe, quel que soit le processus qui les exécute.
+    """
+    return ((graine * 1_000_003 + taille) * 1_000_003 + index_test) % (1 << 63)
+
+
+def generer_labyrinthe_test(graine: int, taille: int, index_test: int,
+                            cout_max: Optional[int] = None) -> PrimLabyrinthe:
+    """
+    Labyrinthe du test (taille, index_test) pour la graine globale donnée,
+    avec un terrain aléatoire de coûts 1..cout_max si cout_max est donné.
+    """
+    laby = PrimLabyrinthe(taille, seed=graine_tache(graine, taille, index_test))
+    laby._generer()
+    if cout_max:
+        from terrain import terrain_aleatoire
+        terrain_aleatoire(laby, cout_max, rng=laby.rng)
+    return laby
+
+
+def executer_tache(tache: Tache) -> Dict[str, object]:
+    """
+    Exécute une tâche dans le processus courant: génère le labyrinthe (hors
+    chronométrage) puis mesure l'algorithme seul, ramasse-miettes désactivé
+    pendant la mesure pour qu'une collecte ne tombe pas dans le temps mesuré.
+    """
+    from analyzer import (ALGORITHMES, ALGORITHMES_INSTRUMENTES, ALGORITHMES_PONDERES,
+                          mesurer_compteurs, pretraiter)
+    from terrain import cout_chemin
+
+    taille, index_test, algo, graine = tache[:4]
+    instrumenter, cout_max = (tuple(tache[4:]) + (False, None))[:2]
+    laby = generer_labyrinthe_test(graine, taille, index_test, cout_max)
+    start = (1, 1)
+    goal = (taille - 2, taille - 2)
+    recherche = ALGORITHMES_PONDERES[algo] if cout_max else ALGORITHMES[algo]
+    pretraiter(algo, laby)
+
+    gc.collect()
+    gc_actif = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        chemin, noeuds = recherche(laby, start, goal)
+        t1 = time.perf_counter()
+    finally:
+        if gc_actif:
+            gc.enable()
+    compteurs = None
+    if instrumenter and algo in ALGORITHMES_INSTRUMENTES:
+        compteurs = mesurer_compteurs(algo, laby, start, goal)
+
+    return {
+        'taille': taille,
+        'test': index_test,
+        'algo': algo,
+        'temps': (t1 - t0) * 1000.0,
+        'noeuds': noeuds,
+        'longueur': (cout_chemin(laby, chemin) if cout_max else len(chemin) - 1) if chemin else None,
+        'pid': os.getpid(),
+        'compteurs': compteurs,
+    }
+
+
+def executer_taches(taches: Iterable[Tache], nb_processus: Optional[int] = None) -> List[Dict[str, object]]:
+    """
+    Répartit les tâches sur un pool de processus (nb_processus=None: un par
+    cœur). Les résultats sont renvoyés dans l'ordre des tâches. Chaque
+    processus n'exécute qu'une mesure à la fois (chunksize=1).
+    """
+    taches = list(taches)
+    if nb_processus == 1:
+        return [executer_tache(t) for t in taches]
+    # import différé: les processus de travail n'en ont pas besoin
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=nb_processus) as pool:
+        return list(pool.map(executer_tache, taches, chunksize=1))
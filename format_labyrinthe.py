@@ -0,0 +1,277 @@
+import mmap
+import os
+import struct
+import time
+import random
+from typing import Dict, Optional
+
+from PrimLabytinthe import PrimLabyrinthe
+
+# Format de fichier .plab (petit-boutiste):
+#   en-tête  : magie "PLAB", version u16, drapeaux u16, taille u32, graine i64,
+#              nombre de sections u32                               (24 octets)
+#   murs     : 2 bits par cellule (x, y impairs), cellules ligne par ligne:
+#              bit 2c   = passage ouvert vers l'est  (case (x, y+1))
+#              bit 2c+1 = passage ouvert vers le sud (case (x+1, y))
+#   sections : suite de (étiquette 4 octets, longueur u64, données), pour des
+#              données annexes attachées au labyrinthe
+MAGIE = b"PLAB"
+VERSION = 1
+EN_TETE = struct.Struct("<4sHHIqI")
+EN_TETE_SECTION = struct.Struct("<4sQ")
+
+DRAPEAU_GRAINE = 1            # le champ graine est renseigné
+DRAPEAU_ORIGINE_OUVERTE = 2   # grille trop petite (N < 3): seule (0, 0) est ouverte
+
+
+def _nb_cellules(taille: int) -> int:
+    """Cellules par dimension: coordonnées 1, 3, ..., 2m-1 < taille-1."""
+    return max((taille - 1) // 2, 0)
+
+
+def encoder_murs(laby: PrimLabyrinthe) -> bytearray:
+    """
+    Encode les passages entre cellules en 2 bits par cellule. Lève ValueError
+    si la grille n'a pas la forme d'un labyrinthe généré par _generer
+    (cellules impaires toutes ouvertes, murs seulement entre cellules).
+    """
+    N = laby.taille
+    m = _nb_cellules(N)
+    grille = laby.grille
+    bits = bytearray((2 * m * m + 7) // 8)
+    for kx in range(m):
+        x = 2 * kx + 1
+        ligne = grille[x]
+        ligne_sud = grille[x + 1] if kx + 1 < m else None
+        base = kx * m
+        for ky in range(m):
+            y = 2 * ky + 1
+            b = 2 * (base + ky)
+            if ky + 1 < m and ligne[y + 1] == 0:
+                bits[b >> 3] |= 1 << (b & 7)
+            b += 1
+            if kx + 1 < m and ligne_sud[y] == 0:
+                bits[b >> 3] |= 1 << (b & 7)
+    return bits
+
+
+def decoder_ligne(bits, taille: int, x: int, origine_ouverte: bool = False) -> bytearray:
+    """Reconstruit la ligne x de la grille (1 = mur, 0 = passage) depuis les bits."""
+    N = taille
+    m = _nb_cellules(N)
+    ligne = bytearray(b"\x01") * N
+    if origine_ouverte:
+        if x == 0 and N >= 1:
+            ligne[0] = 0
+        return ligne
+    if x % 2 == 1 and (x - 1) // 2 < m:
+        base = ((x - 1) // 2) * m
+        for ky in range(m):
+            y = 2 * ky + 1
+            ligne[y] = 0
+            b = 2 * (base + ky)
+            if (bits[b >> 3] >> (b & 7)) & 1:
+                ligne[y + 1] = 0
+    elif x % 2 == 0 and 0 < x and (x - 2) // 2 < m - 1:
+        base = ((x - 2) // 2) * m
+        for ky in range(m):
+            b = 2 * (base + ky) + 1
+            if (bits[b >> 3] >> (b & 7)) & 1:
+                ligne[2 * ky + 1] = 0
+    return ligne
+
+
+def sauvegarder(laby: PrimLabyrinthe, fichier: str, sections: Optional[Dict[bytes, bytes]] = None) -> int:
+    """
+    Écrit le labyrinthe au format .plab (voir en-tête du module) et renvoie
+    la taille du fichier en octets. sections: données annexes {étiquette de
+    4 octets: données}.
+    """
+    N = laby.taille
+    drapeaux = 0
+    graine = 0
+    if isinstance(laby.seed, int) and -(1 << 63) <= laby.seed < (1 << 63):
+        drapeaux |= DRAPEAU_GRAINE
+        graine = laby.seed
+
+    if N < 3:
+        drapeaux |= DRAPEAU_ORIGINE_OUVERTE
+        bits = bytearray()
+    else:
+        bits = encoder_murs(laby)
+
+    # Vérification: la grille doit être exactement reconstructible
+    origine = bool(drapeaux & DRAPEAU_ORIGINE_OUVERTE)
+    for x in range(N):
+        if decoder_ligne(bits, N, x, origine) != bytes(laby.grille[x]):
+            raise ValueError(f"Ligne {x} non représentable: le format .plab ne stocke que "
+                             "les murs entre cellules d'un labyrinthe de Prim.")
+
+    sections = sections or {}
+    for etiquette in sections:
+        if not isinstance(etiquette, bytes) or len(etiquette) != 4:
+            raise ValueError(f"Étiquette de section invalide: {etiquette!r} (4 octets attendus)")
+
+    # écriture dans un fichier temporaire remplacé d'un coup: une erreur en
+    # cours d'écriture ne laisse jamais de .plab tronqué
+    temporaire = f"{fichier}.tmp"
+    try:
+        with open(temporaire, "wb") as f:
+            f.write(EN_TETE.pack(MAGIE, VERSION, drapeaux, N, graine, len(sections)))
+            f.write(bits)
+            for etiquette, donnees in sections.items():
+                f.write(EN_TETE_SECTION.pack(etiquette, len(donnees)))
+                f.write(donnees)
+            taille_fichier = f.tell()
+        os.replace(temporaire, fichier)
+    except BaseException:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+        raise
+    return taille_fichier
+
+
+class LabyrintheMappe:
+    """
+    Labyrinthe .plab ouvert via mmap: rien n'est décodé à l'ouverture, les
+    lignes (lab[x]) et les cases (est_ouverte) sont lues à la demande
+    directement dans le fichier projeté en mémoire.
+    """
+
+    def __init__(self, fichier: str):
+        self.fichier = fichier
+        self._f = open(fichier, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:   # fichier vide
+            self._f.close()
+            raise ValueError(f"{fichier}: fichier vide")
+        if len(self._mm) < EN_TETE.size:
+            self.fermer()
+            raise ValueError(f"{fichier}: en-tête tronqué")
+        magie, version, drapeaux, taille, graine, nb_sections = EN_TETE.unpack_from(self._mm, 0)
+        if magie != MAGIE:
+            self.fermer()
+            raise ValueError(f"{fichier}: ce n'est pas un fichier .plab")
+        if version > VERSION:
+            self.fermer()
+            raise ValueError(f"{fichier}: version {version} non supportée (max {VERSION})")
+        self.version = version
+        self.drapeaux = drapeaux
+        self.taille = taille
+        self.seed = graine if drapeaux & DRAPEAU_GRAINE else None
+        m = _nb_cellules(taille)
+        longueur_bits = 0 if drapeaux & DRAPEAU_ORIGINE_OUVERTE else (2 * m * m + 7) // 8
+        self._debut_bits = EN_TETE.size
+        self.bits = memoryview(self._mm)[self._debut_bits:self._debut_bits + longueur_bits]
+
+        # Table des sections (seuls leurs en-têtes sont lus)
+        self._sections: Dict[bytes, tuple] = {}
+        pos = self._debut_bits + longueur_bits
+        for _ in range(nb_sections):
+            etiquette, longueur = EN_TETE_SECTION.unpack_from(self._mm, pos)
+            pos += EN_TETE_SECTION.size
+            self._sections[etiquette] = (pos, longueur)
+            pos += longueur
+
+    def fermer(self) -> None:
+        if getattr(self, "bits", None) is not None:
+            self.bits.release()
+            self.bits = None
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+    def est_ouverte(self, x: int, y: int) -> bool:
+        """Vrai si la case (x, y) est un passage, en lisant au plus un bit."""
+        N = self.taille
+        if self.drapeaux & DRAPEAU_ORIGINE_OUVERTE:
+            return x == 0 and y == 0
+        m = _nb_cellules(N)
+        if not (0 < x < 2 * m and 0 < y < 2 * m):
+            return False
+        if x % 2 == 1 and y % 2 == 1:
+            return True
+        if x % 2 == 1:     # entre (x, y-1) et (x, y+1): passage est de la cellule de gauche
+            b = 2 * (((x - 1) // 2) * m + (y - 2) // 2)
+        elif y % 2 == 1:   # entre (x-1, y) et (x+1, y): passage sud de la cellule du haut
+            b = 2 * (((x - 2) // 2) * m + (y - 1) // 2) + 1
+        else:
+            return False
+        return bool((self.bits[b >> 3] >> (b & 7)) & 1)
+
+    def __getitem__(self, x: int) -> bytearray:
+        """Ligne x décodée (1 = mur, 0 = passage), pour un accès lab[x][y]."""
+        return decoder_ligne(self.bits, self.taille, x,
+                             bool(self.drapeaux & DRAPEAU_ORIGINE_OUVERTE))
+
+    def __len__(self) -> int:
+        return self.taille
+
+    def section(self, etiquette: bytes) -> Optional[memoryview]:
+        """Données d'une section, sans copie (vue sur le fichier projeté), ou None."""
+        if etiquette not in self._sections:
+            return None
+        debut, longueur = self._sections[etiquette]
+        return memoryview(self._mm)[debut:debut + longueur]
+
+    def vers_labyrinthe(self, stockage: str = "bytearray") -> PrimLabyrinthe:
+        """Décode tout le fichier en PrimLabyrinthe (version 0 non modifiée)."""
+        laby = PrimLabyrinthe(self.taille, stockage=stockage, seed=self.seed)
+        for x in range(self.taille):
+            ligne = self[x]
+            if laby.cellules is not None:
+                d = laby.indice(x, 0)
+                laby.cellules[d:d + self.taille] = ligne
+            else:
+                laby.grille[x] = list(ligne)
+        return laby
+
+
+def ouvrir(fichier: str) -> LabyrintheMappe:
+    """Ouvre un fichier .plab en projection mémoire, sans le décoder."""
+    return LabyrintheMappe(fichier)
+
+
+def charger(fichier: str, stockage: str = "bytearray") -> PrimLabyrinthe:
+    """Charge et décode entièrement un fichier .plab."""
+    with LabyrintheMappe(fichier) as lab:
+        return lab.vers_labyrinthe(stockage)
+
+
+if __name__ == "__main__":
+    taille = 1001
+    fichier = "labyrinthe_demo.plab"
+
+    t0 = time.perf_counter()
+    laby = PrimLabyrinthe(taille, stockage="bytearray", seed=42)
+    laby._generer("rapide")
+    t1 = time.perf_counter()
+    octets = sauvegarder(laby, fichier)
+    t2 = time.perf_counter()
+    with ouvrir(fichier) as lab:
+        t3 = time.perf_counter()
+        rng = random.Random(0)
+        for _ in range(1000):
+            x, y = rng.randrange(taille), rng.randrange(taille)
+            assert lab.est_ouverte(x, y) == (laby.grille[x][y] == 0)
+    t4 = time.perf_counter()
+    recharge = charger(fichier)
+    t5 = time.perf_counter()
+    assert recharge.cellules == laby.cellules
+
+    print(f"Labyrinthe {taille}x{taille} (graine 42)")
+    print(f"  génération          : {(t1 - t0) * 1000.0:9.1f} ms")
+    print(f"  sauvegarde          : {(t2 - t1) * 1000.0:9.1f} ms, {octets} octets "
+          f"({8 * octets / (taille * taille):.2f} bits/case)")
+    print(f"  ouverture (mmap)    : {(t3 - t2) * 1000.0:9.3f} ms")
+    print(f"  1000 lectures       : {(t4 - t3) * 1000.0:9.1f} ms")
+    print(f"  chargement complet  : {(t5 - t4) * 1000.0:9.1f} ms")
+    os.remove(fichier)
@@ -0,0 +1,129 @@
+import argparse
+import os
+import time
+from typing import Iterator, Optional, Tuple
+
+from PrimLabytinthe import PrimLabyrinthe
+from hors_memoire import EST, SUD, graine_tuile, prim_tuile, raccord_tuiles
+
+# Une tâche = (tx, ty, lignes, colonnes, tuile, graine globale, rendu de la grille)
+TacheTuile = Tuple[int, int, int, int, int, int, bool]
+
+
+def construire_tuile(tache: TacheTuile) -> Tuple[int, int, bytes, Optional[bytes]]:
+    """
+    Construit une tuile dans le processus courant: labyrinthe de Prim
+    indépendant (hors_memoire.prim_tuile, graine dérivée de (graine, tx, ty))
+    et, si rendu est vrai, son image en cases: bloc de 2T×2T octets (1 mur,
+    0 passage) dont la case (0, 0) est la cellule (tx*T, ty*T). Le travail
+    par cellule est fait ici, dans le processus de travail: le processus
+    principal n'a plus qu'à copier des tranches de lignes.
+    """
+    tx, ty, w, h, tuile, graine, rendu = tache
+    T = tuile
+    murs = prim_tuile(w, h, T, graine_tuile(graine, tx, ty))
+    if not rendu:
+        return tx, ty, bytes(murs), None
+    L = 2 * T
+    bloc = bytearray(b"\x01") * (L * L)
+    for ix in range(w):
+        base = ix * T
+        ligne = 2 * ix * L
+        for iy in range(h):
+            r = ligne + 2 * iy
+            bloc[r] = 0
+            o = murs[base + iy]
+            if o & EST:
+                bloc[r + 1] = 0
+            if o & SUD:
+                bloc[r + L] = 0
+    return tx, ty, bytes(murs), bytes(bloc)
+
+
+def construire_tuiles(m: int, tuile: int, graine: int, nb_processus: Optional[int] = None,
+                      rendu: bool = False) -> Iterator[Tuple[int, int, bytes, Optional[bytes]]]:
+    """
+    Construit toutes les tuiles d'un labyrinthe de m×m cellules, sur un pool
+    de processus (nb_processus=None: un par cœur; 1: dans ce processus).
+    Chaque tuile ne dépend que de (graine, tx, ty): le résultat est le même
+    quel que soit le nombre de processus. Les tuiles sont rendues dans
+    l'ordre (tx, ty).
+    """
+    T = tuile
+    nt = -(-m // T)
+    taches = [(tx, ty, min(T, m - tx * T), min(T, m - ty * T), T, graine, rendu)
+              for tx in range(nt) for ty in range(nt)]
+    if nb_processus == 1:
+        yield from map(construire_tuile, taches)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    nb = nb_processus or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=nb) as pool:
+        # quelques tâches par processus et par lot: peu d'allers-retours
+        yield from pool.map(construire_tuile, taches, chunksize=max(1, len(taches) // (8 * nb)))
+
+
+def generer_tuile(laby: PrimLabyrinthe, tuile: int = 128, graine: Optional[int] = None,
+                  nb_processus: Optional[int] = None) -> PrimLabyrinthe:
+    """
+    Génère dans 'laby' un labyrinthe parfait par tuiles construites en
+    parallèle puis raccordées (hors_memoire.raccord_tuiles: union-find sur
+    les tuiles, exactement nb_tuiles - 1 passages ouverts). Même
+    représentation que _generer. graine: par défaut laby.seed, sinon tirée
+    de laby.rng / du module random.
+    """
+    N = laby.taille
+    if N < 3:
+        if N >= 1:
+            laby.modifier_cellule(0, 0, 0)
+        return laby
+    if graine is None:
+        if isinstance(laby.seed, int):
+            graine = laby.seed
+        else:
+            graine = laby._alea().getrandbits(63)
+    m = (N - 1) // 2
+    T = tuile
+    L = 2 * T
+    grille = laby.grille
+    for tx, ty, _, bloc in construire_tuiles(m, T, graine, nb_processus, rendu=True):
+        x0, y0 = 2 * tx * T + 1, 2 * ty * T + 1
+        longueur = min(L, N - 1 - y0)
+        for r in range(min(L, N - 1 - x0)):
+            morceau = bloc[r * L:r * L + longueur]
+            if laby.cellules is not None:
+                d = laby.indice(x0 + r, y0)
+                laby.cellules[d:d + longueur] = morceau
+            else:
+                grille[x0 + r][y0:y0 + longueur] = list(morceau)
+    for kx, ky, sens in raccord_tuiles(m, T, graine):
+        if sens == EST:
+            grille[2 * kx + 1][2 * ky + 2] = 0
+        else:
+            grille[2 * kx + 2][2 * ky + 1] = 0
+    laby.version += 1
+    return laby
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génération d'un grand labyrinthe par tuiles en parallèle")
+    parser.add_argument('--taille', type=int, default=4001)
+    parser.add_argument('--tuile', type=int, default=128)
+    parser.add_argument('--graine', type=int, default=0)
+    parser.add_argument('--processus', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    print(f"Labyrinthe {args.taille}x{args.taille}, tuiles de {args.tuile} cellules, "
+          f"{os.cpu_count()} cœurs disponibles")
+    reference = None
+    t_seq = None
+    for nb in args.processus:
+        laby = PrimLabyrinthe(args.taille, stockage="bytearray")
+        t0 = time.perf_counter()
+        generer_tuile(laby, args.tuile, args.graine, nb)
+        duree = time.perf_counter() - t0
+        empreinte = laby.empreinte()
+        if reference is None:
+            reference, t_seq = empreinte, duree
+        identique = "identique" if empreinte == reference else "DIFFÉRENT"
+        print(f"  {nb:>3} processus: {duree:7.2f} s  accélération {t_seq / duree:5.2f}x  ({identique})")
@@ -0,0 +1,296 @@
+import heapq
+import random
+import time
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from PrimLabytinthe import PrimLabyrinthe
+
+Coord = Tuple[int, int]
+
+
+class GrapheJonctions:
+    """
+    Graphe pondéré "contracté" d'un labyrinthe: les nœuds sont les jonctions
+    (degré >= 3), les culs-de-sac (degré 1) et les cases isolées; chaque
+    couloir de cases de degré 2 devient une seule arête dont le poids est la
+    longueur du couloir (en pas) et qui garde la séquence de ses cases
+    intérieures, pour pouvoir reconstruire le chemin complet case par case.
+
+    Le graphe est un instantané: si la grille est modifiée après la
+    compilation, il faut recompiler.
+    """
+
+    def __init__(self, laby: PrimLabyrinthe):
+        t0 = time.perf_counter()
+        self.laby = laby
+        cel = laby.grille_plate()
+        n = len(cel)
+        W = laby.largeur
+        decalages = laby.decalages
+
+        # 1) Degrés des cases ouvertes, détection des nœuds
+        est_noeud = bytearray(n)
+        noeuds = array('i')
+        nb_ouvertes = 0
+        for i in range(W, n - W):
+            if cel[i] != 0:
+                continue
+            nb_ouvertes += 1
+            deg = (cel[i + 1] == 0) + (cel[i - 1] == 0) + (cel[i + W] == 0) + (cel[i - W] == 0)
+            if deg != 2:
+                est_noeud[i] = 1
+                noeuds.append(i)
+
+        self.noeuds = noeuds                     # id de nœud -> indice plat
+        self.id_noeud: Dict[int, int] = {}       # indice plat -> id de nœud
+        self.adjacence: List[List[Tuple[int, int, int, int, int]]] = []
+        self.aretes_u = array('i')               # extrémités (indices plats)
+        self.aretes_v = array('i')
+        self.aretes_cases: List[array] = []      # cases intérieures de u vers v
+        self.arete_de = array('i', [-1]) * n     # arête contenant une case intérieure
+        self.rang = array('i', [0]) * n          # position de la case dans l'arête
+        self.nb_ouvertes = nb_ouvertes
+
+        for i in noeuds:
+            self._ajouter_noeud(i)
+
+        # 2) Parcours des couloirs depuis chaque nœud
+        k = 0
+        while k < len(noeuds):
+            self._parcourir_couloirs(noeuds[k], cel, est_noeud, decalages)
+            k += 1
+
+        # 3) Cycles sans aucun nœud (grilles non parfaites): on promeut une case
+        for i in range(W, n - W):
+            if cel[i] == 0 and not est_noeud[i] and self.arete_de[i] < 0:
+                est_noeud[i] = 1
+                noeuds.append(i)
+                self._ajouter_noeud(i)
+                self._parcourir_couloirs(i, cel, est_noeud, decalages)
+
+        self.temps_compilation_ms = (time.perf_counter() - t0) * 1000.0
+
+    def _ajouter_noeud(self, i: int) -> None:
+        self.id_noeud[i] = len(self.adjacence)
+        self.adjacence.append([])
+
+    def _parcourir_couloirs(self, u: int, cel, est_noeud: bytearray, decalages) -> None:
+        """Crée les arêtes partant du nœud u qui n'ont pas encore été parcourues."""
+        arete_de = self.arete_de
+        for d in decalages:
+            j = u + d
+            if cel[j] != 0:
+                continue
+            if est_noeud[j]:
+                if u < j:   # deux nœuds adjacents: arête de longueur 1, une seule fois
+                    self._ajouter_arete(u, j, array('i'))
+                continue
+            if arete_de[j] >= 0:
+                continue    # couloir déjà parcouru depuis l'autre extrémité
+            interieur = array('i')
+            prec, cur = u, j
+            while not est_noeud[cur]:
+                interieur.append(cur)
+                for d2 in decalages:
+                    suiv = cur + d2
+                    if suiv != prec and cel[suiv] == 0:
+                        break
+                prec, cur = cur, suiv
+            self._ajouter_arete(u, cur, interieur)
+
+    def _ajouter_arete(self, u: int, v: int, interieur: array) -> None:
+        e = len(self.aretes_cases)
+        self.aretes_u.append(u)
+        self.aretes_v.append(v)
+        self.aretes_cases.append(interieur)
+        for pos, c in enumerate(interieur):
+            self.arete_de[c] = e
+            self.rang[c] = pos
+        L = len(interieur) + 1
+        if u != v:  # une boucle sur un même nœud n'aide jamais un plus court chemin
+            iu, iv = self.id_noeud[u], self.id_noeud[v]
+            # (voisin, poids, arête, position de départ, position d'arrivée)
+            self.adjacence[iu].append((iv, L, e, -1, L - 1))
+            self.adjacence[iv].append((iu, L, e, L - 1, -1))
+
+    def statistiques(self) -> Dict[str, float]:
+        """Taille du graphe compilé comparée à la grille."""
+        nb_noeuds = len(self.noeuds)
+        return {
+            'cases_ouvertes': self.nb_ouvertes,
+            'noeuds': nb_noeuds,
+            'aretes': len(self.aretes_cases),
+            'reduction': (self.nb_ouvertes / nb_noeuds) if nb_noeuds else 0.0,
+            'temps_compilation_ms': self.temps_compilation_ms,
+        }
+
+    # ------------------------------------------------------------------
+    # Raccordement de cases quelconques (départ/arrivée) au graphe
+    # ------------------------------------------------------------------
+    def _ancrages(self, p: int) -> List[Tuple[int, int, int, int, int]]:
+        """Arêtes virtuelles reliant la case intérieure p aux deux extrémités de son couloir."""
+        e = self.arete_de[p]
+        k = self.rang[p]
+        L = len(self.aretes_cases[e]) + 1
+        return [(self.id_noeud[self.aretes_u[e]], k + 1, e, k, -1),
+                (self.id_noeud[self.aretes_v[e]], L - 1 - k, e, k, L - 1)]
+
+    def _position_flat(self, noeud: int, virtuels: Dict[int, int]) -> int:
+        if noeud in virtuels:
+            return virtuels[noeud]
+        return self.noeuds[noeud]
+
+    def _rechercher(self, depart: Coord, arrivee: Coord, mode: str) -> Tuple[Optional[List[Coord]], int]:
+        laby = self.laby
+        cel = laby.grille_lecture()
+        s_flat = laby.indice(*depart)
+        g_flat = laby.indice(*arrivee)
+        if cel[s_flat] != 0 or cel[g_flat] != 0:
+            return None, 0
+        if s_flat == g_flat:
+            return [depart], 1
+
+        nb = len(self.noeuds)
+        virtuels: Dict[int, int] = {}
+        supplementaires: Dict[int, List[Tuple[int, int, int, int, int]]] = {}
+
+        if s_flat in self.id_noeud:
+            S = self.id_noeud[s_flat]
+        else:
+            S = nb
+            virtuels[S] = s_flat
+            supplementaires[S] = self._ancrages(s_flat)
+        if g_flat in self.id_noeud:
+            G = self.id_noeud[g_flat]
+        else:
+            G = nb + 1
+            virtuels[G] = g_flat
+            for (u, poids, e, pos_g, pos_u) in self._ancrages(g_flat):
+                supplementaires.setdefault(u, []).append((G, poids, e, pos_u, pos_g))
+            if S in virtuels and self.arete_de[s_flat] == self.arete_de[g_flat]:
+                ks, kg = self.rang[s_flat], self.rang[g_flat]
+                supplementaires[S].append((G, abs(ks - kg), self.arete_de[s_flat], ks, kg))
+
+        gx, gy = arrivee
+        noeuds = self.noeuds
+        W = laby.largeur
+
+        def h(x: int) -> int:
+            if mode != 'astar':
+                return 0
+            cx, cy = divmod(self._position_flat(x, virtuels), W)
+            return abs(cx - 1 - gx) + abs(cy - 1 - gy)
+
+        parent: Dict[int, Tuple[int, int, int, int]] = {}
+        explores = 0
+        trouve = False
+
+        if mode == 'bfs':
+            queue = deque([S])
+            vus = {S}
+            while queue:
+                x = queue.popleft()
+                explores += 1
+                if x == G:
+                    trouve = True
+                    break
+                for (y, _, e, pf, pt) in self.adjacence[x] if x < nb else ():
+                    if y not in vus:
+                        vus.add(y); parent[y] = (x, e, pf, pt); queue.append(y)
+                for (y, _, e, pf, pt) in supplementaires.get(x, ()):
+                    if y not in vus:
+                        vus.add(y); parent[y] = (x, e, pf, pt); queue.append(y)
+        else:
+            dist = {S: 0}
+            tas = [(h(S), 0, S)]
+            while tas:
+                f, g, x = heapq.heappop(tas)
+                explores += 1
+                if g != dist.get(x):
+                    continue
+                if x == G:
+                    trouve = True
+                    break
+                for lst in (self.adjacence[x] if x < nb else (), supplementaires.get(x, ())):
+                    for (y, poids, e, pf, pt) in lst:
+                        ng = g + poids
+                        if ng < dist.get(y, ng + 1):
+                            dist[y] = ng
+                            parent[y] = (x, e, pf, pt)
+                            heapq.heappush(tas, (ng + h(y), ng, y))
+
+        if not trouve:
+            return None, explores
+
+        # Reconstruction: suite de sauts (nœud, arête, positions) -> cases
+        sauts = []
+        x = G
+        while x != S:
+            sauts.append((x,) + parent[x][1:])
+            x = parent[x][0]
+        sauts.reverse()
+
+        chemin_flat = [s_flat]
+        for (x, e, pf, pt) in sauts:
+            interieur = self.aretes_cases[e]
+            if pf < pt:
+                chemin_flat.extend(interieur[pf + 1:pt])
+            else:
+                chemin_flat.extend(reversed(interieur[pt + 1:pf]))
+            chemin_flat.append(self._position_flat(x, virtuels))
+        return [laby.coord(i) for i in chemin_flat], explores
+
+    # ------------------------------------------------------------------
+    # Recherches publiques: même contrat (chemin, explores) que laby.bfs
+    # ------------------------------------------------------------------
+    def bfs(self, depart: Coord, arrivee: Coord) -> Tuple[Optional[List[Coord]], int]:
+        """
+        Parcours en largeur sur le graphe (nombre de sauts). Donne le plus
+        court chemin uniquement sur un labyrinthe parfait, où le chemin est
+        unique; sinon utiliser dijkstra() ou astar().
+        """
+        return self._rechercher(depart, arrivee, 'bfs')
+
+    def dijkstra(self, depart: Coord, arrivee: Coord) -> Tuple[Optional[List[Coord]], int]:
+        """Plus court chemin (en cases) sur le graphe pondéré par la longueur des couloirs."""
+        return self._rechercher(depart, arrivee, 'dijkstra')
+
+    def astar(self, depart: Coord, arrivee: Coord) -> Tuple[Optional[List[Coord]], int]:
+        """
+        A* sur le graphe pondéré, heuristique Manhattan vers l'arrivée
+        (admissible: un couloir est toujours au moins aussi long que la
+        distance Manhattan entre ses extrémités).
+        """
+        return self._rechercher(depart, arrivee, 'astar')
+
+
+if __name__ == "__main__":
+    taille = 201
+    start: Coord = (1, 1)
+    goal: Coord = (taille - 2, taille - 2)
+    random.seed(0)
+
+    laby = PrimLabyrinthe(taille, stockage="bytearray")
+    laby._generer()
+
+    graphe = GrapheJonctions(laby)
+    st = graphe.statistiques()
+    print(f"Grille {taille}x{taille}: {st['cases_ouvertes']} cases ouvertes -> "
+          f"{st['noeuds']} nœuds, {st['aretes']} arêtes "
+          f"(÷{st['reduction']:.1f}) en {st['temps_compilation_ms']:.1f} ms")
+    print()
+
+    header = f"{'Méthode':<20} {'Explorés':>10} {'Temps (ms)':>12} {'Longueur':>10}"
+    print(header)
+    print("-" * len(header))
+    for nom, recherche in [('BFS (grille)', lambda s, g: laby.bfs(s, g)),
+                           ('BFS (graphe)', graphe.bfs),
+                           ('Dijkstra (graphe)', graphe.dijkstra),
+                           ('A* (graphe)', graphe.astar)]:
+        t0 = time.perf_counter()
+        chemin, explores = recherche(start, goal)
+        duree_ms = (time.perf_counter() - t0) * 1000.0
+        longueur = (len(chemin) - 1) if chemin else None
+        print(f"{nom:<20} {explores:>10} {duree_ms:>12.2f} {str(longueur):>10}")
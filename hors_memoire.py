@@ -0,0 +1,540 @@
+import argparse
+import mmap
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import format_labyrinthe
+from PrimLabytinthe import tirages
+
+Coord = Tuple[int, int]
+
+# Bits d'une cellule dans le fichier de murs (1 octet par cellule)
+EST = 1   # passage ouvert vers la cellule (kx, ky+1)
+SUD = 2   # passage ouvert vers la cellule (kx+1, ky)
+
+# Codes du fichier d'état du BFS (1 octet par cellule): 0 = non visitée,
+# sinon direction de la cellule vers son parent
+VERS_EST, VERS_OUEST, VERS_SUD, VERS_NORD, SOURCE = 1, 2, 3, 4, 5
+DEPLACEMENTS = {VERS_EST: (0, 1), VERS_OUEST: (0, -1), VERS_SUD: (1, 0), VERS_NORD: (-1, 0)}
+
+
+class EnsemblesDisjoints:
+    """Union-find (union par rang, compression de chemin) sur 0..n-1, en tableaux plats."""
+
+    def __init__(self, n: int):
+        self.parent = array('q', range(n))
+        self.rang = bytearray(n)
+
+    def trouver(self, a: int) -> int:
+        parent = self.parent
+        racine = a
+        while parent[racine] != racine:
+            racine = parent[racine]
+        while parent[a] != racine:
+            parent[a], a = racine, parent[a]
+        return racine
+
+    def unir(self, a: int, b: int) -> bool:
+        """Fusionne les ensembles de a et b; False s'ils étaient déjà réunis."""
+        ra, rb = self.trouver(a), self.trouver(b)
+        if ra == rb:
+            return False
+        if self.rang[ra] < self.rang[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rang[ra] == self.rang[rb]:
+            self.rang[ra] += 1
+        return True
+
+
+def graine_tuile(graine: int, tx: int, ty: int) -> int:
+    """Graine d'une tuile, indépendante de l'ordre (et du processus) de génération."""
+    return ((graine * 1_000_003 + tx) * 1_000_003 + ty) % (1 << 63)
+
+
+def prim_tuile(w: int, h: int, tuile: int, graine: int) -> bytearray:
+    """
+    Labyrinthe parfait de w×h cellules (Prim par cellules, comme
+    PrimLabyrinthe._generer_rapide), rendu dans un bloc tuile×tuile
+    d'octets EST/SUD, ligne par ligne: c'est exactement l'image de la tuile
+    dans le fichier de murs. Les passages ne sortent jamais de la tuile.
+    """
+    T = tuile
+    murs = bytearray(T * T)
+    if w <= 0 or h <= 0:
+        return murs
+    etat = bytearray(T * T)       # 0 inconnue, 1 frontière, 2 visitée
+    frontiere = []
+    tirage = tirages(random.Random(graine)).__next__
+
+    def ajouter_frontiere(c):
+        ix, iy = divmod(c, T)
+        if iy + 1 < h and etat[c + 1] == 0:
+            etat[c + 1] = 1; frontiere.append(c + 1)
+        if iy > 0 and etat[c - 1] == 0:
+            etat[c - 1] = 1; frontiere.append(c - 1)
+        if ix + 1 < w and etat[c + T] == 0:
+            etat[c + T] = 1; frontiere.append(c + T)
+        if ix > 0 and etat[c - T] == 0:
+            etat[c - T] = 1; frontiere.append(c - T)
+
+    ix0, iy0 = divmod((tirage() * (w * h)) >> 32, h)
+    c0 = ix0 * T + iy0
+    etat[c0] = 2
+    ajouter_frontiere(c0)
+
+    while frontiere:
+        idx = (tirage() * len(frontiere)) >> 32
+        c = frontiere[idx]
+        frontiere[idx] = frontiere[-1]
+        frontiere.pop()
+
+        ix, iy = divmod(c, T)
+        visites = []
+        if iy + 1 < h and etat[c + 1] == 2: visites.append(c + 1)
+        if iy > 0 and etat[c - 1] == 2: visites.append(c - 1)
+        if ix + 1 < w and etat[c + T] == 2: visites.append(c + T)
+        if ix > 0 and etat[c - T] == 2: visites.append(c - T)
+        v = visites[(tirage() * len(visites)) >> 32]
+        if v == c + 1:
+            murs[c] |= EST
+        elif v == c - 1:
+            murs[v] |= EST
+        elif v == c + T:
+            murs[c] |= SUD
+        else:
+            murs[v] |= SUD
+        etat[c] = 2
+        ajouter_frontiere(c)
+    return murs
+
+
+def raccord_tuiles(m: int, tuile: int, graine: int) -> List[Tuple[int, int, int]]:
+    """
+    Kruskal sur le graphe des tuiles: les frontières entre tuiles voisines
+    sont prises dans un ordre aléatoire et une frontière n'est ouverte (un
+    seul passage, à une position tirée au hasard) que si elle relie deux
+    composantes encore distinctes (union-find). Chaque tuile étant un
+    arbre, le résultat est un arbre couvrant: un labyrinthe parfait.
+    Retourne les passages à ouvrir, (kx, ky, EST | SUD) depuis la cellule
+    (kx, ky). Ne dépend que de (m, tuile, graine).
+    """
+    T = tuile
+    nt = -(-m // T)
+    rng = random.Random(graine_tuile(graine, -1, -1))
+    frontieres = []
+    for tx in range(nt):
+        for ty in range(nt):
+            if ty + 1 < nt:
+                frontieres.append((tx, ty, EST))
+            if tx + 1 < nt:
+                frontieres.append((tx, ty, SUD))
+    rng.shuffle(frontieres)
+    ensembles = EnsemblesDisjoints(nt * nt)
+    passages = []
+    for tx, ty, sens in frontieres:
+        voisine = (tx, ty + 1) if sens == EST else (tx + 1, ty)
+        if not ensembles.unir(tx * nt + ty, voisine[0] * nt + voisine[1]):
+            continue
+        if sens == EST:
+            kx, ky = tx * T + rng.randrange(min(T, m - tx * T)), ty * T + T - 1
+        else:
+            kx, ky = tx * T + T - 1, ty * T + rng.randrange(min(T, m - ty * T))
+        passages.append((kx, ky, sens))
+    return passages
+
+
+class FileDebordante:
+    """
+    File d'entiers (positions de cellules) qui déborde sur disque: au-delà
+    de 'limite' éléments en mémoire, le tampon est écrit à la fin d'un
+    fichier temporaire. L'itération relit le fichier par blocs puis le
+    tampon, dans l'ordre d'ajout.
+    """
+
+    def __init__(self, repertoire: str, limite: int = 1 << 20):
+        self.repertoire = repertoire
+        self.limite = limite
+        self.tampon = array('q')
+        self._fichier = None
+        self.sur_disque = 0
+        self.debordements = 0
+
+    def ajouter(self, valeur: int) -> None:
+        self.tampon.append(valeur)
+        if len(self.tampon) >= self.limite:
+            if self._fichier is None:
+                self._fichier = tempfile.TemporaryFile(dir=self.repertoire)
+            self.tampon.tofile(self._fichier)
+            self.sur_disque += len(self.tampon)
+            self.debordements += 1
+            self.tampon = array('q')
+
+    def __len__(self) -> int:
+        return self.sur_disque + len(self.tampon)
+
+    def __iter__(self) -> Iterator[int]:
+        if self._fichier is not None:
+            self._fichier.flush()
+            self._fichier.seek(0)
+            restant = self.sur_disque
+            while restant:
+                bloc = array('q')
+                bloc.fromfile(self._fichier, min(restant, self.limite))
+                restant -= len(bloc)
+                yield from bloc
+        yield from self.tampon
+
+    def fermer(self) -> None:
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
+        self.tampon = array('q')
+        self.sur_disque = 0
+
+
+def _projeter(chemin: str, octets: int) -> Tuple[object, mmap.mmap]:
+    """Crée (ou remet à zéro) un fichier creux de 'octets' octets et le projette en mémoire."""
+    f = open(chemin, "w+b")
+    f.truncate(max(octets, 1))
+    return f, mmap.mmap(f.fileno(), max(octets, 1))
+
+
+def pic_memoire_mo() -> float:
+    """Pic de mémoire résidente du processus (ru_maxrss), en Mo."""
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ko sous Linux, octets sous macOS
+    return pic / (1024.0 * 1024.0) if sys.platform == "darwin" else pic / 1024.0
+
+
+class LabyrintheHorsMemoire:
+    """
+    Labyrinthe de Prim stocké sur disque et projeté en mémoire (mmap), pour
+    des tailles dont la grille ne tient pas en RAM (100 000×100 000 et plus).
+
+    Seules les cellules (coordonnées impaires, m = (taille-1)//2 par
+    dimension) sont stockées, un octet chacune:
+      - murs.bin : bits EST/SUD des passages vers les cellules voisines;
+      - etat.bin : état du BFS (0 = non visitée, sinon direction du parent).
+    Les deux fichiers sont rangés par tuiles de tuile×tuile cellules (les
+    tuiles ligne par ligne, puis les cellules de chaque tuile ligne par
+    ligne): la génération écrit une tuile contiguë à la fois et le BFS,
+    qui reste le plus souvent dans la tuile courante, ne touche que peu de
+    pages. Le système pagine ces fichiers: la mémoire résidente reste
+    bornée quelle que soit la taille.
+
+    Les coordonnées publiques (depart, arrivee, chemins) sont celles de
+    PrimLabyrinthe.grille; les nœuds explorés sont comptés en cellules.
+    """
+
+    def __init__(self, taille: int, tuile: int = 256, graine: int = 0,
+                 repertoire: Optional[str] = None, limite_frontiere: int = 1 << 20):
+        if taille < 3:
+            raise ValueError("Taille minimale: 3")
+        self.taille = taille
+        self.tuile = tuile
+        self.graine = graine
+        self.limite_frontiere = limite_frontiere
+        self._temporaire = repertoire is None
+        self.repertoire = tempfile.mkdtemp(prefix="laby_") if repertoire is None else repertoire
+        os.makedirs(self.repertoire, exist_ok=True)
+
+        self.m = (taille - 1) // 2
+        self.nt = -(-self.m // tuile)            # tuiles par dimension
+        self.octets = self.nt * self.nt * tuile * tuile
+        self._f_murs, self.murs = _projeter(os.path.join(self.repertoire, "murs.bin"), self.octets)
+        self._f_etat, self.etat = _projeter(os.path.join(self.repertoire, "etat.bin"), self.octets)
+        self.mesures: Dict[str, float] = {}
+
+    # --- adressage -------------------------------------------------------
+
+    def position(self, kx: int, ky: int) -> int:
+        """Position dans les fichiers de la cellule (kx, ky) (rangement par tuiles)."""
+        T = self.tuile
+        tx, ix = divmod(kx, T)
+        ty, iy = divmod(ky, T)
+        return (tx * self.nt + ty) * T * T + ix * T + iy
+
+    def cellule(self, pos: int) -> Coord:
+        """Inverse de position()."""
+        T = self.tuile
+        t, r = divmod(pos, T * T)
+        tx, ty = divmod(t, self.nt)
+        ix, iy = divmod(r, T)
+        return (tx * T + ix, ty * T + iy)
+
+    def _cellule_de_case(self, case: Coord) -> Coord:
+        x, y = case
+        if x % 2 == 0 or y % 2 == 0 or not (0 < x < 2 * self.m and 0 < y < 2 * self.m):
+            raise ValueError(f"{case} n'est pas une cellule du labyrinthe (coordonnées impaires)")
+        return ((x - 1) // 2, (y - 1) // 2)
+
+    def est_ouverte(self, x: int, y: int) -> bool:
+        """Même valeur que grille[x][y] == 0 pour un labyrinthe en mémoire."""
+        m = self.m
+        if not (0 < x < 2 * m and 0 < y < 2 * m):
+            return False
+        if x % 2 == 1 and y % 2 == 1:
+            return True
+        if x % 2 == 1:
+            return bool(self.murs[self.position((x - 1) // 2, (y - 2) // 2)] & EST)
+        if y % 2 == 1:
+            return bool(self.murs[self.position((x - 2) // 2, (y - 1) // 2)] & SUD)
+        return False
+
+    # --- génération ------------------------------------------------------
+
+    def dimensions_tuile(self, tx: int, ty: int) -> Tuple[int, int]:
+        """Nombre de cellules réelles (lignes, colonnes) de la tuile (tx, ty)."""
+        T = self.tuile
+        return min(T, self.m - tx * T), min(T, self.m - ty * T)
+
+    def ecrire_tuile(self, tx: int, ty: int, bloc: bytes) -> None:
+        T2 = self.tuile * self.tuile
+        debut = (tx * self.nt + ty) * T2
+        self.murs[debut:debut + T2] = bloc
+
+    def generer(self, nb_processus: Optional[int] = 1) -> None:
+        """
+        Génère un labyrinthe parfait tuile par tuile: chaque tuile est un
+        labyrinthe de Prim indépendant (graine_tuile), écrit d'un bloc dans
+        murs.bin, puis relier_tuiles() ouvre un passage par arête d'un
+        arbre couvrant des tuiles (raccord_tuiles). Déterministe pour une
+        graine donnée, quel que soit nb_processus: avec nb_processus != 1,
+        les tuiles sont construites sur un pool de processus (voir
+        generation_tuilee; None = un par cœur).
+        """
+        t0 = time.perf_counter()
+        if nb_processus == 1:
+            for tx in range(self.nt):
+                for ty in range(self.nt):
+                    w, h = self.dimensions_tuile(tx, ty)
+                    self.ecrire_tuile(tx, ty, prim_tuile(w, h, self.tuile, graine_tuile(self.graine, tx, ty)))
+        else:
+            from generation_tuilee import construire_tuiles
+            for tx, ty, murs, _ in construire_tuiles(self.m, self.tuile, self.graine, nb_processus):
+                self.ecrire_tuile(tx, ty, murs)
+        t1 = time.perf_counter()
+        self.relier_tuiles()
+        self.murs.flush()
+        t2 = time.perf_counter()
+        self.mesures['generation_s'] = t2 - t0
+        self.mesures['raccord_s'] = t2 - t1
+        self.mesures['generation_cellules_par_s'] = self.m * self.m / max(t2 - t0, 1e-9)
+
+    def relier_tuiles(self) -> int:
+        """Ouvre les passages de raccord_tuiles(); retourne leur nombre."""
+        passages = raccord_tuiles(self.m, self.tuile, self.graine)
+        for kx, ky, sens in passages:
+            self.murs[self.position(kx, ky)] |= sens
+        return len(passages)
+
+    # --- recherche -------------------------------------------------------
+
+    def _reinitialiser_etat(self) -> None:
+        """Remet etat.bin à zéro en recréant un fichier creux (pas d'écriture de m² octets)."""
+        self.etat.close()
+        self._f_etat.close()
+        self._f_etat, self.etat = _projeter(os.path.join(self.repertoire, "etat.bin"), self.octets)
+
+    def bfs(self, depart: Coord, arrivee: Coord, avec_chemin: bool = True):
+        """
+        BFS par niveaux: frontières courante et suivante en FileDebordante,
+        visites et directions des parents dans etat.bin. Retourne
+        (chemin, explores) comme PrimLabyrinthe.bfs; avec avec_chemin=False,
+        (distance en cases, explores) sans construire la liste.
+        """
+        t0 = time.perf_counter()
+        T, nt, m = self.tuile, self.nt, self.m
+        T2 = T * T
+        saut_est = T2 - (T - 1)             # dernière colonne -> tuile de droite
+        saut_sud = nt * T2 - (T - 1) * T    # dernière ligne -> tuile du dessous
+        murs = self.murs
+        self._reinitialiser_etat()
+        etat = self.etat
+
+        skx, sky = self._cellule_de_case(depart)
+        akx, aky = self._cellule_de_case(arrivee)
+        source = self.position(skx, sky)
+        cible = self.position(akx, aky)
+        etat[source] = SOURCE
+
+        courante = FileDebordante(self.repertoire, self.limite_frontiere)
+        courante.ajouter(source)
+        explores = 0
+        trouve = source == cible
+        debordements = 0
+        while len(courante) and not trouve:
+            suivante = FileDebordante(self.repertoire, self.limite_frontiere)
+            for pos in courante:
+                explores += 1
+                r = pos % T2
+                t = pos // T2
+                ix, iy = divmod(r, T)
+                tx, ty = divmod(t, nt)
+                # est / sud: bits de la cellule elle-même
+                if murs[pos] & EST:
+                    v = pos + 1 if iy + 1 < T else pos + saut_est
+                    if not etat[v]:
+                        etat[v] = VERS_OUEST; suivante.ajouter(v)
+                if murs[pos] & SUD:
+                    v = pos + T if ix + 1 < T else pos + saut_sud
+                    if not etat[v]:
+                        etat[v] = VERS_NORD; suivante.ajouter(v)
+                # ouest / nord: bits de la cellule voisine
+                if iy > 0 or ty > 0:
+                    v = pos - 1 if iy > 0 else pos - saut_est
+                    if not etat[v] and murs[v] & EST:
+                        etat[v] = VERS_EST; suivante.ajouter(v)
+                if ix > 0 or tx > 0:
+                    v = pos - T if ix > 0 else pos - saut_sud
+                    if not etat[v] and murs[v] & SUD:
+                        etat[v] = VERS_SUD; suivante.ajouter(v)
+                if etat[cible]:
+                    trouve = True
+                    break
+            debordements += courante.debordements
+            courante.fermer()
+            courante = suivante
+        debordements += courante.debordements
+        courante.fermer()
+        t1 = time.perf_counter()
+
+        self.mesures['bfs_s'] = t1 - t0
+        self.mesures['bfs_explores'] = explores
+        self.mesures['bfs_cellules_par_s'] = explores / max(t1 - t0, 1e-9)
+        self.mesures['bfs_debordements'] = debordements
+        if not trouve:
+            return None, explores
+
+        # remontée des directions depuis la cible
+        etapes = 0
+        cellules = [(akx, aky)] if avec_chemin else None
+        kx, ky = akx, aky
+        code = etat[cible]
+        while code != SOURCE:
+            dx, dy = DEPLACEMENTS[code]
+            kx, ky = kx + dx, ky + dy
+            etapes += 1
+            if avec_chemin:
+                cellules.append((kx, ky))
+            code = etat[self.position(kx, ky)]
+        if not avec_chemin:
+            return 2 * etapes, explores
+
+        chemin = []
+        for (ax, ay), (bx, by) in zip(cellules, cellules[1:]):
+            chemin.append((2 * ax + 1, 2 * ay + 1))
+            chemin.append((ax + bx + 1, ay + by + 1))   # case de passage entre les deux
+        chemin.append((2 * kx + 1, 2 * ky + 1))
+        chemin.reverse()
+        return chemin, explores
+
+    # --- échanges et rapport --------------------------------------------
+
+    def vers_labyrinthe(self, stockage: str = "bytearray"):
+        """Grille complète en mémoire (petites tailles: vérification, affichage)."""
+        from PrimLabytinthe import PrimLabyrinthe
+        laby = PrimLabyrinthe(self.taille, stockage=stockage, seed=self.graine)
+        for x in range(1, 2 * self.m):
+            for y in range(1, 2 * self.m):
+                if self.est_ouverte(x, y):
+                    laby.grille[x][y] = 0
+        return laby
+
+    def exporter_plab(self, fichier: str) -> int:
+        """
+        Écrit le labyrinthe au format .plab (format_labyrinthe) en flux, par
+        blocs d'environ 1 Mo: la grille n'est jamais reconstruite en mémoire.
+        Retourne la taille du fichier.
+        """
+        m = self.m
+        murs, position = self.murs, self.position
+        with open(fichier, "wb") as f:
+            f.write(format_labyrinthe.EN_TETE.pack(format_labyrinthe.MAGIE, format_labyrinthe.VERSION,
+                                                   format_labyrinthe.DRAPEAU_GRAINE, self.taille,
+                                                   self.graine, 0))
+            bloc = bytearray()
+            premier = 0      # indice (en octets) de bloc[0] dans la zone des murs
+            for kx in range(m):
+                fin = (2 * (kx + 1) * m + 7) // 8 - premier
+                bloc.extend(bytes(fin - len(bloc)))
+                base = 2 * kx * m - 8 * premier
+                for ky in range(m):
+                    o = murs[position(kx, ky)]
+                    if o:
+                        b = base + 2 * ky
+                        if o & EST:
+                            bloc[b >> 3] |= 1 << (b & 7)
+                        if o & SUD:
+                            bloc[(b + 1) >> 3] |= 1 << ((b + 1) & 7)
+                if len(bloc) > 1 << 20:
+                    # le dernier octet peut être partagé avec la ligne suivante
+                    f.write(bloc[:-1])
+                    premier += len(bloc) - 1
+                    bloc = bloc[-1:]
+            f.write(bloc)
+            return f.tell()
+
+    def rapport(self) -> Dict[str, float]:
+        """Débits mesurés, pic de mémoire résidente et taille des fichiers."""
+        return {
+            'taille': self.taille,
+            'cellules': self.m * self.m,
+            'tuile': self.tuile,
+            **self.mesures,
+            'pic_rss_mo': pic_memoire_mo(),
+            'disque_mo': 2 * self.octets / (1024.0 * 1024.0),
+        }
+
+    def fermer(self) -> None:
+        """Libère les projections; supprime le répertoire s'il était temporaire."""
+        for nom in ("murs", "etat"):
+            projection = getattr(self, nom, None)
+            if projection is not None and not projection.closed:
+                projection.close()
+        self._f_murs.close()
+        self._f_etat.close()
+        if self._temporaire:
+            shutil.rmtree(self.repertoire, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génération et BFS hors mémoire")
+    parser.add_argument('--taille', type=int, default=4001)
+    parser.add_argument('--tuile', type=int, default=256)
+    parser.add_argument('--graine', type=int, default=0)
+    parser.add_argument('--repertoire', help="répertoire des fichiers (temporaire par défaut)")
+    parser.add_argument('--limite-frontiere', type=int, default=1 << 20,
+                        help="éléments d'une frontière gardés en mémoire avant débordement")
+    parser.add_argument('--processus', type=int, default=1,
+                        help="processus pour la génération des tuiles (0 = un par cœur)")
+    args = parser.parse_args()
+
+    with LabyrintheHorsMemoire(args.taille, args.tuile, args.graine, args.repertoire,
+                               args.limite_frontiere) as laby:
+        laby.generer(args.processus or None)
+        coin = 2 * laby.m - 1
+        longueur, _ = laby.bfs((1, 1), (coin, coin), avec_chemin=False)
+        r = laby.rapport()
+        print(f"Labyrinthe {args.taille}x{args.taille} hors mémoire "
+              f"({r['cellules']} cellules, tuiles de {args.tuile})")
+        print(f"  génération : {r['generation_s']:8.2f} s "
+              f"({r['generation_cellules_par_s'] / 1e6:.2f} M cellules/s, raccord {r['raccord_s']:.2f} s)")
+        print(f"  BFS        : {r['bfs_s']:8.2f} s "
+              f"({r['bfs_cellules_par_s'] / 1e6:.2f} M cellules/s, {r['bfs_explores']} explorées, "
+              f"chemin {longueur} cases, {r['bfs_debordements']} débordements)")
+        print(f"  pic RSS    : {r['pic_rss_mo']:8.1f} Mo | disque {r['disque_mo']:.1f} Mo")
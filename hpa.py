@@ -0,0 +1,453 @@
+import heapq
+import random
+import time
+import weakref
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+from PrimLabytinthe import PrimLabyrinthe
+from AStar_Manhattan import astar_manhattan
+
+Coord = Tuple[int, int]
+
+# Un passage d'au moins cette longueur entre deux clusters donne deux
+# transitions (ses extrémités) au lieu d'une seule en son milieu
+LONGUEUR_PASSAGE_LARGE = 6
+
+
+class HierarchieClusters:
+    """
+    Recherche hiérarchique HPA* (Botea, Müller & Schaeffer): la grille est
+    découpée en clusters carrés de taille_cluster cases de côté.
+
+    - Frontière entre deux clusters voisins: chaque passage (suite de
+      cases ouvertes des deux côtés) donne une transition, paire de cases
+      (une de chaque côté) reliées par une arête de coût 1; ces cases sont
+      les nœuds du graphe abstrait.
+    - Dans chaque cluster, un BFS restreint au cluster depuis chaque nœud
+      donne les distances intra-cluster entre ses nœuds.
+    - Requête: départ et arrivée sont raccordés aux nœuds de leur cluster
+      (BFS local), A* Manhattan sur le graphe abstrait, puis raffinement:
+      un BFS restreint par cluster traversé, et seulement ceux-là (tronçons
+      mémorisés jusqu'à la reconstruction du cluster).
+
+    Chemin optimal tant que chaque passage est une transition unique
+    (labyrinthe parfait: tous les passages font une case de large); sur
+    les passages larges, légèrement plus long au pire.
+
+    Les murs ne changent que par modifier_cellule / basculer de cette
+    classe: la requête suivante ne reconstruit que les clusters touchés (et
+    leurs voisins si une frontière a changé). Une modification hors de
+    cette API (laby.version différente) fait lever ValueError.
+
+    Le labyrinthe n'est référencé que faiblement (voir hierarchie_pour).
+    """
+
+    def __init__(self, laby: PrimLabyrinthe, taille_cluster: int = 16):
+        if taille_cluster < 2:
+            raise ValueError(f"Taille de cluster {taille_cluster} trop petite (minimum 2)")
+        t0 = time.perf_counter()
+        self._laby = weakref.ref(laby)
+        self.taille_cluster = C = taille_cluster
+        N = laby.taille
+        W = laby.largeur
+        self.largeur = W
+        self.nb = nb = -(-N // C)           # clusters par côté
+        # stockage "liste": grille_plate() est une copie, tenue à jour ici
+        self._copie = laby.cellules is None
+        self.cellules = laby.grille_plate()
+        self._version = laby.version
+
+        # cluster de chaque case (indice plat), -1 sur la bordure
+        self.cluster_de = array('i', [-1]) * (W * W)
+        lignes = [array('i', (cx * nb + y // C for y in range(N))) for cx in range(nb)]
+        for x in range(N):
+            d = (x + 1) * W + 1
+            self.cluster_de[d:d + N] = lignes[x // C]
+
+        # frontière (k, sens): entre le cluster k et k + nb (sens 0, le long
+        # de x) ou k + 1 (sens 1, le long de y) -> transitions (case côté k, case voisine)
+        self.transitions: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        self.inter: Dict[int, List[Tuple[int, int]]] = {}           # nœud -> [(nœud, 1)]
+        self.intra: List[Dict[int, List[Tuple[int, int]]]] = [{} for _ in range(nb * nb)]
+        self.troncons: List[Dict[Tuple[int, int], List[int]]] = [{} for _ in range(nb * nb)]
+        for k in range(nb * nb):
+            cx, cy = divmod(k, nb)
+            if cx + 1 < nb:
+                self._construire_frontiere((k, 0))
+            if cy + 1 < nb:
+                self._construire_frontiere((k, 1))
+        t1 = time.perf_counter()
+        for k in range(nb * nb):
+            self._construire_cluster(k)
+        t2 = time.perf_counter()
+        self.duree_frontieres = t1 - t0
+        self.duree_clusters = t2 - t1
+        self.duree_construction = t2 - t0
+
+        self._frontieres_sales: Set[Tuple[int, int]] = set()
+        self._clusters_sales: Set[int] = set()
+        self.requetes = 0
+        self.mutations = 0
+        self.clusters_reconstruits = 0
+        self.derniere: Dict[str, float] = {}
+
+    @property
+    def laby(self) -> PrimLabyrinthe:
+        laby = self._laby()
+        if laby is None:
+            raise ValueError("Le labyrinthe de cette hiérarchie n'existe plus")
+        return laby
+
+    # --- construction -------------------------------------------------------
+
+    def _cases_frontiere(self, frontiere: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """(première case côté k, pas le long de la frontière, nombre de cases, décalage vers l'autre côté)."""
+        k, sens = frontiere
+        C, N, W = self.taille_cluster, self.laby.taille, self.largeur
+        cx, cy = divmod(k, self.nb)
+        if sens == 0:
+            y0 = cy * C
+            return self.laby.indice((cx + 1) * C - 1, y0), 1, min(C, N - y0), W
+        x0 = cx * C
+        return self.laby.indice(x0, (cy + 1) * C - 1), W, min(C, N - x0), 1
+
+    def _construire_frontiere(self, frontiere: Tuple[int, int]) -> bool:
+        """(Re)calcule les transitions d'une frontière; vrai si elles ont changé."""
+        premiere, pas, longueur, d = self._cases_frontiere(frontiere)
+        cel = self.cellules
+        nouvelles = []
+        debut = -1
+        for t in range(longueur + 1):
+            a = premiere + t * pas
+            if t < longueur and cel[a] == 0 and cel[a + d] == 0:
+                if debut < 0:
+                    debut = t
+            elif debut >= 0:
+                fin = t - 1
+                if fin - debut + 1 >= LONGUEUR_PASSAGE_LARGE:
+                    positions = (debut, fin)
+                else:
+                    positions = ((debut + fin) // 2,)
+                for p in positions:
+                    a = premiere + p * pas
+                    nouvelles.append((a, a + d))
+                debut = -1
+
+        anciennes = self.transitions.setdefault(frontiere, [])
+        if nouvelles == anciennes:
+            return False
+        inter = self.inter
+        for a, b in anciennes:
+            for u, v in ((a, b), (b, a)):
+                inter[u].remove((v, 1))
+                if not inter[u]:
+                    del inter[u]
+        for a, b in nouvelles:
+            inter.setdefault(a, []).append((b, 1))
+            inter.setdefault(b, []).append((a, 1))
+        self.transitions[frontiere] = nouvelles
+        return True
+
+    def _noeuds(self, k: int) -> Set[int]:
+        """Nœuds abstraits du cluster k: ses cases de transition, sur ses quatre frontières."""
+        nb = self.nb
+        cx, cy = divmod(k, nb)
+        noeuds: Set[int] = set()
+        for frontiere, cote, existe in (((k, 0), 0, cx + 1 < nb), ((k, 1), 0, cy + 1 < nb),
+                                        ((k - nb, 0), 1, cx > 0), ((k - 1, 1), 1, cy > 0)):
+            if existe:
+                noeuds.update(t[cote] for t in self.transitions[frontiere])
+        return noeuds
+
+    def _construire_cluster(self, k: int) -> None:
+        """Distances intra-cluster entre tous les nœuds de k (un BFS restreint par nœud)."""
+        noeuds = self._noeuds(k)
+        aretes: Dict[int, List[Tuple[int, int]]] = {}
+        for u in noeuds:
+            distance, _, _ = self._parcourir(u, k, noeuds)
+            aretes[u] = [(v, distance[v]) for v in noeuds if v != u and v in distance]
+        self.intra[k] = aretes
+        self.troncons[k] = {}
+
+    def _parcourir(self, source: int, k: int, cibles) -> Tuple[Dict[int, int], Dict[int, int], int]:
+        """
+        BFS depuis source restreint aux cases du cluster k, arrêté dès que
+        toutes les cibles sont atteintes. Retourne (distances, parents, explores).
+        """
+        cel = self.cellules
+        cluster_de = self.cluster_de
+        d0, d1, d2, d3 = self.laby.decalages
+        distance = {source: 0}
+        parent = {source: source}
+        restantes = len(cibles) - (source in cibles)
+        file = deque([source])
+        explores = 0
+        while file and restantes > 0:
+            i = file.popleft()
+            explores += 1
+            di = distance[i] + 1
+            for j in (i + d0, i + d1, i + d2, i + d3):
+                if cel[j] == 0 and cluster_de[j] == k and j not in distance:
+                    distance[j] = di
+                    parent[j] = i
+                    file.append(j)
+                    if j in cibles:
+                        restantes -= 1
+        return distance, parent, explores
+
+    # --- API de mutation ------------------------------------------------------
+
+    def modifier_cellule(self, x: int, y: int, valeur: int) -> None:
+        """
+        Écrit grille[x][y] = valeur (via laby.modifier_cellule) et marque le
+        cluster de la case, ainsi que la frontière qu'elle borde le cas
+        échéant; la reconstruction est faite à la requête suivante.
+        """
+        laby = self.laby
+        if laby.grille[x][y] == valeur:
+            return
+        self._verifier(laby)
+        laby.modifier_cellule(x, y, valeur)
+        i = laby.indice(x, y)
+        if self._copie:
+            self.cellules[i] = valeur
+        self._version = laby.version
+        self.mutations += 1
+
+        C, nb = self.taille_cluster, self.nb
+        k = self.cluster_de[i]
+        cx, cy = divmod(k, nb)
+        self._clusters_sales.add(k)
+        if x % C == C - 1 and cx + 1 < nb:
+            self._frontieres_sales.add((k, 0))
+        if x % C == 0 and cx > 0:
+            self._frontieres_sales.add((k - nb, 0))
+        if y % C == C - 1 and cy + 1 < nb:
+            self._frontieres_sales.add((k, 1))
+        if y % C == 0 and cy > 0:
+            self._frontieres_sales.add((k - 1, 1))
+
+    def basculer(self, x: int, y: int) -> None:
+        """Ouvre un mur ou ferme un passage."""
+        self.modifier_cellule(x, y, 0 if self.laby.grille[x][y] else 1)
+
+    def _verifier(self, laby: PrimLabyrinthe) -> None:
+        if laby.version != self._version:
+            raise ValueError("La grille a été modifiée hors de l'API de la hiérarchie "
+                             "(utiliser hierarchie.modifier_cellule)")
+
+    def _mettre_a_jour(self) -> int:
+        """Reconstruit les frontières et clusters touchés depuis la dernière requête."""
+        if self._frontieres_sales:
+            nb = self.nb
+            for frontiere in self._frontieres_sales:
+                if self._construire_frontiere(frontiere):
+                    k, sens = frontiere
+                    self._clusters_sales.update((k, k + (nb if sens == 0 else 1)))
+            self._frontieres_sales.clear()
+        for k in self._clusters_sales:
+            self._construire_cluster(k)
+        reconstruits = len(self._clusters_sales)
+        self._clusters_sales.clear()
+        self.clusters_reconstruits += reconstruits
+        return reconstruits
+
+    # --- requêtes ----------------------------------------------------------------
+
+    def chemin(self, start: Coord, goal: Coord) -> Tuple[Optional[List[Coord]], int]:
+        """
+        Chemin start -> goal par le graphe abstrait. Retourne (chemin | None,
+        explores) comme astar_manhattan, explores = nœuds dépilés par le
+        raccordement, la recherche abstraite et le raffinement (détail dans
+        self.derniere).
+        """
+        laby = self.laby
+        self._verifier(laby)
+        for x, y in (start, goal):
+            if laby.grille[x][y] != 0:
+                self.modifier_cellule(x, y, 0)
+        t0 = time.perf_counter()
+        reconstruits = self._mettre_a_jour()
+        t1 = time.perf_counter()
+        self.requetes += 1
+
+        S = laby.indice(*start)
+        G = laby.indice(*goal)
+        self.derniere = {'clusters_reconstruits': reconstruits,
+                         'temps_reconstruction_ms': (t1 - t0) * 1000.0}
+        if S == G:
+            return [start], 1
+        cluster_de = self.cluster_de
+        intra = self.intra
+        ks, kg = cluster_de[S], cluster_de[G]
+
+        # 1) raccordement: arêtes temporaires départ -> nœuds de son cluster
+        # (et arrivée si elle y est), nœuds du cluster d'arrivée -> arrivée
+        cibles = set(intra[ks])
+        if kg == ks:
+            cibles.add(G)
+        distance, _, explores_raccordement = self._parcourir(S, ks, cibles)
+        supplementaires: Dict[int, List[Tuple[int, int]]] = {
+            S: [(v, distance[v]) for v in cibles if v in distance and v != S]}
+        distance, _, e = self._parcourir(G, kg, intra[kg])
+        explores_raccordement += e
+        for v in intra[kg]:
+            if v in distance and v != G:
+                supplementaires.setdefault(v, []).append((G, distance[v]))
+
+        # 2) A* Manhattan sur le graphe abstrait
+        W = self.largeur
+        gx, gy = divmod(G, W)
+
+        def h(i: int) -> int:
+            x, y = divmod(i, W)
+            return abs(x - gx) + abs(y - gy)
+
+        inter = self.inter
+        dist = {S: 0}
+        parent: Dict[int, int] = {}
+        tas = [(h(S), 0, S)]
+        explores_abstrait = 0
+        trouve = False
+        while tas:
+            _, g, u = heapq.heappop(tas)
+            explores_abstrait += 1
+            if g != dist[u]:
+                continue
+            if u == G:
+                trouve = True
+                break
+            for aretes in (intra[cluster_de[u]].get(u, ()), inter.get(u, ()), supplementaires.get(u, ())):
+                for v, poids in aretes:
+                    ng = g + poids
+                    if ng < dist.get(v, ng + 1):
+                        dist[v] = ng
+                        parent[v] = u
+                        heapq.heappush(tas, (ng + h(v), ng, v))
+
+        self.derniere.update(explores_raccordement=explores_raccordement,
+                             explores_abstrait=explores_abstrait)
+        if not trouve:
+            self.derniere['explores_raffinement'] = 0
+            return None, explores_raccordement + explores_abstrait
+
+        # 3) raffinement: un tronçon par cluster du chemin abstrait
+        noeuds = [G]
+        while noeuds[-1] != S:
+            noeuds.append(parent[noeuds[-1]])
+        noeuds.reverse()
+        chemin_plat = [S]
+        explores_raffinement = 0
+        for u, v in zip(noeuds, noeuds[1:]):
+            k = cluster_de[u]
+            if cluster_de[v] != k:          # arête de transition: cases voisines
+                chemin_plat.append(v)
+                continue
+            troncons = self.troncons[k]
+            troncon = troncons.get((u, v))
+            if troncon is None:
+                _, par, e = self._parcourir(u, k, (v,))
+                explores_raffinement += e
+                troncon = [v]
+                while troncon[-1] != u:
+                    troncon.append(par[troncon[-1]])
+                troncon.reverse()
+                # départ et arrivée changent à chaque requête: seuls les
+                # tronçons entre nœuds abstraits valent d'être gardés
+                if u in intra[k] and v in intra[k]:
+                    troncons[(u, v)] = troncon
+            chemin_plat.extend(troncon[1:])
+
+        self.derniere.update(explores_raffinement=explores_raffinement,
+                             noeuds_abstraits=len(noeuds))
+        coord = laby.coord
+        return [coord(i) for i in chemin_plat], explores_raccordement + explores_abstrait + explores_raffinement
+
+    def statistiques(self) -> Dict[str, float]:
+        """Taille du graphe abstrait, coût de construction et compteurs des requêtes."""
+        return {
+            'clusters': self.nb * self.nb,
+            'noeuds': len(self.inter),
+            'aretes_intra': sum(len(a) for aretes in self.intra for a in aretes.values()) // 2,
+            'transitions': sum(len(t) for t in self.transitions.values()),
+            'duree_construction_s': self.duree_construction,
+            'requetes': self.requetes,
+            'mutations': self.mutations,
+            'clusters_reconstruits': self.clusters_reconstruits,
+        }
+
+
+# Hiérarchie de chaque labyrinthe vivant (clé faible: disparaît avec lui),
+# reconstruite si la grille a changé hors de l'API de la hiérarchie
+_CACHE: "weakref.WeakKeyDictionary[PrimLabyrinthe, HierarchieClusters]" = weakref.WeakKeyDictionary()
+
+
+def hierarchie_pour(laby: PrimLabyrinthe, taille_cluster: int = 16) -> HierarchieClusters:
+    """Hiérarchie de laby, construite au premier appel puis réutilisée tant que la grille ne change pas."""
+    hierarchie = _CACHE.get(laby)
+    if hierarchie is None or hierarchie.taille_cluster != taille_cluster or hierarchie._version != laby.version:
+        hierarchie = _CACHE[laby] = HierarchieClusters(laby, taille_cluster)
+    return hierarchie
+
+
+def astar_hpa(laby: PrimLabyrinthe, start: Coord, goal: Coord) -> Tuple[Optional[List[Coord]], int]:
+    """HPA* (hiérarchie de hierarchie_pour), même contrat que astar_manhattan."""
+    return hierarchie_pour(laby).chemin(start, goal)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    header = (f"{'Taille':>7} {'Cluster':>8} {'Nœuds abs.':>11} {'Prétrait. (s)':>14} "
+              f"{'Explorés A*':>12} {'Explorés HPA*':>14} {'A* (ms)':>9} {'HPA* (ms)':>10} "
+              f"{'Accél.':>7} {'Surcoût':>8}")
+    print(header)
+    print("-" * len(header))
+    for taille, tresse in ((501, False), (1001, False), (1001, True)):
+        laby = PrimLabyrinthe(taille, stockage="bytearray", seed=taille)
+        laby._generer("rapide")
+        if tresse:
+            # ouvrir 10% des murs internes: passages larges et cycles
+            for x in range(1, taille - 1):
+                for y in range(1, taille - 1):
+                    if (x + y) % 2 == 1 and rng.random() < 0.1:
+                        laby.modifier_cellule(x, y, 0)
+        hierarchie = HierarchieClusters(laby)
+        cellules = [(x, y) for x in range(1, taille - 1, 2) for y in range(1, taille - 1, 2)]
+        explores_a = explores_h = 0
+        temps_a = temps_h = 0.0
+        longueur_a = longueur_h = 0
+        for _ in range(20):
+            a, b = rng.sample(cellules, 2)
+            t0 = time.perf_counter()
+            chemin_a, e_a = astar_manhattan(laby, a, b)
+            t1 = time.perf_counter()
+            chemin_h, e_h = hierarchie.chemin(a, b)
+            t2 = time.perf_counter()
+            explores_a += e_a
+            explores_h += e_h
+            temps_a += t1 - t0
+            temps_h += t2 - t1
+            longueur_a += len(chemin_a) - 1
+            longueur_h += len(chemin_h) - 1
+        st = hierarchie.statistiques()
+        titre = f"{taille}{'t' if tresse else ''}"
+        print(f"{titre:>7} {hierarchie.taille_cluster:>8} {st['noeuds']:>11} {st['duree_construction_s']:>14.2f} "
+              f"{explores_a // 20:>12} {explores_h // 20:>14} {temps_a * 50.0:>9.2f} {temps_h * 50.0:>10.2f} "
+              f"{temps_a / temps_h:>6.1f}x {(longueur_h / longueur_a - 1) * 100.0:>7.2f}%")
+
+    # Éditions: seuls les clusters touchés sont reconstruits
+    murs_internes = [(x, y) for x in range(1, taille - 1) for y in range(1, taille - 1) if (x + y) % 2 == 1]
+    depart, arrivee = (1, 1), (taille - 2, taille - 2)
+    print(f"\nÉditions sur {taille}x{taille} ({hierarchie.nb * hierarchie.nb} clusters, "
+          f"construction complète {hierarchie.duree_construction:.2f} s):")
+    for _ in range(5):
+        for _ in range(3):
+            hierarchie.basculer(*rng.choice(murs_internes))
+        chemin, _ = hierarchie.chemin(depart, arrivee)
+        reference, _ = astar_manhattan(laby, depart, arrivee)
+        longueur = (len(chemin) - 1) if chemin else None
+        longueur_a = (len(reference) - 1) if reference else None
+        print(f"  3 murs basculés: {hierarchie.derniere['clusters_reconstruits']} clusters reconstruits en "
+              f"{hierarchie.derniere['temps_reconstruction_ms']:.1f} ms, longueur {longueur} (A*: {longueur_a})")
@@ -0,0 +1,279 @@
+import csv
+import heapq
+import json
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+Coord = Tuple[int, int]
+
+# Compteurs exportés, dans l'ordre des colonnes (CSV) et de l'affichage
+COMPTEURS = (
+    'empilements',              # entrées ajoutées à la file ouverte
+    'depilements',              # entrées retirées (= explores des recherches)
+    'depilements_perimes',      # entrées retirées mais obsolètes (meilleur g trouvé depuis)
+    'max_ouverts',              # taille maximale de la file ouverte
+    'evaluations_heuristique',  # appels à h(i)
+    'pic_memoire_octets',       # pic tracemalloc pendant la recherche (None si memoire=False)
+)
+PHASES = ('preparation', 'recherche', 'reconstruction')
+
+
+class StatistiquesRecherche:
+    """
+    Compteurs d'une recherche, remplis seulement si l'objet est passé en
+    argument (stats=...) à laby.bfs, astar_manhattan, astar_euclidienne ou
+    AStar_Moteur.astar. Sans stats, ces fonctions gardent leur boucle
+    d'origine: l'instrumentation est une boucle séparée (bfs_instrumente,
+    astar_instrumente), pas des tests ajoutés dans la boucle rapide.
+
+      - compteurs: voir COMPTEURS;
+      - temps_phases: secondes passées dans chaque phase de PHASES;
+      - rappel: fonction optionnelle appelée à chaque expansion avec
+        (case, g, taille de la file ouverte);
+      - memoire: mesure du pic d'allocation par tracemalloc, qui ralentit
+        les allocations: le passer à False pour des temps par phase fidèles.
+
+    Un même objet peut servir à plusieurs recherches: les compteurs
+    s'additionnent (max_ouverts et pic_memoire_octets gardent le maximum).
+    """
+
+    def __init__(self, rappel: Optional[Callable[[Coord, int, int], None]] = None,
+                 memoire: bool = True):
+        self.rappel = rappel
+        self.memoire = memoire
+        self.recherches = 0
+        self.empilements = 0
+        self.depilements = 0
+        self.depilements_perimes = 0
+        self.max_ouverts = 0
+        self.evaluations_heuristique = 0
+        self.pic_memoire_octets: Optional[int] = None
+        self.temps_phases: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+        self._t = 0.0
+        self._trace_externe = False
+
+    # --- chronométrage et mémoire ---------------------------------------
+
+    def _debut(self) -> None:
+        self.recherches += 1
+        if self.memoire:
+            self._trace_externe = tracemalloc.is_tracing()
+            if not self._trace_externe:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._t = time.perf_counter()
+
+    def _phase(self, phase: str) -> None:
+        """Termine la phase en cours (temps écoulé depuis la précédente)."""
+        t = time.perf_counter()
+        self.temps_phases[phase] += t - self._t
+        self._t = t
+
+    def _fin(self) -> None:
+        self._phase('reconstruction')
+        if self.memoire:
+            pic = tracemalloc.get_traced_memory()[1]
+            if not self._trace_externe:
+                tracemalloc.stop()
+            self.pic_memoire_octets = max(self.pic_memoire_octets or 0, pic)
+
+    # --- export ------------------------------------------------------------
+
+    def vers_dict(self) -> Dict[str, object]:
+        """Compteurs et temps par phase (en ms), à plat: une ligne de CSV ou un objet JSON."""
+        ligne: Dict[str, object] = {'recherches': self.recherches}
+        for nom in COMPTEURS:
+            ligne[nom] = getattr(self, nom)
+        for phase in PHASES:
+            ligne[f'temps_{phase}_ms'] = self.temps_phases[phase] * 1000.0
+        return ligne
+
+    def __repr__(self) -> str:
+        compteurs = ', '.join(f'{nom}={getattr(self, nom)}' for nom in COMPTEURS)
+        return f'StatistiquesRecherche({compteurs})'
+
+
+def bfs_instrumente(laby, depart: Coord, arrivee: Coord,
+                    stats: StatistiquesRecherche) -> Tuple[Optional[List[Coord]], int]:
+    """
+    laby.bfs avec compteurs: même ordre d'exploration que bfs / _bfs_plat
+    (voisins dans l'ordre de laby.decalages), donc même chemin et même
+    nb_explores. Pas d'heuristique ni d'entrée périmée dans un BFS.
+    """
+    stats._debut()
+    cellules = laby.grille_lecture()
+    decalages = laby.decalages
+    source = laby.indice(*depart)
+    cible = laby.indice(*arrivee)
+    parent = array('i', [-1]) * len(cellules)
+    parent[source] = source
+    queue = deque([source])
+    rappel = stats.rappel
+    coord = laby.coord
+    empilements, max_ouverts = 1, 1
+    explores = 0
+    distance = {source: 0} if rappel is not None else None
+    stats._phase('preparation')
+
+    trouve = False
+    while queue:
+        if len(queue) > max_ouverts:
+            max_ouverts = len(queue)
+        i = queue.popleft()
+        explores += 1
+        if rappel is not None:
+            rappel(coord(i), distance[i], len(queue))
+        if i == cible:
+            trouve = True
+            break
+        for d in decalages:
+            j = i + d
+            if cellules[j] == 0 and parent[j] < 0:
+                parent[j] = i
+                queue.append(j)
+                empilements += 1
+                if distance is not None:
+                    distance[j] = distance[i] + 1
+    stats.empilements += empilements
+    stats.depilements += explores
+    stats.max_ouverts = max(stats.max_ouverts, max_ouverts)
+    stats._phase('recherche')
+
+    chemin = None
+    if trouve:
+        i = cible
+        chemin = [arrivee]
+        while i != source:
+            i = parent[i]
+            chemin.append(coord(i))
+        chemin.reverse()
+    stats._fin()
+    return chemin, explores
+
+
+def astar_instrumente(laby, start: Coord, goal: Coord, heuristique,
+                      stats: StatistiquesRecherche) -> Tuple[Optional[List[Coord]], int]:
+    """
+    Copie instrumentée de la boucle d'AStar_Moteur.astar (mêmes clés
+    entières, même ordre d'expansion, même chemin et mêmes explores).
+    """
+    from AStar_Moteur import ECHELLE, preparer_heuristique
+
+    stats._debut()
+    laby.modifier_cellule(start[0], start[1], 0)
+    laby.modifier_cellule(goal[0], goal[1], 0)
+    cellules = laby.grille_lecture()
+    d0, d1, d2, d3 = laby.decalages
+    h = preparer_heuristique(laby, goal, heuristique)
+    source = laby.indice(*start)
+    cible = laby.indice(*goal)
+
+    n = len(cellules)
+    bits_i = n.bit_length()
+    bits_g = n.bit_length()
+    masque_i = (1 << bits_i) - 1
+    masque_g = (1 << bits_g) - 1
+    gscore = array('i', [-1]) * n
+    parent = array('i', [-1]) * n
+
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    rappel = stats.rappel
+    coord = laby.coord
+    gscore[source] = 0
+    tas = [(h(source) << (bits_g + bits_i)) | source]
+    evaluations, empilements, perimes, max_ouverts = 1, 1, 0, 1
+    explores = 0
+    stats._phase('preparation')
+
+    trouve = False
+    while tas:
+        if len(tas) > max_ouverts:
+            max_ouverts = len(tas)
+        cle = heappop(tas)
+        explores += 1
+        i = cle & masque_i
+        gcur = (cle >> bits_i) & masque_g
+        if gcur != gscore[i]:
+            perimes += 1
+            continue
+        if rappel is not None:
+            rappel(coord(i), gcur, len(tas))
+        if i == cible:
+            trouve = True
+            break
+        ng = gcur + 1
+        fg = ng * ECHELLE
+        for j in (i + d0, i + d1, i + d2, i + d3):
+            if cellules[j] == 0:
+                gj = gscore[j]
+                if gj < 0 or ng < gj:
+                    gscore[j] = ng
+                    parent[j] = i
+                    evaluations += 1
+                    empilements += 1
+                    heappush(tas, ((((fg + h(j)) << bits_g) | ng) << bits_i) | j)
+    stats.empilements += empilements
+    stats.depilements += explores
+    stats.depilements_perimes += perimes
+    stats.max_ouverts = max(stats.max_ouverts, max_ouverts)
+    stats.evaluations_heuristique += evaluations
+    stats._phase('recherche')
+
+    chemin = None
+    if trouve:
+        i = cible
+        chemin = [goal]
+        while i != source:
+            i = parent[i]
+            chemin.append(coord(i))
+        chemin.reverse()
+    stats._fin()
+    return chemin, explores
+
+
+def afficher_compteurs(lignes: Dict[str, Dict[str, object]]) -> None:
+    """Tableau algorithme -> compteurs (StatistiquesRecherche.vers_dict ou moyennes)."""
+    colonnes = [('Empilés', 'empilements'), ('Dépilés', 'depilements'),
+                ('Périmés', 'depilements_perimes'), ('Max file', 'max_ouverts'),
+                ('Éval. h', 'evaluations_heuristique'), ('Mém. (ko)', 'pic_memoire_octets'),
+                ('Prép. (ms)', 'temps_preparation_ms'), ('Rech. (ms)', 'temps_recherche_ms'),
+                ('Reconst. (ms)', 'temps_reconstruction_ms')]
+    header = f"{'Algorithme':<20} " + ' '.join(f'{titre:>13}' for titre, _ in colonnes)
+    print(header)
+    print("-" * len(header))
+    for algo, ligne in lignes.items():
+        valeurs = []
+        for _, cle in colonnes:
+            v = ligne.get(cle)
+            if v is None:
+                valeurs.append(f"{'-':>13}")
+            elif cle == 'pic_memoire_octets':
+                valeurs.append(f'{v / 1024.0:>13.1f}')
+            elif cle.endswith('_ms'):
+                valeurs.append(f'{v:>13.2f}')
+            else:
+                valeurs.append(f'{v:>13.0f}')
+        print(f"{algo:<20} " + ' '.join(valeurs))
+
+
+def exporter_compteurs(fichier: str, lignes: List[Dict[str, object]]) -> None:
+    """
+    Enregistre des lignes de compteurs (une par mesure, avec ses champs
+    d'identification: taille, test, algo...) en CSV ou, si le nom finit
+    par .json, en JSON.
+    """
+    if fichier.endswith('.json'):
+        with open(fichier, 'w', encoding='utf-8') as f:
+            json.dump(lignes, f, indent=2, ensure_ascii=False)
+        return
+    champs: List[str] = []
+    for ligne in lignes:
+        champs.extend(c for c in ligne if c not in champs)
+    with open(fichier, 'w', encoding='utf-8', newline='') as f:
+        ecrivain = csv.DictWriter(f, fieldnames=champs)
+        ecrivain.writeheader()
+        ecrivain.writerows(lignes)
@@ -0,0 +1,160 @@
+import random
+import time
+from array import array
+from typing import List, Optional, Tuple
+
+Coord = Tuple[int, int]
+
+
+class OracleDistances:
+    """
+    Oracle de distances pour labyrinthe parfait. Les cases ouvertes d'un
+    labyrinthe parfait forment un arbre (forêt si la grille a plusieurs
+    composantes): la distance entre deux cases est
+        prof(u) + prof(v) - 2 * prof(ppac(u, v))
+    où ppac est le plus proche ancêtre commun.
+
+    Construction en O(V log V):
+      - parcours en profondeur de la grille: parent, profondeur et ordre
+        préfixe (l'identifiant d'une case EST son rang préfixe);
+      - table creuse (sparse table) de minimums de (profondeur, id) sur
+        l'ordre préfixe. Pour u != v avec id(u) < id(v), le ppac est le
+        parent de la case de profondeur minimale dans ]id(u), id(v)].
+    Requêtes: distance() en O(1), chemin() en O(longueur du chemin).
+
+    L'oracle est un instantané de la grille: toute modification de la grille
+    impose de le reconstruire. Lève ValueError si la grille contient un cycle.
+    """
+
+    def __init__(self, laby):
+        t0 = time.perf_counter()
+        cellules = laby.grille_plate()
+        decalages = laby.decalages
+        n = len(cellules)
+        W = laby.largeur
+        self.taille = laby.taille
+        self.largeur = W
+
+        ident = array('i', [-1]) * n     # indice plat -> id (rang préfixe)
+        cases = array('i')               # id -> indice plat
+        parent = array('i')              # id -> id du parent (-1 pour une racine)
+        profondeur = array('i')
+        composante = array('i')
+
+        nb_composantes = 0
+        for racine in range(W, n - W):
+            if cellules[racine] != 0 or ident[racine] >= 0:
+                continue
+            # pile de (indice plat, id du parent); marquage à l'empilement
+            ident[racine] = -2
+            pile = [(racine, -1)]
+            while pile:
+                i, p = pile.pop()
+                u = len(cases)
+                ident[i] = u
+                cases.append(i)
+                parent.append(p)
+                profondeur.append(profondeur[p] + 1 if p >= 0 else 0)
+                composante.append(nb_composantes)
+                for d in decalages:
+                    j = i + d
+                    if cellules[j] != 0:
+                        continue
+                    if ident[j] == -1:
+                        ident[j] = -2
+                        pile.append((j, u))
+                    elif p < 0 or j != cases[p]:
+                        raise ValueError("La grille contient un cycle: "
+                                         "l'oracle exige un labyrinthe parfait.")
+            nb_composantes += 1
+
+        self.ident = ident
+        self.cases = cases
+        self.parent = parent
+        self.profondeur = profondeur
+        self.composante = composante
+        self.nb_composantes = nb_composantes
+
+        # Table creuse: niveau k = min des cles sur [i, i + 2^k[
+        V = len(cases)
+        self._bits = max(V.bit_length(), 1)
+        self._masque = (1 << self._bits) - 1
+        niveau = [(profondeur[u] << self._bits) | u for u in range(V)]
+        self.table = [array('q', niveau)]
+        largeur = 1
+        while 2 * largeur <= V:
+            niveau = list(map(min, niveau, niveau[largeur:]))
+            self.table.append(array('q', niveau))
+            largeur *= 2
+
+        self.temps_construction_ms = (time.perf_counter() - t0) * 1000.0
+
+    def _id(self, case: Coord) -> int:
+        return self.ident[(case[0] + 1) * self.largeur + (case[1] + 1)]
+
+    def _ppac(self, u: int, v: int) -> int:
+        """Plus proche ancêtre commun de deux ids d'une même composante."""
+        if u == v:
+            return u
+        if u > v:
+            u, v = v, u
+        k = (v - u).bit_length() - 1
+        niveau = self.table[k]
+        m = min(niveau[u + 1], niveau[v - (1 << k) + 1])
+        return self.parent[m & self._masque]
+
+    def distance(self, a: Coord, b: Coord) -> Optional[int]:
+        """Longueur (en pas) du chemin unique entre a et b, None si aucun chemin."""
+        u, v = self._id(a), self._id(b)
+        if u < 0 or v < 0 or self.composante[u] != self.composante[v]:
+            return None
+        prof = self.profondeur
+        return prof[u] + prof[v] - 2 * prof[self._ppac(u, v)]
+
+    def chemin(self, a: Coord, b: Coord) -> Optional[List[Coord]]:
+        """Chemin a -> b, extrait en remontant les parents jusqu'au ppac."""
+        u, v = self._id(a), self._id(b)
+        if u < 0 or v < 0 or self.composante[u] != self.composante[v]:
+            return None
+        w = self._ppac(u, v)
+        parent, cases, W = self.parent, self.cases, self.largeur
+        montee = []
+        while u != w:
+            montee.append(cases[u])
+            u = parent[u]
+        descente = []
+        while v != w:
+            descente.append(cases[v])
+            v = parent[v]
+        montee.append(cases[w])
+        montee.extend(reversed(descente))
+        return [(i // W - 1, i % W - 1) for i in montee]
+
+    def resultat(self, a: Coord, b: Coord) -> Tuple[Optional[List[Coord]], int]:
+        """Même contrat que laby.bfs: (chemin, explores), aucun nœud exploré."""
+        return self.chemin(a, b), 0
+
+
+if __name__ == "__main__":
+    from PrimLabytinthe import PrimLabyrinthe
+
+    taille = 301
+    random.seed(0)
+    laby = PrimLabyrinthe(taille, stockage="bytearray")
+    laby._generer("rapide")
+
+    oracle = laby.construire_oracle()
+    print(f"Oracle {taille}x{taille}: {len(oracle.cases)} cases, "
+          f"{len(oracle.table)} niveaux, construit en {oracle.temps_construction_ms:.1f} ms")
+
+    rng = random.Random(1)
+    cellules = [(x, y) for x in range(1, taille, 2) for y in range(1, taille, 2)]
+    paires = [(rng.choice(cellules), rng.choice(cellules)) for _ in range(100)]
+
+    t0 = time.perf_counter()
+    ref = [len(laby.bfs(a, b)[0]) - 1 for a, b in paires]
+    t1 = time.perf_counter()
+    res = [oracle.distance(a, b) for a, b in paires]
+    t2 = time.perf_counter()
+    assert ref == res
+    print(f"100 requêtes: BFS {(t1 - t0) * 1000.0:.1f} ms | oracle {(t2 - t1) * 1000.0:.3f} ms")
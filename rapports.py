@@ -0,0 +1,297 @@
+import json
+import math
+import os
+import sys
+
+_plt = None
+
+# Styles des courbes par algorithme
+MARQUEURS = {'BFS': 'o', 'A* Manhattan': 's', 'A* Euclidienne': '^',
+             'BFS bidirectionnel': 'v', 'A* bidirectionnel': 'D', 'A* saut': 'P',
+             'A* ALT': 'X', 'HPA*': 'h'}
+COULEURS = {'BFS': 'red', 'A* Manhattan': 'blue', 'A* Euclidienne': 'green',
+            'BFS bidirectionnel': 'orange', 'A* bidirectionnel': 'cyan',
+            'A* saut': 'magenta', 'A* ALT': 'black', 'HPA*': 'brown'}
+
+
+def sans_affichage():
+    """Vrai si aucun écran n'est disponible (serveur, conteneur, tâche par lots)."""
+    if os.environ.get('MPLBACKEND', '').lower() in ('agg', 'pdf', 'svg', 'ps', 'cairo'):
+        return True
+    if sys.platform.startswith('linux'):
+        return not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return False
+
+
+def _pyplot():
+    """
+    Importe matplotlib.pyplot à la demande (None s'il n'est pas installé).
+    Les modules de recherche et les analyseurs n'importent jamais matplotlib
+    eux-mêmes: seul un tracé en paie le coût. Sans écran, le backend "Agg"
+    est choisi et les figures sont seulement enregistrées.
+    """
+    global _plt
+    if _plt is None:
+        try:
+            import matplotlib
+            if sans_affichage():
+                matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+        except Exception:
+            return None
+        _plt = plt
+    return _plt
+
+
+def _montrer(plt, fig):
+    """plt.show() seulement si un écran est disponible; libère la figure sinon."""
+    if sans_affichage():
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+def afficher_labyrinthe(grille, taille, title=None, chemin=None, fichier=None):
+    """Affiche (ou enregistre dans 'fichier') une grille avec un chemin optionnel."""
+    plt = _pyplot()
+    if plt is None:
+        print("Matplotlib non disponible - affichage désactivé.")
+        if chemin:
+            longueur_aretes = len(chemin) - 1
+            print(f"[Sans affichage] Chemin trouvé (L={longueur_aretes})")
+        return
+    fig = plt.figure(figsize=(6, 6))
+    plt.imshow(grille, cmap='binary', interpolation='nearest')
+
+    # Overlay du chemin en rouge (si fourni)
+    if chemin:
+        xs = [y + 0.5 for (x, y) in chemin]
+        ys = [x + 0.5 for (x, y) in chemin]
+        plt.plot(xs, ys, color='red', linewidth=2, zorder=3)
+        # marquer début/fin
+        sx, sy = chemin[0]
+        ex, ey = chemin[-1]
+        plt.scatter([sy + 0.5], [sx + 0.5], c='green', s=40, zorder=4)
+        plt.scatter([ey + 0.5], [ex + 0.5], c='blue', s=40, zorder=4)
+
+    plt.xticks([]); plt.yticks([])
+    if title is None:
+        plt.title(f"Labyrinthe Prim {taille}×{taille}")
+    else:
+        plt.title(title)
+    if fichier is not None:
+        fig.savefig(fichier, dpi=150, bbox_inches='tight')
+    elif sans_affichage():
+        print("Aucun écran disponible - utiliser fichier=... pour enregistrer la figure.")
+    _montrer(plt, fig)
+
+
+def sauvegarder_scalabilite(fichier, tailles, donnees_temps, donnees_noeuds,
+                            donnees_temps_std, donnees_noeuds_std, donnees_compteurs=None):
+    """
+    Enregistre les séries de l'analyse de scalabilité en JSON
+    (donnees_compteurs: algorithme -> compteurs moyens par taille, optionnel).
+    """
+    series = {
+        'tailles': list(tailles),
+        'temps': donnees_temps,
+        'noeuds': donnees_noeuds,
+        'temps_std': donnees_temps_std,
+        'noeuds_std': donnees_noeuds_std,
+    }
+    if donnees_compteurs is not None:
+        series['compteurs'] = donnees_compteurs
+    with open(fichier, 'w', encoding='utf-8') as f:
+        json.dump(series, f, indent=2, ensure_ascii=False)
+
+
+def sauvegarder_etude_scalabilite(fichier, etude):
+    """Enregistre en JSON le résultat de AnalyseurScalabilite.etudier_scalabilite."""
+    with open(fichier, 'w', encoding='utf-8') as f:
+        json.dump(etude, f, indent=2, ensure_ascii=False)
+
+
+def tracer_scalabilite_depuis_fichier(fichier_json, fichier_png='analyse_scalabilite.png'):
+    """
+    Retrace les graphiques de scalabilité à partir d'un fichier de résultats
+    (analyse simple ou étude avec ajustements).
+    """
+    with open(fichier_json, encoding='utf-8') as f:
+        d = json.load(f)
+    if 'ajustements' in d:
+        tracer_etude_scalabilite(d, fichier_png)
+        return
+    tracer_scalabilite(d['tailles'], d['temps'], d['noeuds'], d['temps_std'], d['noeuds_std'],
+                       fichier_png)
+
+
+def tracer_scalabilite(tailles, donnees_temps, donnees_noeuds,
+                       donnees_temps_std, donnees_noeuds_std,
+                       fichier='analyse_scalabilite.png'):
+    """Génère les graphiques d'évolution et les enregistre dans 'fichier'"""
+    plt = _pyplot()
+    if plt is None:
+        print("Matplotlib non disponible - graphiques non générés.")
+        return
+    print("\n📊 Génération des graphiques...")
+
+    # Création de la figure avec plus d'espace
+    fig = plt.figure(figsize=(16, 10))
+
+    # Ajuster les marges pour éviter le chevauchement
+    plt.subplots_adjust(left=0.08, right=0.95, top=0.93, bottom=0.08,
+                        hspace=0.35, wspace=0.25)
+
+    # Créer les sous-graphiques
+    ax1 = plt.subplot(2, 2, 1)
+    ax2 = plt.subplot(2, 2, 2)
+    ax3 = plt.subplot(2, 2, 3)
+    ax4 = plt.subplot(2, 2, 4)
+
+    def moins(a, b):
+        return [x - y for x, y in zip(a, b)]
+
+    def plus(a, b):
+        return [x + y for x, y in zip(a, b)]
+
+    def rapport(a, b):
+        return [x / y for x, y in zip(a, b)]
+
+    # Graphique 1: Temps d'exécution
+    for algo in donnees_temps:
+        if donnees_temps[algo]:
+            ax1.plot(tailles[:len(donnees_temps[algo])], donnees_temps[algo],
+                     marker=MARQUEURS.get(algo, 'o'), color=COULEURS.get(algo), label=algo,
+                     linewidth=2.5, markersize=8)
+            ax1.fill_between(tailles[:len(donnees_temps[algo])],
+                             moins(donnees_temps[algo], donnees_temps_std[algo]),
+                             plus(donnees_temps[algo], donnees_temps_std[algo]),
+                             alpha=0.2, color=COULEURS.get(algo))
+
+    ax1.set_xlabel('Taille de la grille', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Temps (ms)', fontsize=11, fontweight='bold')
+    ax1.set_title('Temps d\'exécution vs Taille', fontsize=12, fontweight='bold', pad=10)
+    ax1.legend(fontsize=9, loc='upper left')
+    ax1.grid(True, alpha=0.3, linestyle='--')
+    ax1.tick_params(labelsize=9)
+
+    # Graphique 2: Nombre de nœuds explorés
+    for algo in donnees_noeuds:
+        if donnees_noeuds[algo]:
+            ax2.plot(tailles[:len(donnees_noeuds[algo])], donnees_noeuds[algo],
+                     marker=MARQUEURS.get(algo, 'o'), color=COULEURS.get(algo), label=algo,
+                     linewidth=2.5, markersize=8)
+            ax2.fill_between(tailles[:len(donnees_noeuds[algo])],
+                             moins(donnees_noeuds[algo], donnees_noeuds_std[algo]),
+                             plus(donnees_noeuds[algo], donnees_noeuds_std[algo]),
+                             alpha=0.2, color=COULEURS.get(algo))
+
+    ax2.set_xlabel('Taille de la grille', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Nœuds explorés', fontsize=11, fontweight='bold')
+    ax2.set_title('Nœuds explorés vs Taille', fontsize=12, fontweight='bold', pad=10)
+    ax2.legend(fontsize=9, loc='upper left')
+    ax2.grid(True, alpha=0.3, linestyle='--')
+    ax2.tick_params(labelsize=9)
+
+    # Graphique 3: Ratio d'efficacité (BFS / A*)
+    if len(donnees_noeuds['BFS']) == len(donnees_noeuds['A* Manhattan']):
+        ratio_man = rapport(donnees_noeuds['BFS'], donnees_noeuds['A* Manhattan'])
+        ratio_euc = rapport(donnees_noeuds['BFS'], donnees_noeuds['A* Euclidienne'])
+
+        ax3.plot(tailles[:len(donnees_noeuds['BFS'])], ratio_man,
+                 'b-o', label='BFS / A* Manhattan', linewidth=2.5, markersize=8)
+        ax3.plot(tailles[:len(donnees_noeuds['BFS'])], ratio_euc,
+                 'g-^', label='BFS / A* Euclidienne', linewidth=2.5, markersize=8)
+
+    ax3.set_xlabel('Taille de la grille', fontsize=11, fontweight='bold')
+    ax3.set_ylabel('Ratio', fontsize=11, fontweight='bold')
+    ax3.set_title('Gain d\'efficacité A*', fontsize=12, fontweight='bold', pad=10)
+    ax3.legend(fontsize=9, loc='upper left')
+    ax3.grid(True, alpha=0.3, linestyle='--')
+    ax3.tick_params(labelsize=9)
+    ax3.axhline(y=1, color='red', linestyle='--', alpha=0.5, linewidth=1)
+
+    # Graphique 4: Comparaison heuristiques
+    if len(donnees_noeuds['A* Manhattan']) == len(donnees_noeuds['A* Euclidienne']):
+        ratio_heur = rapport(donnees_noeuds['A* Euclidienne'], donnees_noeuds['A* Manhattan'])
+        ax4.plot(tailles[:len(donnees_noeuds['A* Manhattan'])], ratio_heur,
+                 color='purple', marker='D', linewidth=2.5, markersize=8,
+                 label='Euclidienne / Manhattan')
+        ax4.axhline(y=1, color='red', linestyle='--', alpha=0.7, linewidth=2,
+                    label='Égalité')
+
+    ax4.set_xlabel('Taille de la grille', fontsize=11, fontweight='bold')
+    ax4.set_ylabel('Ratio Euc / Man', fontsize=11, fontweight='bold')
+    ax4.set_title('Comparaison Heuristiques', fontsize=12, fontweight='bold', pad=10)
+    ax4.legend(fontsize=9, loc='upper left')
+    ax4.grid(True, alpha=0.3, linestyle='--')
+    ax4.tick_params(labelsize=9)
+
+    # Titre général
+    fig.suptitle('ANALYSE DE SCALABILITÉ ',
+                 fontsize=14, fontweight='bold', y=0.98)
+
+    # Sauvegarder avant tout affichage (plt.show() peut bloquer)
+    fig.savefig(fichier, dpi=300, bbox_inches='tight')
+    print(f"✓ Graphiques sauvegardés dans '{fichier}'")
+    _montrer(plt, fig)
+
+
+def tracer_etude_scalabilite(etude, fichier='etude_scalabilite.png'):
+    """
+    Graphiques log-log de l'étude de scalabilité: moyennes avec barres
+    d'erreur (IC à 95 %), droite ajustée et coude détecté (pointillés),
+    pour le temps de recherche, les nœuds explorés et la génération.
+    """
+    plt = _pyplot()
+    if plt is None:
+        print("Matplotlib non disponible - graphiques non générés.")
+        return
+    print("\n📊 Génération des graphiques...")
+
+    tailles = etude['tailles']
+    fig, axes = plt.subplots(1, 3, figsize=(20, 6))
+    generation = [serie for serie in etude['temps'] if serie not in etude['noeuds']]
+    panneaux = [
+        (axes[0], 'temps', [s for s in etude['temps'] if s not in generation], 'Temps (ms)', 'Temps de recherche'),
+        (axes[1], 'noeuds', list(etude['noeuds']), 'Nœuds explorés', 'Nœuds explorés'),
+        (axes[2], 'temps', generation, 'Temps (ms)', 'Génération (_generer)'),
+    ]
+    for ax, cle, series, ylabel, titre in panneaux:
+        ajustements = etude['ajustements'][cle]
+        for serie in series:
+            couleur = COULEURS.get(serie, 'gray')
+            # tailles sans mesure (None: aucun chemin trouvé) laissées vides
+            valeurs = [math.nan if v is None else v for v in etude[cle][serie]]
+            ic = [math.nan if v is None else v for v in etude[cle + '_ic'][serie]]
+            ax.errorbar(tailles, valeurs, yerr=ic,
+                        marker=MARQUEURS.get(serie, 'o'), color=couleur, linestyle='none',
+                        markersize=6, capsize=3)
+            analyse = ajustements.get(serie)
+            if analyse is None:
+                ax.plot([], [], marker=MARQUEURS.get(serie, 'o'), color=couleur, label=serie)
+                continue
+            a = analyse['ajustement']
+            ax.plot(tailles, [a['constante'] * t ** a['exposant'] for t in tailles], color=couleur,
+                    linewidth=1.5, label=f"{serie}: n^{a['exposant']:.2f} ± {a['erreur_exposant']:.2f}")
+            if analyse['rupture'] is not None:
+                ax.axvline(analyse['rupture']['taille_rupture'], color=couleur, linestyle=':', alpha=0.7)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Taille de la grille (n)', fontsize=11, fontweight='bold')
+        ax.set_ylabel(ylabel, fontsize=11, fontweight='bold')
+        ax.set_title(titre, fontsize=12, fontweight='bold', pad=10)
+        ax.legend(fontsize=9, loc='upper left')
+        ax.grid(True, which='both', alpha=0.3, linestyle='--')
+
+    fig.suptitle('ÉTUDE DE SCALABILITÉ (log-log, IC 95 %)', fontsize=14, fontweight='bold')
+    fig.savefig(fichier, dpi=200, bbox_inches='tight')
+    print(f"✓ Graphiques sauvegardés dans '{fichier}'")
+    _montrer(plt, fig)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python rapports.py resultats.json [sortie.png]")
+        sys.exit(2)
+    tracer_scalabilite_depuis_fichier(sys.argv[1], *(sys.argv[2:3]))
@@ -0,0 +1,258 @@
+import random
+import struct
+import sys
+import time
+import weakref
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PrimLabytinthe import PrimLabyrinthe
+from AStar_Moteur import ECHELLE, astar
+
+Coord = Tuple[int, int]
+
+# Section .plab des tables de repères:
+#   en-tête : k u32, octets par distance u32 (2 ou 4)
+#   repères : k × (x u32, y u32)
+#   tables  : k × (N+2)² distances petit-boutistes, indexées comme le tampon plat
+ETIQUETTE = b"REPA"
+EN_TETE = struct.Struct("<II")
+REPERE = struct.Struct("<II")
+
+
+class Reperes:
+    """
+    Heuristique ALT (A*, Landmarks, inégalité Triangulaire) précalculée pour
+    un labyrinthe: k repères et, pour chacun, la distance BFS de chaque case
+    (tableau plat compact: 'H' si toutes les distances tiennent sur 16 bits,
+    'I' sinon; la valeur maximale du type marque les cases non atteintes).
+
+    Pour tout repère L, |d(L, n) - d(L, but)| <= d(n, but): le maximum sur
+    les repères est un minorant admissible et cohérent, bien plus serré que
+    Manhattan dans un labyrinthe où le chemin fait de longs détours.
+
+    Repères choisis par point le plus éloigné: le premier est la case la
+    plus éloignée de 'origine', chaque suivant maximise la distance au
+    repère le plus proche déjà choisi. Ils tombent ainsi aux extrémités du
+    labyrinthe, là où l'inégalité triangulaire est la plus serrée.
+
+    S'utilise comme heuristique d'AStar_Moteur.astar (méthode preparer).
+    Les tables sont un instantané: si la grille change (laby.version ou
+    empreinte différentes), preparer lève ValueError.
+    """
+
+    def __init__(self, laby: PrimLabyrinthe, k: int = 16, origine: Optional[Coord] = None):
+        t0 = time.perf_counter()
+        self.k = k
+        self.taille = laby.taille
+        self.largeur = laby.largeur
+        self.empreinte = laby.empreinte()
+        self._associer(laby)
+        cellules = laby.grille_plate()
+        if origine is None:
+            depart = next((i for i, c in enumerate(cellules) if c == 0), None)
+            if depart is None:
+                raise ValueError("Aucune case ouverte: pas de repère possible")
+            origine = laby.coord(depart)
+
+        self.reperes: List[Coord] = []
+        tables = []
+        proche = laby.distances_depuis(origine).distances     # distance au repère le plus proche
+        for _ in range(k):
+            loin = max(proche)
+            if loin <= 0 and self.reperes:
+                break        # toutes les cases atteintes sont déjà des repères
+            repere = laby.coord(proche.index(loin))
+            distances = laby.distances_depuis(repere).distances
+            self.reperes.append(repere)
+            tables.append(distances)
+            proche = array('i', map(min, proche, distances))
+
+        grand = max((max(t) for t in tables), default=0)
+        self.code = 'H' if grand < 0xFFFF else 'I'
+        self.inatteint = 0xFFFF if self.code == 'H' else 0xFFFFFFFF
+        inatteint = self.inatteint
+        self.tables: List[array] = [array(self.code, [d if d >= 0 else inatteint for d in t]) for t in tables]
+        self.duree_construction = time.perf_counter() - t0
+
+    def __len__(self) -> int:
+        return len(self.reperes)
+
+    def octets(self) -> int:
+        """Taille des tables en mémoire."""
+        return sum(t.itemsize * len(t) for t in self.tables)
+
+    def _associer(self, laby: PrimLabyrinthe) -> None:
+        # référence faible: un autre labyrinthe créé plus tard à la même
+        # adresse (même id) ne doit pas passer pour celui-ci
+        self._laby = weakref.ref(laby)
+        self._version = laby.version
+
+    def correspond(self, laby: PrimLabyrinthe) -> bool:
+        """Vrai, sans calcul, si laby est le dernier labyrinthe vérifié et n'a pas changé depuis."""
+        return self._laby() is laby and laby.version == self._version
+
+    def verifier(self, laby: PrimLabyrinthe) -> None:
+        """Lève ValueError si les tables ne correspondent pas (ou plus) à la grille de laby."""
+        if self.correspond(laby):
+            return
+        if laby.taille != self.taille or laby.empreinte() != self.empreinte:
+            raise ValueError("Tables de repères périmées: la grille a changé depuis leur construction")
+        self._associer(laby)
+
+    def borne(self, laby: PrimLabyrinthe, a: Coord, b: Coord) -> int:
+        """Minorant ALT de la distance a -> b (en pas)."""
+        self.verifier(laby)
+        i, j = laby.indice(*a), laby.indice(*b)
+        return max((abs(t[i] - t[j]) for t in self.tables), default=0)
+
+    def preparer(self, laby: PrimLabyrinthe, goal: Coord) -> Callable[[int], int]:
+        """Crochet de AStar_Moteur.preparer_heuristique: h(i) en virgule fixe (ECHELLE)."""
+        self.verifier(laby)
+        g = laby.indice(*goal)
+        # repères qui atteignent le but seulement; une case d'une autre
+        # composante (non atteinte) reçoit un h énorme, sans conséquence:
+        # le but n'est de toute façon pas accessible depuis elle
+        paires = [(t, t[g]) for t in self.tables if t[g] != self.inatteint]
+
+        def h(i: int) -> int:
+            m = 0
+            for t, dg in paires:
+                d = t[i] - dg
+                if d < 0:
+                    d = -d
+                if d > m:
+                    m = d
+            return m * ECHELLE
+        return h
+
+    # --- sauvegarde avec le labyrinthe ------------------------------------
+
+    def vers_section(self) -> bytes:
+        """Section .plab (voir ETIQUETTE) contenant repères et tables."""
+        morceaux = [EN_TETE.pack(len(self.reperes), array(self.code).itemsize)]
+        morceaux.extend(REPERE.pack(x, y) for x, y in self.reperes)
+        for t in self.tables:
+            if sys.byteorder == "big":
+                t = array(self.code, t)
+                t.byteswap()
+            morceaux.append(t.tobytes())
+        return b"".join(morceaux)
+
+    @classmethod
+    def depuis_section(cls, laby: PrimLabyrinthe, donnees) -> "Reperes":
+        """Relit une section écrite par vers_section pour le labyrinthe laby (sans recalcul)."""
+        k, taille_distance = EN_TETE.unpack_from(donnees, 0)
+        code = {2: 'H', 4: 'I'}[taille_distance]
+        n = laby.largeur * laby.largeur
+        attendu = EN_TETE.size + k * REPERE.size + k * n * taille_distance
+        if len(donnees) != attendu:
+            raise ValueError(f"Section de repères incohérente ({len(donnees)} octets, {attendu} attendus)")
+        reperes = cls.__new__(cls)
+        reperes.k = k
+        reperes.taille = laby.taille
+        reperes.largeur = laby.largeur
+        reperes.empreinte = laby.empreinte()
+        reperes._associer(laby)
+        reperes.code = code
+        reperes.inatteint = (1 << (8 * taille_distance)) - 1
+        pos = EN_TETE.size
+        reperes.reperes = []
+        for _ in range(k):
+            reperes.reperes.append(REPERE.unpack_from(donnees, pos))
+            pos += REPERE.size
+        reperes.tables = []
+        for _ in range(k):
+            t = array(code)
+            t.frombytes(donnees[pos:pos + n * taille_distance])
+            if sys.byteorder == "big":
+                t.byteswap()
+            reperes.tables.append(t)
+            pos += n * taille_distance
+        reperes.duree_construction = 0.0
+        return reperes
+
+
+def sauvegarder(laby: PrimLabyrinthe, reperes: Reperes, fichier: str,
+                sections: Optional[Dict[bytes, bytes]] = None) -> int:
+    """Enregistre le labyrinthe (.plab) avec ses tables de repères en section."""
+    reperes.verifier(laby)
+    return laby.sauvegarder(fichier, {**(sections or {}), ETIQUETTE: reperes.vers_section()})
+
+
+def charger(fichier: str, stockage: str = "bytearray") -> Tuple[PrimLabyrinthe, Optional[Reperes]]:
+    """Relit un .plab et, s'il en contient, ses tables de repères (None sinon)."""
+    import format_labyrinthe
+    with format_labyrinthe.ouvrir(fichier) as lab:
+        laby = lab.vers_labyrinthe(stockage)
+        section = lab.section(ETIQUETTE)
+        if section is None:
+            return laby, None
+        try:
+            return laby, Reperes.depuis_section(laby, section)
+        finally:
+            section.release()
+
+
+# Repères déjà construits, par (empreinte de la grille, k): un prétraitement
+# par labyrinthe, partagé par ses copies (laby.copier())
+_CACHE: Dict[Tuple[bytes, int], Reperes] = {}
+TAILLE_CACHE = 16
+
+
+def reperes_pour(laby: PrimLabyrinthe, k: int = 16) -> Reperes:
+    """Repères de laby, construits au premier appel puis réutilisés tant que la grille ne change pas."""
+    for reperes in _CACHE.values():
+        if reperes.k == k and reperes.correspond(laby):
+            return reperes
+    cle = (laby.empreinte(), k)
+    reperes = _CACHE.get(cle)
+    if reperes is None:
+        if len(_CACHE) >= TAILLE_CACHE:
+            del _CACHE[next(iter(_CACHE))]
+        reperes = _CACHE[cle] = Reperes(laby, k)
+    reperes.verifier(laby)
+    return reperes
+
+
+def astar_alt(laby: PrimLabyrinthe, start: Coord, goal: Coord) -> Tuple[Optional[List[Coord]], int]:
+    """
+    A* avec l'heuristique ALT (repères de reperes_pour), même contrat que
+    astar_manhattan. Départ et arrivée sont ouverts d'abord (comme le fait
+    astar), pour que les repères soient ceux de la grille parcourue.
+    """
+    laby.modifier_cellule(start[0], start[1], 0)
+    laby.modifier_cellule(goal[0], goal[1], 0)
+    return astar(laby, start, goal, reperes_pour(laby))
+
+
+if __name__ == "__main__":
+    from AStar_Manhattan import astar_manhattan
+
+    rng = random.Random(0)
+    header = (f"{'Taille':>7} {'k':>3} {'Prétrait. (s)':>14} {'Tables (Mo)':>12} "
+              f"{'Explorés Manhattan':>19} {'Explorés ALT':>13} {'Gain':>6}")
+    print(header)
+    print("-" * len(header))
+    for taille in (201, 501, 1001):
+        laby = PrimLabyrinthe(taille, stockage="bytearray", seed=taille)
+        laby._generer("rapide")
+        reperes = Reperes(laby)
+        cellules = [(x, y) for x in range(1, taille - 1, 2) for y in range(1, taille - 1, 2)]
+        total_m = total_alt = 0
+        for _ in range(20):
+            a, b = rng.sample(cellules, 2)
+            chemin_m, explores_m = astar_manhattan(laby, a, b)
+            chemin_alt, explores_alt = astar(laby, a, b, reperes)
+            assert len(chemin_m) == len(chemin_alt)
+            total_m += explores_m
+            total_alt += explores_alt
+        print(f"{taille:>7} {len(reperes):>3} {reperes.duree_construction:>14.2f} "
+              f"{reperes.octets() / 1e6:>12.1f} {total_m // 20:>19} {total_alt // 20:>13} "
+              f"{total_m / max(total_alt, 1):>5.1f}x")
+
+    fichier = "labyrinthe_reperes.plab"
+    octets = sauvegarder(laby, reperes, fichier)
+    relu, reperes_relus = charger(fichier)
+    assert reperes_relus.reperes == reperes.reperes and reperes_relus.tables == reperes.tables
+    print(f"\nSauvegarde avec repères: {fichier} ({octets} octets), relu sans recalcul")
@@ -0,0 +1,301 @@
+import heapq
+import random
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from PrimLabytinthe import PrimLabyrinthe
+from AStar_Manhattan import astar_manhattan
+
+Coord = Tuple[int, int]
+
+INFINI = (1 << 31) - 1
+
+
+class PlanificateurIncremental:
+    """
+    Planificateur D* Lite (Koenig & Likhachev) vers un but fixe: la
+    recherche est faite à rebours depuis le but et son état (g, rhs, file
+    ouverte) est conservé d'une requête à l'autre.
+
+    - Les murs ne changent que par modifier_cellule / basculer (API de
+      mutation): seules les cases touchées et leurs voisines sont remises
+      en file, et la requête suivante ne répare que la partie du champ g
+      concernée par ces changements.
+    - Le départ peut changer entre deux requêtes (agent qui avance): le
+      décalage km de D* Lite évite de réordonner la file.
+    - Changer de but demande un nouveau planificateur. Le but peut être
+      fermé puis rouvert par l'API de mutation: tant qu'il est un mur,
+      chemin() retourne None.
+
+    Coûts unitaires, heuristique Manhattan vers le départ; clés de file
+    rangées dans des entiers (cle = ((k1 << bits) | k2) << bits | i) comme
+    dans AStar_Moteur, avec suppression paresseuse: cle_en_file[i] est la
+    seule clé valide de la case i (-1 si elle n'est pas en file).
+    """
+
+    def __init__(self, laby: PrimLabyrinthe, goal: Coord):
+        self.laby = laby
+        self.goal = goal
+        laby.modifier_cellule(goal[0], goal[1], 0)
+        # stockage "liste": grille_plate() est une copie, tenue à jour ici
+        self._copie = laby.cellules is None
+        self.cellules = laby.grille_plate()
+        self._version = laby.version
+        self.decalages = laby.decalages
+        W = laby.largeur
+        self.largeur = W
+
+        n = len(self.cellules)
+        self.bits = n.bit_length()
+        self.masque = (1 << self.bits) - 1
+        self.g = array('i', [INFINI]) * n
+        self.rhs = array('i', [INFINI]) * n
+        self.cle_en_file = array('q', [-1]) * n
+        self.deja_expanse = bytearray(n)
+        self.tas: List[int] = []
+        self.km = 0
+        self.cible = laby.indice(*goal)
+        self.depart: Optional[int] = None
+
+        self.requetes = 0
+        self.expansions_totales = 0
+        self.reexpansions_totales = 0
+        self.mutations = 0
+        self.derniere: Dict[str, int] = {}
+
+        self.rhs[self.cible] = 0
+        self._inserer(self.cible)
+
+    # --- file de priorité -------------------------------------------------
+
+    def _h(self, i: int) -> int:
+        """Manhattan entre la case i et le départ courant (0 sans départ)."""
+        if self.depart is None:
+            return 0
+        W = self.largeur
+        xi, yi = divmod(i, W)
+        xd, yd = divmod(self.depart, W)
+        return abs(xi - xd) + abs(yi - yd)
+
+    def _cle(self, i: int) -> int:
+        m = min(self.g[i], self.rhs[i])
+        # k2 borné à son champ: INFINI déborderait dans k1
+        return ((m + self._h(i) + self.km) << self.bits) | min(m, self.masque)
+
+    def _inserer(self, i: int) -> None:
+        cle = (self._cle(i) << self.bits) | i
+        self.cle_en_file[i] = cle
+        heapq.heappush(self.tas, cle)
+
+    def _sommet(self) -> int:
+        """Plus petite clé valide de la file (sans la retirer), -1 si vide."""
+        tas = self.tas
+        while tas:
+            cle = tas[0]
+            if self.cle_en_file[cle & self.masque] == cle:
+                return cle
+            heapq.heappop(tas)
+        return -1
+
+    def _mettre_a_jour(self, i: int) -> None:
+        """UpdateVertex: recalcule rhs(i) et replace i dans la file si incohérent."""
+        cellules = self.cellules
+        if i == self.cible:
+            self.rhs[i] = 0 if cellules[i] == 0 else INFINI
+        else:
+            meilleur = INFINI
+            if cellules[i] == 0:
+                g = self.g
+                for d in self.decalages:
+                    j = i + d
+                    if cellules[j] == 0 and g[j] < meilleur:
+                        meilleur = g[j]
+                if meilleur < INFINI:
+                    meilleur += 1
+            self.rhs[i] = meilleur
+        self.cle_en_file[i] = -1
+        if self.g[i] != self.rhs[i]:
+            self._inserer(i)
+
+    def _calculer(self) -> Tuple[int, int]:
+        """ComputeShortestPath; retourne (expansions, réexpansions) de cet appel."""
+        g, rhs = self.g, self.rhs
+        cellules, decalages = self.cellules, self.decalages
+        depart = self.depart
+        masque, bits = self.masque, self.bits
+        deja = self.deja_expanse
+        expansions = reexpansions = 0
+        while True:
+            sommet = self._sommet()
+            if sommet < 0:
+                break
+            if (sommet >> bits) >= self._cle(depart) and rhs[depart] == g[depart]:
+                break
+            heapq.heappop(self.tas)
+            i = sommet & masque
+            self.cle_en_file[i] = -1
+            nouvelle = self._cle(i)
+            if (sommet >> bits) < nouvelle:
+                self._inserer(i)            # clé périmée (km a augmenté)
+                continue
+            expansions += 1
+            if deja[i]:
+                reexpansions += 1
+            deja[i] = 1
+            if g[i] > rhs[i]:
+                g[i] = rhs[i]
+            else:
+                g[i] = INFINI
+                self._mettre_a_jour(i)
+            for d in decalages:
+                j = i + d
+                if cellules[j] == 0:
+                    self._mettre_a_jour(j)
+        return expansions, reexpansions
+
+    # --- API de mutation ---------------------------------------------------
+
+    def modifier_cellule(self, x: int, y: int, valeur: int) -> None:
+        """
+        Écrit grille[x][y] = valeur (via laby.modifier_cellule) et remet en
+        cohérence la case et ses 4 voisines; la réparation elle-même est
+        faite à la requête suivante. Lève ValueError, sans rien modifier, si
+        la grille a déjà été modifiée hors de cette API.
+        """
+        laby = self.laby
+        self._verifier()
+        if laby.grille[x][y] == valeur:
+            return
+        laby.modifier_cellule(x, y, valeur)
+        i = laby.indice(x, y)
+        if self._copie:
+            self.cellules[i] = valeur
+        self._version = laby.version
+        self.mutations += 1
+        if valeur != 0:
+            self.g[i] = INFINI       # case devenue mur: plus aucun chemin par elle
+        self._mettre_a_jour(i)
+        for d in self.decalages:
+            j = i + d
+            if self.cellules[j] == 0:
+                self._mettre_a_jour(j)
+
+    def _verifier(self) -> None:
+        """Lève ValueError si la grille a changé hors de cette API (l'état D* Lite ne le verrait pas)."""
+        if self.laby.version != self._version:
+            raise ValueError("La grille a été modifiée hors de l'API du planificateur "
+                             "(utiliser planificateur.modifier_cellule)")
+
+    def basculer(self, x: int, y: int) -> None:
+        """Ouvre un mur ou ferme un passage."""
+        self.modifier_cellule(x, y, 0 if self.laby.grille[x][y] else 1)
+
+    # --- requêtes ----------------------------------------------------------
+
+    def chemin(self, start: Coord, comparer: bool = False) -> Tuple[Optional[List[Coord]], int]:
+        """
+        Plus court chemin start -> but, en réutilisant l'état des requêtes
+        précédentes. Retourne (chemin | None, explores) comme
+        astar_manhattan, explores = nœuds expandus par cette requête.
+        comparer=True mesure aussi les explores d'un astar_manhattan complet
+        (dans self.derniere['explores_replan_complet']).
+        """
+        laby = self.laby
+        self._verifier()
+        if laby.grille[start[0]][start[1]] != 0:
+            self.modifier_cellule(start[0], start[1], 0)
+
+        nouveau = laby.indice(*start)
+        if self.depart is not None and nouveau != self.depart:
+            self.km += self._h(nouveau)     # h(ancien départ, nouveau départ)
+        self.depart = nouveau
+
+        if self.cellules[self.cible] != 0:
+            # but fermé: aucun chemin; la réparation attend sa réouverture
+            self.requetes += 1
+            self.derniere = {'expansions': 0, 'reexpansions': 0}
+            return None, 0
+
+        expansions, reexpansions = self._calculer()
+        self.requetes += 1
+        self.expansions_totales += expansions
+        self.reexpansions_totales += reexpansions
+        self.derniere = {'expansions': expansions, 'reexpansions': reexpansions}
+        chemin = self._extraire(nouveau)
+        if comparer:
+            _, explores_complet = astar_manhattan(laby, start, self.goal)
+            self.derniere['explores_replan_complet'] = explores_complet
+        return chemin, expansions
+
+    def _extraire(self, i: int) -> Optional[List[Coord]]:
+        """Descente gloutonne depuis le départ: à chaque pas, le voisin de plus petit g."""
+        g, cellules, decalages = self.g, self.cellules, self.decalages
+        if self.rhs[i] >= INFINI:
+            return None
+        coord = self.laby.coord
+        chemin = [coord(i)]
+        for _ in range(self.rhs[i]):
+            suivant, meilleur = -1, INFINI
+            for d in decalages:
+                j = i + d
+                if cellules[j] == 0 and g[j] < meilleur:
+                    suivant, meilleur = j, g[j]
+            if suivant < 0:
+                return None
+            i = suivant
+            chemin.append(coord(i))
+        return chemin if i == self.cible else None
+
+    def statistiques(self) -> Dict[str, int]:
+        return {
+            'requetes': self.requetes,
+            'mutations': self.mutations,
+            'expansions': self.expansions_totales,
+            'reexpansions': self.reexpansions_totales,
+            **{f'derniere_{k}': v for k, v in self.derniere.items()},
+        }
+
+
+if __name__ == "__main__":
+    taille = 201
+    laby = PrimLabyrinthe(taille, stockage="bytearray", seed=0)
+    laby._generer("rapide")
+    goal = (taille - 2, taille - 2)
+    start = (1, 1)
+    rng = random.Random(1)
+    murs_internes = [(x, y) for x in range(1, taille - 1) for y in range(1, taille - 1)
+                     if (x + y) % 2 == 1]
+    # labyrinthe "tressé": des cycles, pour qu'un passage fermé n'isole pas le but
+    for x, y in rng.sample(murs_internes, len(murs_internes) // 10):
+        laby.modifier_cellule(x, y, 0)
+
+    planificateur = PlanificateurIncremental(laby, goal)
+    t0 = time.perf_counter()
+    planificateur.chemin(start)
+    t1 = time.perf_counter()
+    print(f"Requête initiale: {planificateur.derniere['expansions']} expansions "
+          f"({(t1 - t0) * 1000.0:.1f} ms)")
+
+    header = f"{'Requête':>8} {'Incrémental':>12} {'dont réexp.':>12} {'Replan A*':>10} {'Longueur':>9}"
+    print(header)
+    print("-" * len(header))
+    total_inc = total_complet = 0
+    temps_inc = temps_complet = 0.0
+    for q in range(20):
+        for _ in range(3):     # quelques murs basculés entre deux requêtes
+            planificateur.basculer(*rng.choice(murs_internes))
+        t0 = time.perf_counter()
+        chemin, explores = planificateur.chemin(start)
+        t1 = time.perf_counter()
+        _, explores_complet = astar_manhattan(laby, start, goal)
+        t2 = time.perf_counter()
+        total_inc += explores
+        total_complet += explores_complet
+        temps_inc += t1 - t0
+        temps_complet += t2 - t1
+        longueur = (len(chemin) - 1) if chemin else None
+        print(f"{q + 1:>8} {explores:>12} {planificateur.derniere['reexpansions']:>12} "
+              f"{explores_complet:>10} {str(longueur):>9}")
+    print(f"\nTotal: incrémental {total_inc} nœuds ({temps_inc * 1000.0:.1f} ms) | "
+          f"replans A* complets {total_complet} nœuds ({temps_complet * 1000.0:.1f} ms)")
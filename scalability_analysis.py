@@ -1,77 +1,298 @@
-import matplotlib.pyplot as plt
-import numpy as np
+import argparse
+import gc
+import math
+import random
+import statistics
 import time
+from typing import Dict, List, Optional, Sequence
 from PrimLabytinthe import PrimLabyrinthe
-from AStar_Manhattan import astar_manhattan
-from AStar_Euclidienne import astar_euclidienne
+from analyzer import ALGORITHMES, ALGORITHMES_INSTRUMENTES, mesurer_compteurs, pretraiter
+from execution_parallele import executer_taches, generer_labyrinthe_test, graine_tache
+import rapports
+
+# Algorithmes de l'étude à grande échelle par défaut: sans prétraitement
+# lourd (ALT, HPA* coûtent des secondes par labyrinthe au-delà de 1000)
+ALGORITHMES_ETUDE = ('BFS', 'A* Manhattan', 'A* Euclidienne', 'A* saut')
+SERIE_GENERATION = 'Génération'
+# Écart de BIC à partir duquel le modèle avec rupture est retenu
+# (> 6: preuve « forte » selon Kass & Raftery)
+SEUIL_BIC = 6.0
+
+
+def tailles_geometriques(taille_min: int = 15, taille_max: int = 2001, nb_tailles: int = 12) -> List[int]:
+    """nb_tailles tailles impaires (Prim) en progression géométrique de taille_min à taille_max."""
+    raison = (taille_max / taille_min) ** (1.0 / (nb_tailles - 1))
+    tailles: List[int] = []
+    for k in range(nb_tailles):
+        t = int(round(taille_min * raison ** k)) | 1
+        if not tailles or t > tailles[-1]:
+            tailles.append(t)
+    return tailles
+
+
+def quantile_student(p: float, ddl: int) -> float:
+    """
+    Quantile p de la loi de Student à ddl degrés de liberté: formes exactes
+    pour 1 et 2, développement de Cornish-Fisher au-delà (erreur < 1 % dès 3).
+    """
+    if ddl == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if ddl == 2:
+        return (2 * p - 1) * math.sqrt(2.0 / (4 * p * (1 - p)))
+    z = statistics.NormalDist().inv_cdf(p)
+    return (z + (z ** 3 + z) / (4 * ddl)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * ddl ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * ddl ** 3))
+
+
+def demi_largeur_ic(valeurs: Sequence[float], niveau: float = 0.95) -> float:
+    """Demi-largeur de l'intervalle de confiance (Student) de la moyenne."""
+    n = len(valeurs)
+    if n < 2:
+        return math.inf
+    return quantile_student(0.5 + niveau / 2, n - 1) * statistics.stdev(valeurs) / math.sqrt(n)
+
+
+def _moindres_carres(colonnes: Sequence[Sequence[float]], y: Sequence[float],
+                     poids: Optional[Sequence[float]] = None):
+    """
+    Moindres carrés y ≈ Σ coef_j · colonne_j (équations normales, pivot de
+    Gauss), pondérés par 'poids' s'il est donné. Retourne (coefficients,
+    erreurs standard, somme pondérée des carrés des résidus).
+    """
+    p, n = len(colonnes), len(y)
+    if poids is not None:
+        racines = [math.sqrt(w) for w in poids]
+        colonnes = [[v * r for v, r in zip(colonne, racines)] for colonne in colonnes]
+        y = [v * r for v, r in zip(y, racines)]
+    # [X'X | X'y | I]: l'inverse de X'X donne les variances des coefficients
+    m = [[sum(a * b for a, b in zip(colonnes[i], colonnes[j])) for j in range(p)]
+         + [sum(a * b for a, b in zip(colonnes[i], y))]
+         + [float(i == j) for j in range(p)] for i in range(p)]
+    for c in range(p):
+        pivot = max(range(c, p), key=lambda r: abs(m[r][c]))
+        m[c], m[pivot] = m[pivot], m[c]
+        if m[c][c] == 0:
+            raise ValueError("Régression dégénérée (tailles toutes égales?)")
+        diviseur = m[c][c]
+        m[c] = [v / diviseur for v in m[c]]
+        for r in range(p):
+            if r != c and m[r][c] != 0:
+                facteur = m[r][c]
+                m[r] = [a - facteur * b for a, b in zip(m[r], m[c])]
+    coefs = [m[i][p] for i in range(p)]
+    residus = [yi - sum(coefs[j] * colonnes[j][i] for j in range(p)) for i, yi in enumerate(y)]
+    sce = sum(r * r for r in residus)
+    variance = sce / (n - p) if n > p else math.inf
+    erreurs = [math.sqrt(max(variance * m[i][p + 1 + i], 0.0)) for i in range(p)]
+    return coefs, erreurs, sce
+
+
+def _poids_log(valeurs: Sequence[float], erreurs: Optional[Sequence[float]]) -> Optional[List[float]]:
+    """
+    Poids 1 / (erreur relative)² des points log-log: la variance de
+    ln(moyenne) vaut à peu près (erreur / moyenne)². None (pas de
+    pondération) si une erreur manque ou est nulle.
+    """
+    if erreurs is None:
+        return None
+    relatives = [e / v for v, e in zip(valeurs, erreurs) if v > 0]
+    if not all(0 < r < math.inf for r in relatives):
+        return None
+    return [1.0 / (r * r) for r in relatives]
+
+
+def ajuster_loi_puissance(tailles: Sequence[float], valeurs: Sequence[float],
+                          erreurs: Optional[Sequence[float]] = None) -> Dict[str, object]:
+    """
+    Régression log-log valeur ≈ constante · taille^exposant sur tous les
+    points (pas seulement le premier et le dernier): exposant, son erreur
+    standard et son intervalle de confiance à 95 % (Student, n - 2 ddl), R².
+    erreurs: demi-largeurs d'IC des valeurs; la régression est alors
+    pondérée (voir _poids_log), les tailles mal mesurées comptant moins.
+    """
+    points = [(math.log(t), math.log(v)) for t, v in zip(tailles, valeurs) if v > 0]
+    if len(points) < 3:
+        raise ValueError("Au moins 3 tailles sont nécessaires pour un ajustement avec erreur")
+    x = [a for a, _ in points]
+    y = [b for _, b in points]
+    poids = _poids_log(valeurs, erreurs)
+    (a, b), (_, erreur_b), sce = _moindres_carres([[1.0] * len(x), x], y, poids)
+    if poids is None:
+        poids = [1.0] * len(y)
+    moyenne = sum(w * v for w, v in zip(poids, y)) / sum(poids)
+    sct = sum(w * (v - moyenne) ** 2 for w, v in zip(poids, y))
+    t = quantile_student(0.975, len(x) - 2)
+    return {
+        'exposant': b,
+        'erreur_exposant': erreur_b,
+        'ic95_exposant': [b - t * erreur_b, b + t * erreur_b],
+        'constante': math.exp(a),
+        'r2': 1.0 - sce / sct if sct > 0 else 1.0,
+        'points': len(x),
+        'pondere': erreurs is not None and _poids_log(valeurs, erreurs) is not None,
+    }
+
+
+def detecter_rupture(tailles: Sequence[float], valeurs: Sequence[float],
+                     erreurs: Optional[Sequence[float]] = None,
+                     min_points: int = 3) -> Optional[Dict[str, object]]:
+    """
+    Cherche un coude de la courbe log-log: régression segmentée continue
+    y = a + b·x + c·max(0, x - x_k) pour chaque taille mesurée x_k laissant
+    min_points points de chaque côté. Le meilleur coude n'est retenu que si
+    son BIC (4 paramètres, coude compris) bat celui de la droite unique
+    d'au moins SEUIL_BIC. Retourne None sinon (ou s'il y a trop peu de points).
+    erreurs: pondération comme dans ajuster_loi_puissance.
+    """
+    points = [(math.log(t), math.log(v), t) for t, v in zip(tailles, valeurs) if v > 0]
+    n = len(points)
+    if n < 2 * min_points:
+        return None
+    x = [a for a, _, _ in points]
+    y = [b for _, b, _ in points]
+    uns = [1.0] * n
+    poids = _poids_log(valeurs, erreurs)
+
+    def bic(sce: float, nb_parametres: int) -> float:
+        return n * math.log(max(sce, 1e-300) / n) + nb_parametres * math.log(n)
+
+    _, _, sce_droite = _moindres_carres([uns, x], y, poids)
+    meilleur = None
+    for k in range(min_points - 1, n - min_points + 1):
+        charniere = [max(0.0, xi - x[k]) for xi in x]
+        coefs, erreurs_coefs, sce = _moindres_carres([uns, x, charniere], y, poids)
+        if meilleur is None or sce < meilleur[0]:
+            meilleur = (sce, k, coefs, erreurs_coefs)
+    sce, k, (_, b, c), (_, erreur_b, erreur_c) = meilleur
+    gain = bic(sce_droite, 2) - bic(sce, 4)
+    if gain < SEUIL_BIC:
+        return None
+    return {
+        'taille_rupture': points[k][2],
+        'exposant_avant': b,
+        'erreur_avant': erreur_b,
+        'exposant_apres': b + c,
+        'erreur_variation': erreur_c,
+        'gain_bic': gain,
+    }
+
+
+def _chronometrer(fonction, *args):
+    """(résultat, durée en ms) de fonction(*args), ramasse-miettes désactivé pendant la mesure."""
+    gc.collect()
+    gc_actif = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        resultat = fonction(*args)
+        t1 = time.perf_counter()
+    finally:
+        if gc_actif:
+            gc.enable()
+    return resultat, (t1 - t0) * 1000.0
+
 
 class AnalyseurScalabilite:
     def __init__(self):
         self.resultats = {}
     
-    def analyser_scalabilite(self, tailles=[15, 25, 35, 45], nb_tests_par_taille=3):
+    def analyser_scalabilite(self, tailles=[15, 25, 35, 45], nb_tests_par_taille=3,
+                             nb_processus=1, graine=None,
+                             fichier_resultats='analyse_scalabilite.json', instrumenter=False):
         """
         Analyse l'évolution des performances avec la taille des grilles
+
+        nb_processus / graine: voir AnalyseurPerformance.executer_comparaison_complete;
+        en mode parallèle, toutes les tâches (taille, test, algorithme) sont
+        réparties sur le pool en une seule fois.
+        fichier_resultats: séries enregistrées en JSON (None pour ne rien
+        écrire), retraçables avec `python rapports.py <fichier>`.
+        instrumenter: relève aussi les compteurs de recherche (voir
+        instrumentation) des algorithmes instrumentables; leurs moyennes par
+        taille sont affichées et ajoutées au fichier de résultats.
         """
         
+        resultats_paralleles = None
+        if nb_processus != 1:
+            if graine is None:
+                graine = random.getrandbits(32)
+            print(f"Exécution parallèle (processus: {nb_processus or 'tous les cœurs'}, graine: {graine})")
+            taches = [(taille, test, algo, graine, instrumenter) for taille in tailles
+                      for test in range(nb_tests_par_taille) for algo in ALGORITHMES]
+            resultats_paralleles = executer_taches(taches, nb_processus)
         
         # Structures pour stocker les données
-        donnees_temps = {'BFS': [], 'A* Manhattan': [], 'A* Euclidienne': []}
-        donnees_noeuds = {'BFS': [], 'A* Manhattan': [], 'A* Euclidienne': []}
-        donnees_temps_std = {'BFS': [], 'A* Manhattan': [], 'A* Euclidienne': []}
-        donnees_noeuds_std = {'BFS': [], 'A* Manhattan': [], 'A* Euclidienne': []}
+        donnees_temps = {algo: [] for algo in ALGORITHMES}
+        donnees_noeuds = {algo: [] for algo in ALGORITHMES}
+        donnees_temps_std = {algo: [] for algo in ALGORITHMES}
+        donnees_noeuds_std = {algo: [] for algo in ALGORITHMES}
+        donnees_compteurs = {algo: [] for algo in ALGORITHMES_INSTRUMENTES} if instrumenter else None
         
         for taille in tailles:
             print(f"\n--- Analyse pour grille {taille}x{taille} ---")
             
-            temps_taille = {'BFS': [], 'A* Manhattan': [], 'A* Euclidienne': []}
-            noeuds_taille = {'BFS': [], 'A* Manhattan': [], 'A* Euclidienne': []}
+            temps_taille = {algo: [] for algo in ALGORITHMES}
+            noeuds_taille = {algo: [] for algo in ALGORITHMES}
+            compteurs_taille = {algo: [] for algo in ALGORITHMES}
             
-            for test in range(nb_tests_par_taille):
+            if resultats_paralleles is not None:
+                # Fusion des résultats du pool pour cette taille
+                for res in resultats_paralleles:
+                    if res['taille'] == taille and res['longueur'] is not None:
+                        temps_taille[res['algo']].append(res['temps'])
+                        noeuds_taille[res['algo']].append(res['noeuds'])
+                        if res.get('compteurs') is not None:
+                            compteurs_taille[res['algo']].append(res['compteurs'])
+            
+            for test in range(nb_tests_par_taille if resultats_paralleles is None else 0):
                 print(f"  Test {test+1}/{nb_tests_par_taille}...")
                 
                 # Générer labyrinthe
-                laby = PrimLabyrinthe(taille)
-                laby._generer()
+                if graine is not None:
+                    laby = generer_labyrinthe_test(graine, taille, test)
+                else:
+                    laby = PrimLabyrinthe(taille)
+                    laby._generer()
                 start = (1, 1)
                 goal = (taille-2, taille-2)
                 
-                # Mesurer BFS
-                t0 = time.perf_counter()
-                chemin_bfs, noeuds_bfs = laby.bfs(start, goal)
-                t1 = time.perf_counter()
-                if chemin_bfs:
-                    temps_taille['BFS'].append((t1 - t0) * 1000.0)
-                    noeuds_taille['BFS'].append(noeuds_bfs)
-                
-                # Mesurer A* Manhattan
-                t2 = time.perf_counter()
-                chemin_man, noeuds_man = astar_manhattan(laby, start, goal)
-                t3 = time.perf_counter()
-                if chemin_man:
-                    temps_taille['A* Manhattan'].append((t3 - t2) * 1000.0)
-                    noeuds_taille['A* Manhattan'].append(noeuds_man)
-                
-                # Mesurer A* Euclidienne
-                t4 = time.perf_counter()
-                chemin_euc, noeuds_euc = astar_euclidienne(laby, start, goal)
-                t5 = time.perf_counter()
-                if chemin_euc:
-                    temps_taille['A* Euclidienne'].append((t5 - t4) * 1000.0)
-                    noeuds_taille['A* Euclidienne'].append(noeuds_euc)
+                # Mesurer chaque algorithme
+                for algo, recherche in ALGORITHMES.items():
+                    pretraiter(algo, laby)
+                    t0 = time.perf_counter()
+                    chemin, noeuds = recherche(laby, start, goal)
+                    t1 = time.perf_counter()
+                    if chemin:
+                        temps_taille[algo].append((t1 - t0) * 1000.0)
+                        noeuds_taille[algo].append(noeuds)
+                        if instrumenter and algo in ALGORITHMES_INSTRUMENTES:
+                            compteurs_taille[algo].append(mesurer_compteurs(algo, laby, start, goal))
             
             # Calculer moyennes et écarts-types pour cette taille
-            for algo in ['BFS', 'A* Manhattan', 'A* Euclidienne']:
+            for algo in ALGORITHMES:
                 if temps_taille[algo]:
-                    donnees_temps[algo].append(np.mean(temps_taille[algo]))
-                    donnees_noeuds[algo].append(np.mean(noeuds_taille[algo]))
-                    donnees_temps_std[algo].append(np.std(temps_taille[algo]))
-                    donnees_noeuds_std[algo].append(np.std(noeuds_taille[algo]))
+                    donnees_temps[algo].append(statistics.fmean(temps_taille[algo]))
+                    donnees_noeuds[algo].append(statistics.fmean(noeuds_taille[algo]))
+                    donnees_temps_std[algo].append(statistics.pstdev(temps_taille[algo]))
+                    donnees_noeuds_std[algo].append(statistics.pstdev(noeuds_taille[algo]))
                     
-                    print(f"{algo:<18} | Temps: {donnees_temps[algo][-1]:.2f} ± {donnees_temps_std[algo][-1]:.2f} ms | "
+                    print(f"{algo:<20} | Temps: {donnees_temps[algo][-1]:.2f} ± {donnees_temps_std[algo][-1]:.2f} ms | "
                           f"Noeuds: {donnees_noeuds[algo][-1]:.0f} ± {donnees_noeuds_std[algo][-1]:.0f}")
+                if compteurs_taille[algo]:
+                    lignes = compteurs_taille[algo]
+                    moyenne = {cle: (statistics.fmean(l[cle] for l in lignes)
+                                     if lignes[0][cle] is not None else None) for cle in lignes[0]}
+                    donnees_compteurs[algo].append(moyenne)
+                    print(f"{'':<20} | Empilés: {moyenne['empilements']:.0f} | "
+                          f"Périmés: {moyenne['depilements_perimes']:.0f} | "
+                          f"Max file: {moyenne['max_ouverts']:.0f} | "
+                          f"Éval. h: {moyenne['evaluations_heuristique']:.0f}")
         
-        # Générer les graphiques
+        # Sauvegarder les résultats puis générer les graphiques
+        if fichier_resultats:
+            rapports.sauvegarder_scalabilite(fichier_resultats, tailles, donnees_temps, donnees_noeuds,
+                                             donnees_temps_std, donnees_noeuds_std, donnees_compteurs)
         self._generer_graphiques(tailles, donnees_temps, donnees_noeuds, 
                                donnees_temps_std, donnees_noeuds_std)
         
@@ -79,137 +300,196 @@ class AnalyseurScalabilite:
     
     def _generer_graphiques(self, tailles, donnees_temps, donnees_noeuds, 
                           donnees_temps_std, donnees_noeuds_std):
-        """Génère les graphiques d'évolution avec affichage corrigé"""
-        print("\n📊 Génération des graphiques...")
-        
-        # Création de la figure avec plus d'espace
-        fig = plt.figure(figsize=(16, 10))
-        
-        # Ajuster les marges pour éviter le chevauchement
-        plt.subplots_adjust(left=0.08, right=0.95, top=0.93, bottom=0.08, 
-                           hspace=0.35, wspace=0.25)
-        
-        # Créer les sous-graphiques
-        ax1 = plt.subplot(2, 2, 1)
-        ax2 = plt.subplot(2, 2, 2)
-        ax3 = plt.subplot(2, 2, 3)
-        ax4 = plt.subplot(2, 2, 4)
-        
-        # Styles
-        marqueurs = {'BFS': 'o', 'A* Manhattan': 's', 'A* Euclidienne': '^'}
-        couleurs = {'BFS': 'red', 'A* Manhattan': 'blue', 'A* Euclidienne': 'green'}
-        
-        # Graphique 1: Temps d'exécution
-        for algo in ['BFS', 'A* Manhattan', 'A* Euclidienne']:
-            if donnees_temps[algo]:
-                ax1.plot(tailles[:len(donnees_temps[algo])], donnees_temps[algo], 
-                        marker=marqueurs[algo], color=couleurs[algo], label=algo, 
-                        linewidth=2.5, markersize=8)
-                ax1.fill_between(tailles[:len(donnees_temps[algo])],
-                               np.array(donnees_temps[algo]) - np.array(donnees_temps_std[algo]),
-                               np.array(donnees_temps[algo]) + np.array(donnees_temps_std[algo]),
-                               alpha=0.2, color=couleurs[algo])
-        
-        ax1.set_xlabel('Taille de la grille', fontsize=11, fontweight='bold')
-        ax1.set_ylabel('Temps (ms)', fontsize=11, fontweight='bold')
-        ax1.set_title('Temps d\'exécution vs Taille', fontsize=12, fontweight='bold', pad=10)
-        ax1.legend(fontsize=9, loc='upper left')
-        ax1.grid(True, alpha=0.3, linestyle='--')
-        ax1.tick_params(labelsize=9)
-        
-        # Graphique 2: Nombre de nœuds explorés
-        for algo in ['BFS', 'A* Manhattan', 'A* Euclidienne']:
-            if donnees_noeuds[algo]:
-                ax2.plot(tailles[:len(donnees_noeuds[algo])], donnees_noeuds[algo],
-                        marker=marqueurs[algo], color=couleurs[algo], label=algo, 
-                        linewidth=2.5, markersize=8)
-                ax2.fill_between(tailles[:len(donnees_noeuds[algo])],
-                               np.array(donnees_noeuds[algo]) - np.array(donnees_noeuds_std[algo]),
-                               np.array(donnees_noeuds[algo]) + np.array(donnees_noeuds_std[algo]),
-                               alpha=0.2, color=couleurs[algo])
-        
-        ax2.set_xlabel('Taille de la grille', fontsize=11, fontweight='bold')
-        ax2.set_ylabel('Nœuds explorés', fontsize=11, fontweight='bold')
-        ax2.set_title('Nœuds explorés vs Taille', fontsize=12, fontweight='bold', pad=10)
-        ax2.legend(fontsize=9, loc='upper left')
-        ax2.grid(True, alpha=0.3, linestyle='--')
-        ax2.tick_params(labelsize=9)
-        
-        # Graphique 3: Ratio d'efficacité (BFS / A*)
-        if len(donnees_noeuds['BFS']) == len(donnees_noeuds['A* Manhattan']):
-            ratio_man = np.array(donnees_noeuds['BFS']) / np.array(donnees_noeuds['A* Manhattan'])
-            ratio_euc = np.array(donnees_noeuds['BFS']) / np.array(donnees_noeuds['A* Euclidienne'])
-            
-            ax3.plot(tailles[:len(donnees_noeuds['BFS'])], ratio_man,
-                    'b-o', label='BFS / A* Manhattan', linewidth=2.5, markersize=8)
-            ax3.plot(tailles[:len(donnees_noeuds['BFS'])], ratio_euc,
-                    'g-^', label='BFS / A* Euclidienne', linewidth=2.5, markersize=8)
-        
-        ax3.set_xlabel('Taille de la grille', fontsize=11, fontweight='bold')
-        ax3.set_ylabel('Ratio', fontsize=11, fontweight='bold')
-        ax3.set_title('Gain d\'efficacité A*', fontsize=12, fontweight='bold', pad=10)
-        ax3.legend(fontsize=9, loc='upper left')
-        ax3.grid(True, alpha=0.3, linestyle='--')
-        ax3.tick_params(labelsize=9)
-        ax3.axhline(y=1, color='red', linestyle='--', alpha=0.5, linewidth=1)
-        
-        # Graphique 4: Comparaison heuristiques
-        if len(donnees_noeuds['A* Manhattan']) == len(donnees_noeuds['A* Euclidienne']):
-            ratio_heur = np.array(donnees_noeuds['A* Euclidienne']) / np.array(donnees_noeuds['A* Manhattan'])
-            ax4.plot(tailles[:len(donnees_noeuds['A* Manhattan'])], ratio_heur,
-                    color='purple', marker='D', linewidth=2.5, markersize=8, 
-                    label='Euclidienne / Manhattan')
-            ax4.axhline(y=1, color='red', linestyle='--', alpha=0.7, linewidth=2, 
-                       label='Égalité')
-        
-        ax4.set_xlabel('Taille de la grille', fontsize=11, fontweight='bold')
-        ax4.set_ylabel('Ratio Euc / Man', fontsize=11, fontweight='bold')
-        ax4.set_title('Comparaison Heuristiques', fontsize=12, fontweight='bold', pad=10)
-        ax4.legend(fontsize=9, loc='upper left')
-        ax4.grid(True, alpha=0.3, linestyle='--')
-        ax4.tick_params(labelsize=9)
-        
-        # Titre général
-        fig.suptitle('ANALYSE DE SCALABILITÉ ', 
-                    fontsize=14, fontweight='bold', y=0.98)
-        
-        plt.show()
-        
-        # Sauvegarder également
-        fig.savefig('analyse_scalabilite.png', dpi=300, bbox_inches='tight')
-        print("✓ Graphiques sauvegardés dans 'analyse_scalabilite.png'")
+        """Génère les graphiques d'évolution (voir rapports.tracer_scalabilite)"""
+        rapports.tracer_scalabilite(tailles, donnees_temps, donnees_noeuds,
+                                    donnees_temps_std, donnees_noeuds_std)
     
-    def analyser_tendance_complexite(self, donnees_noeuds, tailles):
-        """Analyse la tendance de complexité théorique"""
+    def etudier_scalabilite(self, tailles=None, algorithmes=ALGORITHMES_ETUDE, precision=0.10,
+                            min_echantillons=5, max_echantillons=200, budget_par_taille_s=120.0,
+                            graine=0, mode_generation='rapide',
+                            fichier_resultats='etude_scalabilite.json',
+                            fichier_graphique='etude_scalabilite.png'):
+        """
+        Étude de scalabilité à grande échelle, avec ajustement de complexité.
+
+        - tailles: par défaut tailles_geometriques() (15 à 2001, 12 tailles);
+        - échantillonnage adaptatif: à chaque taille, on génère des
+          labyrinthes (graine_tache(graine, taille, i), stockage plat) tant
+          que la demi-largeur relative de l'IC à 95 % d'une des moyennes
+          (temps de génération, temps et nœuds de chaque algorithme) dépasse
+          'precision', entre min_echantillons et max_echantillons, et au
+          plus budget_par_taille_s secondes (la taille est alors marquée
+          non convergée). Le nombre de nœuds d'A* varie beaucoup d'un
+          labyrinthe à l'autre: viser 5 % demande des centaines de
+          labyrinthes par taille. La précision atteinte est enregistrée
+          (precision_atteinte). Un algorithme qui n'a trouvé aucun chemin
+          à une taille y a une moyenne manquante (None, null en JSON),
+          ignorée par les ajustements;
+        - la génération (_generer(mode_generation)) est chronométrée comme
+          une série à part (SERIE_GENERATION); les prétraitements
+          (analyzer.PRETRAITEMENTS) restent hors mesure;
+        - ajustements log-log avec erreurs et détection de coude (voir
+          analyser_tendance_complexite), sur les temps et sur les nœuds.
+
+        Résultats enregistrés en JSON (retraçables avec `python rapports.py
+        <fichier>`) et tracés en log-log avec barres d'erreur.
+        """
+        if tailles is None:
+            tailles = tailles_geometriques()
+        series_temps = (SERIE_GENERATION,) + tuple(algorithmes)
+        etude = {
+            'tailles': list(tailles),
+            'parametres': {'precision': precision, 'min_echantillons': min_echantillons,
+                           'max_echantillons': max_echantillons, 'budget_par_taille_s': budget_par_taille_s,
+                           'graine': graine, 'mode_generation': mode_generation},
+            'echantillons': [],
+            'converge': [],
+            'precision_atteinte': [],
+            'temps': {serie: [] for serie in series_temps},
+            'temps_ic': {serie: [] for serie in series_temps},
+            'noeuds': {algo: [] for algo in algorithmes},
+            'noeuds_ic': {algo: [] for algo in algorithmes},
+        }
+
+        for taille in tailles:
+            temps = {serie: [] for serie in series_temps}
+            noeuds = {algo: [] for algo in algorithmes}
+            debut = time.perf_counter()
+            converge = False
+            i = 0
+            largeur = math.inf
+            while True:
+                laby = PrimLabyrinthe(taille, stockage="bytearray", seed=graine_tache(graine, taille, i))
+                _, duree = _chronometrer(laby._generer, mode_generation)
+                temps[SERIE_GENERATION].append(duree)
+                start, goal = (1, 1), (taille - 2, taille - 2)
+                for algo in algorithmes:
+                    pretraiter(algo, laby)
+                    (chemin, nb_noeuds), duree = _chronometrer(ALGORITHMES[algo], laby, start, goal)
+                    if chemin:
+                        temps[algo].append(duree)
+                        noeuds[algo].append(nb_noeuds)
+                i += 1
+                if i < min_echantillons:
+                    continue
+                largeur = max(demi_largeur_ic(v) / statistics.fmean(v)
+                              for v in list(temps.values()) + list(noeuds.values()) if v)
+                if largeur <= precision:
+                    converge = True
+                    break
+                if i >= max_echantillons or time.perf_counter() - debut > budget_par_taille_s:
+                    break
+
+            etude['echantillons'].append(i)
+            etude['converge'].append(converge)
+            etude['precision_atteinte'].append(largeur)
+            for cle, mesures in (('temps', temps), ('noeuds', noeuds)):
+                for serie, valeurs in mesures.items():
+                    if not valeurs:
+                        etude[cle][serie].append(None)
+                        etude[cle + '_ic'][serie].append(None)
+                        continue
+                    etude[cle][serie].append(statistics.fmean(valeurs))
+                    etude[cle + '_ic'][serie].append(demi_largeur_ic(valeurs) if len(valeurs) > 1 else 0.0)
+            print(f"\n--- Grille {taille}x{taille}: {i} labyrinthes en {time.perf_counter() - debut:.1f} s, "
+                  f"IC95 à ±{largeur:.1%}{'' if converge else ' (limite atteinte avant la précision visée)'} ---")
+            for serie in series_temps:
+                if etude['temps'][serie][-1] is None:
+                    print(f"{serie:<20} | aucun chemin trouvé")
+                    continue
+                ligne = (f"{serie:<20} | Temps: {etude['temps'][serie][-1]:.2f} "
+                         f"± {etude['temps_ic'][serie][-1]:.2f} ms")
+                if serie in noeuds:
+                    ligne += (f" | Noeuds: {etude['noeuds'][serie][-1]:.0f} "
+                              f"± {etude['noeuds_ic'][serie][-1]:.0f}")
+                print(ligne)
+
+        etude['ajustements'] = {
+            'temps': self.analyser_tendance_complexite(etude['temps'], tailles, grandeur='temps',
+                                                       erreurs=etude['temps_ic']),
+            'noeuds': self.analyser_tendance_complexite(etude['noeuds'], tailles,
+                                                        erreurs=etude['noeuds_ic']),
+        }
+        self.resultats = etude
+        if fichier_resultats:
+            rapports.sauvegarder_etude_scalabilite(fichier_resultats, etude)
+        if fichier_graphique:
+            rapports.tracer_etude_scalabilite(etude, fichier_graphique)
+        return etude
+
+    def analyser_tendance_complexite(self, donnees_noeuds, tailles, grandeur='nœuds', erreurs=None):
+        """
+        Analyse la tendance de complexité: rapports d'une taille à la
+        suivante, puis exposant par régression log-log sur toutes les tailles
+        (avec erreur standard et IC à 95 %) et coude éventuel de la courbe
+        (voir detecter_rupture), par exemple quand la grille ne tient plus
+        dans les caches. L'exposant est relatif au côté n de la grille
+        (n² cases). erreurs: {algo: demi-largeurs d'IC par taille}, pour
+        pondérer les régressions. Les tailles sans mesure (None) sont
+        ignorées. Retourne {algo: {'ajustement': ..., 'rupture': ...}}.
+        """
         print("\n" + "=" * 80)
-        print("ANALYSE DE COMPLEXITÉ THÉORIQUE")
+        print(f"ANALYSE DE COMPLEXITÉ ({grandeur})")
         print("=" * 80)
         
-        # Approximation de la complexité
+        analyses = {}
         for algo, noeuds in donnees_noeuds.items():
             if len(noeuds) == len(tailles):
                 print(f"\n{algo}:")
-                for i in range(1, len(tailles)):
+                erreurs_algo = erreurs.get(algo) if erreurs else None
+                mesurees = [k for k, v in enumerate(noeuds) if v is not None]
+                tailles_algo = [tailles[k] for k in mesurees]
+                noeuds = [noeuds[k] for k in mesurees]
+                if erreurs_algo is not None:
+                    erreurs_algo = [erreurs_algo[k] for k in mesurees]
+                for i in range(1, len(tailles_algo)):
                     if noeuds[i] > 0 and noeuds[i-1] > 0:
                         ratio = noeuds[i] / noeuds[i-1]
-                        ratio_taille = tailles[i] / tailles[i-1]
-                        print(f"  {tailles[i-1]:>2}→{tailles[i]:>2}: {ratio:.2f}x plus de nœuds "
+                        ratio_taille = tailles_algo[i] / tailles_algo[i-1]
+                        print(f"  {tailles_algo[i-1]:>2}→{tailles_algo[i]:>2}: {ratio:.2f}x plus de {grandeur} "
                               f"(taille {ratio_taille:.2f}x)")
                 
-                # Estimation de l'exposant de complexité
-                if len(tailles) >= 2:
-                    exposant_approx = np.log(noeuds[-1] / noeuds[0]) / np.log(tailles[-1] / tailles[0])
-                    print(f"  ➜ Exposant de complexité approximatif: O(n^{exposant_approx:.2f})")
-                    
-                    if exposant_approx < 1.5:
-                        print(f"     Complexité quasi-linéaire")
-                    elif exposant_approx < 2.5:
-                        print(f"     Complexité quadratique")
-                    else:
-                        print(f"     Complexité > quadratique")
+                # Estimation de l'exposant de complexité sur toutes les tailles mesurées
+                if len(tailles_algo) < 3:
+                    continue
+                ajustement = ajuster_loi_puissance(tailles_algo, noeuds, erreurs_algo)
+                rupture = detecter_rupture(tailles_algo, noeuds, erreurs_algo)
+                analyses[algo] = {'ajustement': ajustement, 'rupture': rupture}
+                exposant = ajustement['exposant']
+                bas, haut = ajustement['ic95_exposant']
+                print(f"  ➜ Exposant de complexité: O(n^{exposant:.2f}) ± {ajustement['erreur_exposant']:.2f} "
+                      f"(IC95 {bas:.2f}–{haut:.2f}, R² = {ajustement['r2']:.4f})")
+                
+                if exposant < 1.5:
+                    print(f"     Complexité quasi-linéaire")
+                elif exposant < 2.5:
+                    print(f"     Complexité quadratique")
+                else:
+                    print(f"     Complexité > quadratique")
+                if rupture is not None:
+                    print(f"     Coude vers n = {rupture['taille_rupture']}: exposant "
+                          f"{rupture['exposant_avant']:.2f} → {rupture['exposant_apres']:.2f} "
+                          f"(variation ± {rupture['erreur_variation']:.2f}, ΔBIC = {rupture['gain_bic']:.1f})")
+        return analyses
 
 # MAIN SPÉCIFIQUE POUR PARTIE 5
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyse de scalabilité de BFS / A* sur labyrinthes de Prim")
+    parser.add_argument('--taille-min', type=int, default=15)
+    parser.add_argument('--taille-max', type=int, default=2001)
+    parser.add_argument('--nb-tailles', type=int, default=12, help="tailles en progression géométrique")
+    parser.add_argument('--algorithmes', nargs='+', choices=list(ALGORITHMES), default=list(ALGORITHMES_ETUDE))
+    parser.add_argument('--precision', type=float, default=0.10,
+                        help="demi-largeur relative visée des IC à 95%% des moyennes")
+    parser.add_argument('--min-echantillons', type=int, default=5)
+    parser.add_argument('--max-echantillons', type=int, default=200)
+    parser.add_argument('--budget', type=float, default=120.0, help="secondes au plus par taille")
+    parser.add_argument('--graine', type=int, default=0)
+    parser.add_argument('--generation', choices=('rapide', 'classique', 'eller'), default='rapide',
+                        help="mode de _generer chronométré")
+    parser.add_argument('--json', default='etude_scalabilite.json')
+    parser.add_argument('--png', default='etude_scalabilite.png')
+    args = parser.parse_args()
 
     print(" ANALYSE DE SCALABILITÉ ")
    
@@ -218,16 +498,15 @@ if __name__ == "__main__":
     
     analyseur_scala = AnalyseurScalabilite()
     
-    # Tailles impaires pour Prim (doit être ≥ 3)
-    tailles = [15, 25, 35, 45]
+    # Tailles impaires pour Prim (doit être ≥ 3), progression géométrique
+    tailles = tailles_geometriques(args.taille_min, args.taille_max, args.nb_tailles)
     
     print(f"📏 Tailles analysées: {tailles}")
-    print(f" Nombre de tests par taille: 3")
-    print(f"\n L'analyse peut prendre quelques minutes...\n")
-    
-    # Exécuter l'analyse de scalabilité
-    donnees_temps, donnees_noeuds = analyseur_scala.analyser_scalabilite(
-        tailles, nb_tests_par_taille=3)
+    print(f" Échantillonnage adaptatif: IC95 à ±{args.precision:.0%} près, "
+          f"{args.min_echantillons} à {args.max_echantillons} labyrinthes par taille")
+    print(f"\n L'analyse peut prendre plusieurs minutes...\n")
     
-    # Analyser les tendances de complexité
-    analyseur_scala.analyser_tendance_complexite(donnees_noeuds, tailles)
+    # Exécuter l'étude (ajustements et coudes compris)
+    analyseur_scala.etudier_scalabilite(
+        tailles, args.algorithmes, args.precision, args.min_echantillons, args.max_echantillons,
+        args.budget, args.graine, args.generation, args.json, args.png)
@@ -0,0 +1,335 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+Coord = Tuple[int, int]
+# Description d'un labyrinthe, assez petite pour être envoyée à chaque lot:
+# ("prim", taille, graine) régénéré à l'identique, ou ("plab", fichier)
+Spec = Tuple
+
+# Labyrinthes déjà chargés dans ce processus (serveur ou processus de travail)
+_LABYRINTHES: Dict[Spec, object] = {}
+
+
+def charger_labyrinthe(spec: Spec):
+    """Charge (une seule fois par processus) le labyrinthe décrit par spec."""
+    laby = _LABYRINTHES.get(spec)
+    if laby is None:
+        from PrimLabytinthe import PrimLabyrinthe
+        if spec[0] == "prim":
+            _, taille, graine = spec
+            laby = PrimLabyrinthe(taille, stockage="bytearray", seed=graine)
+            laby._generer("rapide")
+        elif spec[0] == "plab":
+            laby = PrimLabyrinthe.charger(spec[1])
+        else:
+            raise ValueError(f"Labyrinthe inconnu: {spec!r} (attendu: ('prim', taille, graine) ou ('plab', fichier))")
+        _LABYRINTHES[spec] = laby
+    return laby
+
+
+def resoudre_lot(spec: Spec, groupes: List[Tuple[Coord, List[Coord]]]) -> Tuple[List[List], int]:
+    """
+    Exécuté dans un processus de travail: un BFS multi-cibles
+    (laby.bfs_multi_cibles, k=None) par groupe (source, cibles). Retourne
+    les chemins de chaque groupe, dans l'ordre des cibles, et le total des
+    nœuds explorés.
+    """
+    laby = charger_labyrinthe(spec)
+    resultats = []
+    explores = 0
+    for source, cibles in groupes:
+        champ = laby.bfs_multi_cibles(source, cibles, k=None)
+        explores += champ.explores
+        resultats.append([champ.chemin(c) for c in cibles])
+    return resultats, explores
+
+
+def _centile(valeurs: List[float], q: float) -> Optional[float]:
+    if not valeurs:
+        return None
+    valeurs = sorted(valeurs)
+    return valeurs[min(len(valeurs) - 1, int(q * len(valeurs)))]
+
+
+class ServeurChemins:
+    """
+    Service local de plus courts chemins (asyncio), un message JSON par
+    ligne. Les labyrinthes sont chargés une fois par processus; les
+    recherches tournent sur un pool de processus (nb_processus=0: pool de
+    threads dans ce processus), jamais dans la boucle d'événements.
+
+    Micro-lots: une requête n'est pas résolue tout de suite mais mise en
+    attente au plus fenetre_ms (ou jusqu'à lot_max requêtes) avec les
+    autres requêtes du même labyrinthe:
+      - les requêtes d'une même source (ou d'une même arrivée: la grille
+        n'est pas orientée, le chemin est alors retourné) partagent un seul
+        BFS multi-cibles;
+      - toutes les sources d'un même labyrinthe partent dans une seule
+        tâche du pool, donc un seul aller-retour entre processus.
+
+    Requêtes: {"id", "op": "chemin", "labyrinthe", "depart": [x, y],
+    "arrivee": [x, y]}, {"op": "metriques"}, {"op": "labyrinthes"},
+    {"op": "charger", "nom", "taille", "graine"} ou {"op": "charger",
+    "nom", "fichier"}. Réponses: {"id", ...} ou {"id", "erreur"}.
+
+    Les lots sont indexés par spec, relevée au moment où la requête est mise
+    en attente: réenregistrer un nom avec une autre spec ne change pas le
+    labyrinthe des requêtes déjà en attente. "charger" génère ou lit le
+    labyrinthe hors de la boucle d'événements (pool de threads par défaut).
+    """
+
+    def __init__(self, labyrinthes: Optional[Dict[str, Spec]] = None, nb_processus: Optional[int] = None,
+                 fenetre_ms: float = 2.0, lot_max: int = 256):
+        self.specs: Dict[str, Spec] = {}
+        self.tailles: Dict[str, int] = {}
+        self.fenetre = fenetre_ms / 1000.0
+        self.lot_max = lot_max
+        self.nb_processus = nb_processus
+        self._executeur = None
+        # spec -> source -> [(cible, futur, inverse)]
+        self._attente: Dict[Spec, Dict[Coord, List]] = {}
+        self._nb_attente: Dict[Spec, int] = {}
+        self._minuteries: Dict[Spec, asyncio.TimerHandle] = {}
+
+        self.debut = time.perf_counter()
+        self.requetes = 0
+        self.erreurs = 0
+        self.lots = 0
+        self.recherches = 0
+        self.explores = 0
+        self.en_cours = 0
+        self.latences = deque(maxlen=100_000)
+        for nom, spec in (labyrinthes or {}).items():
+            self.ajouter_labyrinthe(nom, spec)
+
+    def ajouter_labyrinthe(self, nom: str, spec: Spec) -> None:
+        """
+        Enregistre (et charge une fois dans le serveur, pour valider les
+        requêtes) un labyrinthe. Synchrone: à utiliser avant de servir;
+        pendant le service, passer par charger().
+        """
+        self._enregistrer(nom, spec, charger_labyrinthe(spec))
+
+    async def charger(self, nom: str, spec: Spec) -> int:
+        """Comme ajouter_labyrinthe(), chargement fait dans un thread; retourne la taille."""
+        loop = asyncio.get_running_loop()
+        laby = await loop.run_in_executor(None, charger_labyrinthe, spec)
+        self._enregistrer(nom, spec, laby)
+        return laby.taille
+
+    def _enregistrer(self, nom: str, spec: Spec, laby) -> None:
+        self.specs[nom] = spec
+        self.tailles[nom] = laby.taille
+
+    # --- micro-lots ----------------------------------------------------
+
+    def _executeur_pool(self):
+        if self._executeur is None:
+            if self.nb_processus == 0:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executeur = ThreadPoolExecutor(max_workers=1)
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+                self._executeur = ProcessPoolExecutor(max_workers=self.nb_processus or os.cpu_count() or 1)
+        return self._executeur
+
+    def _verifier(self, laby, case: Coord) -> None:
+        x, y = case
+        if not (0 <= x < laby.taille and 0 <= y < laby.taille) or laby.grille[x][y] != 0:
+            raise ValueError(f"Case {case} hors de la grille ou dans un mur")
+
+    async def chemin(self, nom: str, depart: Coord, arrivee: Coord) -> Optional[List[Coord]]:
+        """Plus court chemin depart -> arrivee dans le labyrinthe 'nom' (None s'il n'existe pas)."""
+        if nom not in self.specs:
+            raise ValueError(f"Labyrinthe inconnu: {nom!r}")
+        spec = self.specs[nom]
+        laby = charger_labyrinthe(spec)
+        self._verifier(laby, depart)
+        self._verifier(laby, arrivee)
+
+        loop = asyncio.get_running_loop()
+        futur = loop.create_future()
+        groupes = self._attente.setdefault(spec, {})
+        if depart not in groupes and arrivee in groupes:
+            groupes[arrivee].append((depart, futur, True))
+        else:
+            groupes.setdefault(depart, []).append((arrivee, futur, False))
+        self._nb_attente[spec] = self._nb_attente.get(spec, 0) + 1
+
+        if self._nb_attente[spec] >= self.lot_max:
+            self._vider(spec)
+        elif spec not in self._minuteries:
+            self._minuteries[spec] = loop.call_later(self.fenetre, self._vider, spec)
+        return await futur
+
+    def _vider(self, spec: Spec) -> None:
+        """Envoie au pool toutes les requêtes en attente sur le labyrinthe spec, en une tâche."""
+        minuterie = self._minuteries.pop(spec, None)
+        if minuterie is not None:
+            minuterie.cancel()
+        groupes = self._attente.pop(spec, None)
+        self._nb_attente.pop(spec, None)
+        if not groupes:
+            return
+        lot = [(source, sorted({c for c, _, _ in attentes})) for source, attentes in groupes.items()]
+        self.lots += 1
+        self.recherches += len(lot)
+        loop = asyncio.get_running_loop()
+        tache = loop.run_in_executor(self._executeur_pool(), resoudre_lot, spec, lot)
+        tache.add_done_callback(lambda t: self._distribuer(t, lot, groupes))
+
+    def _distribuer(self, tache, lot, groupes) -> None:
+        try:
+            resultats, explores = tache.result()
+        except Exception as exc:
+            for attentes in groupes.values():
+                for _, futur, _ in attentes:
+                    if not futur.done():
+                        futur.set_exception(exc)
+            return
+        self.explores += explores
+        for (source, cibles), chemins in zip(lot, resultats):
+            par_cible = dict(zip(cibles, chemins))
+            for cible, futur, inverse in groupes[source]:
+                chemin = par_cible[cible]
+                if chemin is not None and inverse:
+                    chemin = chemin[::-1]
+                if not futur.done():
+                    futur.set_result(chemin)
+
+    # --- métriques -----------------------------------------------------
+
+    def metriques(self) -> Dict[str, object]:
+        """Latence (ms, centiles sur les dernières requêtes), débit et efficacité des lots."""
+        duree = time.perf_counter() - self.debut
+        latences = [l * 1000.0 for l in self.latences]
+        return {
+            'requetes': self.requetes,
+            'erreurs': self.erreurs,
+            'en_cours': self.en_cours,
+            'debit_req_s': self.requetes / duree if duree > 0 else 0.0,
+            'latence_p50_ms': _centile(latences, 0.50),
+            'latence_p95_ms': _centile(latences, 0.95),
+            'latence_p99_ms': _centile(latences, 0.99),
+            'latence_max_ms': max(latences) if latences else None,
+            'lots': self.lots,
+            'recherches': self.recherches,
+            'requetes_par_lot': self.requetes / self.lots if self.lots else None,
+            'requetes_par_recherche': self.requetes / self.recherches if self.recherches else None,
+            'explores': self.explores,
+        }
+
+    # --- protocole -----------------------------------------------------
+
+    async def _traiter(self, message: Dict) -> Dict:
+        op = message.get('op')
+        if op == 'chemin':
+            t0 = time.perf_counter()
+            self.en_cours += 1
+            try:
+                chemin = await self.chemin(message['labyrinthe'], tuple(message['depart']),
+                                           tuple(message['arrivee']))
+            finally:
+                self.en_cours -= 1
+            self.requetes += 1
+            self.latences.append(time.perf_counter() - t0)
+            return {'chemin': chemin, 'longueur': (len(chemin) - 1) if chemin else None}
+        if op == 'metriques':
+            return self.metriques()
+        if op == 'labyrinthes':
+            return {nom: {'taille': taille} for nom, taille in self.tailles.items()}
+        if op == 'charger':
+            if 'fichier' in message:
+                spec = ("plab", message['fichier'])
+            else:
+                spec = ("prim", int(message['taille']), int(message.get('graine', 0)))
+            return {'taille': await self.charger(message['nom'], spec)}
+        raise ValueError(f"Opération inconnue: {op!r}")
+
+    async def _repondre(self, message: Dict, writer: asyncio.StreamWriter) -> None:
+        try:
+            reponse = await self._traiter(message)
+        except Exception as exc:
+            self.erreurs += 1
+            reponse = {'erreur': f"{type(exc).__name__}: {exc}"}
+        reponse['id'] = message.get('id')
+        writer.write(json.dumps(reponse).encode() + b"\n")
+
+    async def _connexion(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Une connexion peut envoyer plusieurs requêtes sans attendre: chacune est une tâche."""
+        taches = set()
+        try:
+            while True:
+                ligne = await reader.readline()
+                if not ligne:
+                    break
+                try:
+                    message = json.loads(ligne)
+                except json.JSONDecodeError as exc:
+                    self.erreurs += 1
+                    writer.write(json.dumps({'id': None, 'erreur': f"JSON invalide: {exc}"}).encode() + b"\n")
+                    continue
+                tache = asyncio.ensure_future(self._repondre(message, writer))
+                taches.add(tache)
+                tache.add_done_callback(taches.discard)
+            if taches:
+                await asyncio.gather(*taches)
+            await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass     # client parti, ou serveur arrêté pendant l'attente
+        finally:
+            writer.close()
+
+    async def servir(self, hote: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None) -> None:
+        """Écoute sur localhost (TCP) ou sur une socket Unix jusqu'à annulation."""
+        if unix is not None:
+            serveur = await asyncio.start_unix_server(self._connexion, path=unix)
+        else:
+            serveur = await asyncio.start_server(self._connexion, hote, port)
+        adresse = unix or f"{hote}:{port}"
+        print(f"Serveur de chemins sur {adresse} - labyrinthes: {', '.join(self.specs) or 'aucun'}")
+        try:
+            async with serveur:
+                await serveur.serve_forever()
+        finally:
+            self.fermer()
+
+    def fermer(self) -> None:
+        if self._executeur is not None:
+            self._executeur.shutdown(cancel_futures=True)
+            self._executeur = None
+
+
+def _lire_spec(texte: str) -> Tuple[str, Spec]:
+    """'nom=taille:graine' ou 'nom=fichier.plab'."""
+    nom, _, valeur = texte.partition("=")
+    if valeur.endswith(".plab"):
+        return nom, ("plab", valeur)
+    taille, _, graine = valeur.partition(":")
+    return nom, ("prim", int(taille), int(graine or 0))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Service local de plus courts chemins avec micro-lots")
+    parser.add_argument('--labyrinthe', action='append', default=[],
+                        help="nom=taille:graine ou nom=fichier.plab (répétable)")
+    parser.add_argument('--hote', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="chemin d'une socket Unix (au lieu de TCP)")
+    parser.add_argument('--processus', type=int, default=None,
+                        help="taille du pool (défaut: un par cœur; 0: threads dans ce processus)")
+    parser.add_argument('--fenetre-ms', type=float, default=2.0)
+    parser.add_argument('--lot-max', type=int, default=256)
+    args = parser.parse_args()
+
+    specs = dict(_lire_spec(t) for t in args.labyrinthe) or {"principal": ("prim", 501, 0)}
+    serveur = ServeurChemins(specs, args.processus, args.fenetre_ms, args.lot_max)
+    try:
+        asyncio.run(serveur.servir(args.hote, args.port, args.unix))
+    except KeyboardInterrupt:
+        print(json.dumps(serveur.metriques(), indent=2))
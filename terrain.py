@@ -0,0 +1,223 @@
+import heapq
+import math
+import random
+import time
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+from PrimLabytinthe import PrimLabyrinthe
+from AStar_Moteur import astar
+
+Coord = Tuple[int, int]
+
+# Heuristiques des moteurs pondérés, les mêmes avec ou sans coûts. Tout pas
+# coûte au moins 1: la distance de Manhattan, et la partie entière de la
+# distance euclidienne (qui varie d'au plus 1 par pas), restent admissibles
+# et cohérentes quels que soient les coûts.
+HEURISTIQUES_PONDEREES = ('manhattan', 'euclidienne', 'nulle')
+
+
+def terrain_aleatoire(laby: PrimLabyrinthe, cout_max: int = 9, seed: Optional[int] = None,
+                      rng: Optional[random.Random] = None) -> PrimLabyrinthe:
+    """Donne à chaque case ouverte un coût tiré uniformément dans [1, cout_max]."""
+    if rng is None:
+        rng = random.Random(seed)
+    N = laby.taille
+    grille = laby.grille
+    for x in range(N):
+        ligne = grille[x]
+        for y in range(N):
+            if ligne[y] == 0:
+                laby.definir_cout(x, y, rng.randint(1, cout_max))
+    return laby
+
+
+def cout_chemin(laby: PrimLabyrinthe, chemin: Optional[List[Coord]]) -> Optional[int]:
+    """Coût d'un chemin: somme des coûts des cases où l'on entre (le départ ne compte pas)."""
+    if chemin is None:
+        return None
+    return sum(laby.cout(x, y) for x, y in chemin[1:])
+
+
+def _h_entiere(laby: PrimLabyrinthe, goal: Coord, heuristique: str) -> Callable[[int], int]:
+    if heuristique not in HEURISTIQUES_PONDEREES:
+        raise ValueError(f"Heuristique inconnue: {heuristique!r} "
+                         f"(attendu: {', '.join(HEURISTIQUES_PONDEREES)})")
+    W = laby.largeur
+    if heuristique == 'nulle':
+        return lambda i: 0
+    gx, gy = goal[0] + 1, goal[1] + 1
+    hx = [abs(x - gx) for x in range(W)]
+    hy = [abs(y - gy) for y in range(W)]
+    if heuristique == 'euclidienne':
+        def h_euclidienne(i: int) -> int:
+            x, y = divmod(i, W)
+            return math.isqrt(hx[x] * hx[x] + hy[y] * hy[y])
+        return h_euclidienne
+
+    def h(i: int) -> int:
+        x, y = divmod(i, W)
+        return hx[x] + hy[y]
+    return h
+
+
+def _reconstruire(laby: PrimLabyrinthe, parent: array, source: int, cible: int, goal: Coord) -> List[Coord]:
+    coord = laby.coord
+    i = cible
+    chemin = [goal]
+    while i != source:
+        i = parent[i]
+        chemin.append(coord(i))
+    chemin.reverse()
+    return chemin
+
+
+def astar_seaux(laby: PrimLabyrinthe, start: Coord, goal: Coord,
+                heuristique: str = 'manhattan') -> Tuple[Optional[List[Coord]], int]:
+    """
+    A* (heuristique='manhattan' ou 'euclidienne', en partie entière) ou
+    Dijkstra ('nulle') pondéré par les coûts
+    de terrain (laby.couts), sur une file à seaux monotone (algorithme de
+    Dial) au lieu d'un tas.
+
+    L'heuristique étant cohérente, f = g + h ne décroît jamais d'une
+    expansion à la suivante, et un pas fait varier f d'au plus
+    cout_max + 1: cout_max + 2 seaux circulaires (une liste d'indices plats
+    par valeur de f modulo ce nombre) suffisent. Empiler et dépiler sont en
+    O(1); on avance f d'un seau à l'autre, au plus cout_max + 1 seaux vides
+    de suite. fscore garde le f de la dernière entrée de chaque case: une
+    entrée dont g a été amélioré depuis n'a plus ce f et est ignorée au
+    dépilement (suppression paresseuse), sans réévaluer h.
+
+    Sans coûts (laby.couts None), délègue au moteur A* à clés entières
+    (AStar_Moteur.astar), chemin rapide des grilles à murs seuls; les
+    heuristiques acceptées sont les mêmes (HEURISTIQUES_PONDEREES) dans les
+    deux cas.
+
+    Retourne (chemin | None, explores), explores = entrées dépilées, comme
+    astar_manhattan; le coût du chemin est donné par cout_chemin().
+    """
+    if heuristique not in HEURISTIQUES_PONDEREES:
+        raise ValueError(f"Heuristique inconnue: {heuristique!r} "
+                         f"(attendu: {', '.join(HEURISTIQUES_PONDEREES)})")
+    if laby.couts is None:
+        return astar(laby, start, goal, heuristique)
+    laby.modifier_cellule(start[0], start[1], 0)
+    laby.modifier_cellule(goal[0], goal[1], 0)
+
+    cellules = laby.grille_lecture()
+    couts = laby.couts
+    d0, d1, d2, d3 = laby.decalages
+    h = _h_entiere(laby, goal, heuristique)
+    source = laby.indice(*start)
+    cible = laby.indice(*goal)
+
+    n = len(cellules)
+    gscore = array('i', [-1]) * n
+    fscore = array('i', [-1]) * n
+    parent = array('i', [-1]) * n
+    nb_seaux = max(couts) + 2
+    seaux: List[List[int]] = [[] for _ in range(nb_seaux)]
+
+    gscore[source] = 0
+    f = fscore[source] = h(source)
+    seaux[f % nb_seaux].append(source)
+    en_file = 1
+    explores = 0
+
+    while en_file:
+        seau = seaux[f % nb_seaux]
+        # un voisin peut tomber dans le seau courant (pas de coût 1 vers le but)
+        while seau:
+            i = seau.pop()
+            en_file -= 1
+            explores += 1
+            if fscore[i] != f:
+                continue            # entrée obsolète
+            if i == cible:
+                return _reconstruire(laby, parent, source, cible, goal), explores
+            gi = gscore[i]
+            for j in (i + d0, i + d1, i + d2, i + d3):
+                if cellules[j] == 0:
+                    ng = gi + couts[j]
+                    gj = gscore[j]
+                    if gj < 0 or ng < gj:
+                        gscore[j] = ng
+                        parent[j] = i
+                        fj = fscore[j] = ng + h(j)
+                        seaux[fj % nb_seaux].append(j)
+                        en_file += 1
+        f += 1
+
+    return None, explores
+
+
+def astar_tas(laby: PrimLabyrinthe, start: Coord, goal: Coord,
+              heuristique: str = 'manhattan') -> Tuple[Optional[List[Coord]], int]:
+    """
+    Référence pour astar_seaux: même recherche pondérée avec heapq et des
+    tuples (f, g, indice), O(log n) par opération. Pas de chemin rapide:
+    sans coûts de terrain, chaque pas coûte 1.
+    """
+    laby.modifier_cellule(start[0], start[1], 0)
+    laby.modifier_cellule(goal[0], goal[1], 0)
+
+    cellules = laby.grille_lecture()
+    couts = laby.couts if laby.couts is not None else bytearray(b"\x01") * len(cellules)
+    decalages = laby.decalages
+    h = _h_entiere(laby, goal, heuristique)
+    source = laby.indice(*start)
+    cible = laby.indice(*goal)
+
+    n = len(cellules)
+    gscore = array('i', [-1]) * n
+    parent = array('i', [-1]) * n
+    gscore[source] = 0
+    tas = [(h(source), 0, source)]
+    explores = 0
+
+    while tas:
+        f, gi, i = heapq.heappop(tas)
+        explores += 1
+        if gi != gscore[i]:
+            continue
+        if i == cible:
+            return _reconstruire(laby, parent, source, cible, goal), explores
+        for d in decalages:
+            j = i + d
+            if cellules[j] == 0:
+                ng = gi + couts[j]
+                gj = gscore[j]
+                if gj < 0 or ng < gj:
+                    gscore[j] = ng
+                    parent[j] = i
+                    heapq.heappush(tas, (ng + h(j), ng, j))
+
+    return None, explores
+
+
+if __name__ == "__main__":
+    taille = 301
+    start: Coord = (1, 1)
+    goal: Coord = (taille - 2, taille - 2)
+
+    header = f"{'Grille':<22} {'Moteur':<18} {'Explorés':>10} {'Temps (ms)':>12} {'Coût':>8}"
+    print(header)
+    print("-" * len(header))
+    for titre, tresse in (("labyrinthe", False), ("labyrinthe tressé", True)):
+        laby = PrimLabyrinthe(taille, stockage="bytearray", seed=0)
+        laby._generer("rapide")
+        if tresse:
+            # ouvrir 20% des murs internes: beaucoup de chemins concurrents
+            rng = random.Random(2)
+            for x in range(1, taille - 1):
+                for y in range(1, taille - 1):
+                    if (x + y) % 2 == 1 and rng.random() < 0.2:
+                        laby.modifier_cellule(x, y, 0)
+        terrain_aleatoire(laby, cout_max=9, seed=1)
+        for nom, moteur, h in (("A* seaux", astar_seaux, 'manhattan'), ("A* heapq", astar_tas, 'manhattan'),
+                               ("Dijkstra seaux", astar_seaux, 'nulle'), ("Dijkstra heapq", astar_tas, 'nulle')):
+            t0 = time.perf_counter()
+            chemin, explores = moteur(laby, start, goal, h)
+            duree_ms = (time.perf_counter() - t0) * 1000.0
+            print(f"{titre:<22} {nom:<18} {explores:>10} {duree_ms:>12.2f} {cout_chemin(laby, chemin)!s:>8}")
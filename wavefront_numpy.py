@@ -0,0 +1,168 @@
+import random
+import time
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:   # dépendance optionnelle, comme pour le stockage "numpy"
+    np = None
+
+from champ_distances import SANS_PARENT, ChampDistances
+
+Coord = Tuple[int, int]
+
+class ChampsVectoriels:
+    """
+    Champs de distances de B sources calculés en une passe (propagation_numpy).
+
+      - distances : int32 (B, W, W), indexé comme le tampon plat du
+        labyrinthe (bordure comprise), -1 si la case n'est pas atteinte
+      - directions: uint8 (B, W, W), indice dans laby.decalages du pas qui
+        mène à la case depuis son parent (SANS_PARENT sinon), même
+        convention que champ_distances.ChampDistances
+      - niveaux   : nombre de fronts propagés (distance maximale + 1)
+    """
+
+    def __init__(self, laby, sources: List[Coord], distances, directions, niveaux: int):
+        self.taille = laby.taille
+        self.largeur = laby.largeur
+        self.decalages = laby.decalages
+        self.sources = sources
+        self.distances = distances
+        self.directions = directions
+        self.niveaux = niveaux
+        self._laby = laby
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def grille_distances(self, b: int = 0):
+        """Distances de la source b sur la grille N×N (sans bordure), pour une carte de chaleur."""
+        return self.distances[b, 1:-1, 1:-1]
+
+    def distance(self, b: int, case: Coord) -> Optional[int]:
+        d = int(self.distances[b, case[0] + 1, case[1] + 1])
+        return d if d >= 0 else None
+
+    def champ(self, b: int = 0) -> ChampDistances:
+        """ChampDistances (tableaux plats Python) de la source b: distance(), chemin(), resultat()."""
+        distances = array('i')
+        distances.frombytes(self.distances[b].astype(np.int32).tobytes())
+        directions = bytearray(self.directions[b].tobytes())
+        atteintes = int(np.count_nonzero(self.distances[b] >= 0))
+        return ChampDistances(self._laby, self.sources[b], distances, directions, atteintes)
+
+    def chemin(self, b: int, case: Coord) -> Optional[List[Coord]]:
+        """Chemin source b -> case, en remontant les directions (sans conversion du champ)."""
+        W = self.largeur
+        distances = self.distances[b].reshape(-1)
+        directions = self.directions[b].reshape(-1)
+        i = (case[0] + 1) * W + (case[1] + 1)
+        if distances[i] < 0:
+            return None
+        chemin = [case]
+        while directions[i] != SANS_PARENT:
+            i -= self.decalages[directions[i]]
+            x, y = divmod(i, W)
+            chemin.append((x - 1, y - 1))
+        chemin.reverse()
+        return chemin
+
+
+def propagation_numpy(laby, sources: Sequence[Coord]) -> ChampsVectoriels:
+    """
+    BFS vectorisé depuis plusieurs sources à la fois (une dimension de lot
+    B = len(sources)): tout le front d'onde est étendu à chaque itération
+    par des opérations numpy, sans boucle Python par case.
+
+    Les B tampons plats sont mis bout à bout; le front est le tableau des
+    indices plats (lot compris) atteints au niveau précédent. Pour chaque
+    décalage de laby.decalages, voisins = front + décalage, filtrés par le
+    masque des cases libres et celui des cases non encore atteintes. La
+    bordure sentinelle rend ces décalages sûrs sans test de bornes et
+    empêche de passer d'un lot à l'autre. Le coût d'un niveau est
+    proportionnel au front et non à la grille: un masque dense décalé
+    (O(B·W²) par niveau) serait bien plus lent sur un labyrinthe, dont le
+    diamètre est grand et le front étroit.
+
+    Les distances sont exactement celles de distances_depuis(); s'il
+    existe plusieurs parents à distance d-1 (grille avec cycles), le
+    premier dans l'ordre de laby.decalages est retenu, qui peut différer
+    de celui d'un BFS par file.
+    """
+    if np is None:
+        raise ValueError("propagation_numpy demande numpy, qui n'est pas installé.")
+    sources = list(sources)
+    W = laby.largeur
+    n = W * W
+    B = len(sources)
+    libres = np.frombuffer(bytes(laby.grille_plate()), dtype=np.uint8) == 0
+
+    distances = np.full(B * n, -1, dtype=np.int32)
+    directions = np.full(B * n, SANS_PARENT, dtype=np.uint8)
+    depart = np.array([b * n + laby.indice(*s) for b, s in enumerate(sources)], dtype=np.int64)
+    if B:
+        distances[depart] = 0
+
+    niveaux = _propager(np.tile(libres, B), distances, directions, depart, laby.decalages)
+    return ChampsVectoriels(laby, sources, distances.reshape(B, W, W), directions.reshape(B, W, W), niveaux)
+
+
+def _propager(libres, distances, directions, front, decalages) -> int:
+    niveau = 0
+    while front.size:
+        niveau += 1
+        suivants = []
+        for k, d in enumerate(decalages):
+            voisins = front + d
+            # un même voisin ne peut venir que d'un parent par direction:
+            # pas de doublon dans 'voisins', et les directions suivantes
+            # voient déjà distances >= 0 pour les cases prises ici
+            voisins = voisins[libres[voisins] & (distances[voisins] < 0)]
+            distances[voisins] = niveau
+            directions[voisins] = k
+            suivants.append(voisins)
+        front = np.concatenate(suivants)
+    return niveau
+
+
+def _comparer(titre, laby, sources):
+    t0 = time.perf_counter()
+    champs_python = [laby.distances_depuis(s) for s in sources]
+    t1 = time.perf_counter()
+    header = f"{'Moteur':<24} {'Temps (ms)':>12} {'Niveaux':>9}"
+    print(f"\n{titre}: {len(sources)} champs de distances complets")
+    print(header)
+    print("-" * len(header))
+    print(f"{'BFS Python':<24} {(t1 - t0) * 1000.0:>12.1f} {'-':>9}")
+    t0 = time.perf_counter()
+    champs = propagation_numpy(laby, sources)
+    t1 = time.perf_counter()
+    for b, champ in enumerate(champs_python):
+        assert champs.distances[b].reshape(-1).tolist() == champ.distances.tolist()
+        # chaque direction mène à un parent à distance d-1
+        dist = champs.distances[b].reshape(-1)
+        dirs = champs.directions[b].reshape(-1)
+        atteintes = np.flatnonzero(dist > 0)
+        parents = atteintes - np.array(laby.decalages)[dirs[atteintes]]
+        assert (dist[parents] == dist[atteintes] - 1).all()
+    print(f"{'numpy (lot)':<24} {(t1 - t0) * 1000.0:>12.1f} {champs.niveaux:>9}")
+
+
+if __name__ == "__main__":
+    from PrimLabytinthe import PrimLabyrinthe
+
+    taille = 501
+    rng = random.Random(1)
+    laby = PrimLabyrinthe(taille, stockage="bytearray", seed=0)
+    laby._generer("rapide")
+    cellules = [(x, y) for x in range(1, taille, 2) for y in range(1, taille, 2)]
+    _comparer(f"Labyrinthe {taille}x{taille}", laby, rng.sample(cellules, 8))
+
+    # grille ouverte (avec cycles): front large
+    ouverte = PrimLabyrinthe(taille, stockage="bytearray")
+    for x in range(1, taille - 1):
+        d = ouverte.indice(x, 1)
+        ouverte.cellules[d:d + taille - 2] = bytes(taille - 2)
+    _comparer(f"Grille ouverte {taille}x{taille}", ouverte, rng.sample(cellules, 8))